@@ -1,6 +1,8 @@
 """
 algorithms/__init__.py
-Exposes all six search algorithm generators.
+Exposes the search algorithm generators, the snapshot helpers used to
+consume their delta snapshots, trace recording / replay, and the
+headless solve() / solve_many() entry points.
 """
 
 from .bfs           import bfs
@@ -9,5 +11,22 @@ from .ucs           import ucs
 from .dls           import dls
 from .iddfs         import iddfs
 from .bidirectional import bidirectional
+from .bidijkstra    import bidirectional_dijkstra
+from .wavefront     import wavefront_bfs
+from .astar         import astar, weighted_astar
+from .jps           import jps
+from .snapshot      import SearchState, full_snapshots, merge_snapshots
+from .solve         import solve
+from .batch         import solve_many
+from .sssp          import shortest_path_tree, clear_tree_cache
+from .cache         import ResultCache, RESULT_CACHE, cached_solve
+from .lpastar       import LPAStar
+from .hpa           import HPAStar
+from .trace         import TraceReader, TraceWriter, record
 
-__all__ = ["bfs", "dfs", "ucs", "dls", "iddfs", "bidirectional"]
\ No newline at end of file
+__all__ = ["bfs", "dfs", "ucs", "dls", "iddfs", "bidirectional", "wavefront_bfs",
+           "bidirectional_dijkstra", "astar", "weighted_astar", "jps",
+           "SearchState", "full_snapshots", "merge_snapshots", "solve",
+           "solve_many", "shortest_path_tree", "clear_tree_cache",
+           "ResultCache", "RESULT_CACHE", "cached_solve", "LPAStar",
+           "HPAStar", "TraceReader", "TraceWriter", "record"]
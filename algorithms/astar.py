@@ -0,0 +1,170 @@
+import heapq
+from array import array
+
+from grid import ADJ_STRIDE, move_distance
+
+from .snapshot import DeltaSet, positions, snapshot
+
+# Inflation factor used by weighted_astar(); paths cost at most this many
+# times the optimum, in exchange for far fewer expansions
+DEFAULT_HEURISTIC_WEIGHT = 2.0
+
+_INF = float("inf")
+
+
+def _reconstruct(parent: array, start: int, goal: int) -> list[int]:
+    path, node = [], goal
+    while node != -1:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    if path and path[0] == start:
+        return path
+    return []
+
+
+def _heuristic(grid, goal: int):
+    """
+    Admissible, consistent estimate of the remaining cost to *goal*.
+
+    move_distance() is the exact step count on an open grid for the six
+    DIRECTIONS (no Top-Right / Bottom-Left shortcut), and every step enters
+    a cell costing at least the cheapest weight on the map.
+    """
+    cols  = grid.cols
+    gr, gc = divmod(goal, cols)
+    min_w = int(grid.weights.min())
+
+    def h(i: int) -> float:
+        r, c = divmod(i, cols)
+        return move_distance(gr - r, gc - c) * min_w
+    return h
+
+
+def _astar(grid, weight: float, ids: bool):
+    cols    = grid.cols
+    out     = None if ids else cols
+    start   = grid.cell_id(*grid.start_node.pos)
+    goal    = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    h       = _heuristic(grid, goal)
+    n       = grid.rows * cols
+
+    counter     = 0
+    h0          = h(start)
+    heap        = [(weight * h0, h0, counter, start)]   # (f, h, counter, cell id)
+    parent      = array("i", [-1]) * n
+    cost_so_far = array("d", [_INF]) * n
+    cost_so_far[start] = 0
+    closed      = bytearray(n)
+    explored    = DeltaSet()
+    frontier    = DeltaSet({start})
+
+    while heap:
+        _, _, _, current = heapq.heappop(heap)
+        frontier.discard(current)
+
+        # Skip stale heap entries — node was already expanded
+        if closed[current]:
+            continue
+        closed[current] = 1
+        explored.add(current)
+
+        yield snapshot(explored, frontier, cols=out)
+
+        if current == goal:
+            path = _reconstruct(parent, start, goal)
+            yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                           path=path if ids else positions(path, cols))
+            return
+
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if closed[nb]:
+                continue
+            new_cost = cost_so_far[current] + weights[nb]
+            if new_cost < cost_so_far[nb]:
+                cost_so_far[nb] = new_cost
+                parent[nb]      = current
+                counter += 1
+                nb_h = h(nb)
+                # Ties on f go to the node closer to the goal
+                heapq.heappush(heap, (new_cost + weight * nb_h, nb_h, counter, nb))
+                frontier.add(nb)
+
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False)
+
+
+def _astar_solve(grid, start: tuple, goal: tuple, weight: float) -> tuple[list[tuple], int]:
+    cols    = grid.cols
+    start   = grid.cell_id(*start)
+    goal    = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    h       = _heuristic(grid, goal)
+    n       = grid.rows * cols
+
+    counter     = 0
+    h0          = h(start)
+    heap        = [(weight * h0, h0, counter, start)]
+    parent      = array("i", [-1]) * n
+    cost_so_far = array("d", [_INF]) * n
+    cost_so_far[start] = 0
+    closed      = bytearray(n)
+    expanded    = 0
+
+    while heap:
+        _, _, _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expanded += 1
+
+        if current == goal:
+            return positions(_reconstruct(parent, start, goal), cols), expanded
+
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if closed[nb]:
+                continue
+            new_cost = cost_so_far[current] + weights[nb]
+            if new_cost < cost_so_far[nb]:
+                cost_so_far[nb] = new_cost
+                parent[nb]      = current
+                counter += 1
+                nb_h = h(nb)
+                heapq.heappush(heap, (new_cost + weight * nb_h, nb_h, counter, nb))
+
+    return [], expanded
+
+
+def astar(grid, ids: bool = False):
+    """
+    A* Search generator — UCS guided by a 6-direction distance heuristic.
+    Optimal on weighted grids. Yields delta snapshots (see
+    algorithms/snapshot.py); ids=True reports flat cell IDs.
+    """
+    return _astar(grid, 1.0, ids)
+
+
+def weighted_astar(grid, weight: float = DEFAULT_HEURISTIC_WEIGHT, ids: bool = False):
+    """
+    Weighted A* generator: f = g + weight·h.
+
+    Expands far fewer cells than astar() on open maps; the path found costs
+    at most *weight* times the optimum (weight = 1 is plain A*).
+    """
+    return _astar(grid, weight, ids)
+
+
+def astar_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    """Headless A* mirroring astar(). Returns (path, nodes_expanded)."""
+    return _astar_solve(grid, start, goal, 1.0)
+
+
+def weighted_astar_solve(grid, start: tuple, goal: tuple,
+                         weight: float = DEFAULT_HEURISTIC_WEIGHT) -> tuple[list[tuple], int]:
+    """Headless weighted A* mirroring weighted_astar(). Returns (path, nodes_expanded)."""
+    return _astar_solve(grid, start, goal, weight)
@@ -0,0 +1,67 @@
+"""
+algorithms/batch.py
+Answer many (start, target) queries on one map across worker processes.
+
+    for result in solve_many(grid, pairs, "ucs"):
+        ...                                # same dicts as solve(), input order
+
+The grid is pickled once per worker process (pool initializer) instead of
+once per query, and every query passes its endpoints to solve() explicitly,
+so neither the caller's grid nor a worker's copy ever has its start /
+target moved.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .solve import solve
+
+_GRID = None    # the worker process's private copy of the grid
+
+
+def _init_worker(grid):
+    global _GRID
+    _GRID = grid
+    _GRID.adjacency()       # build the indexes once per worker, not per query
+    _GRID.connectivity()
+
+
+def _solve_pair(job: tuple) -> dict:
+    algo, params, (start, target) = job
+    return solve(_GRID, algo, start=start, target=target, **params)
+
+
+def solve_many(grid, pairs, algo: str, workers: int | None = None,
+               chunksize: int | None = None, **params):
+    """
+    Solve every (start, target) pair in *pairs* with *algo*.
+
+    Parameters
+    ----------
+    grid      : Grid   Map shared by every query; left untouched.
+    pairs     : iterable of ((row, col), (row, col)) endpoint pairs.
+    algo      : str    Any name accepted by solve().
+    workers   : int    Worker processes (default: os.cpu_count()).
+                       1 runs the queries in this process, without a pool.
+    chunksize : int    Queries handed to a worker at a time (default:
+                       enough for ~4 chunks per worker).
+    params    : Extra keyword arguments for the algorithm, as in solve().
+
+    Yields
+    ------
+    dict  solve() result for each pair, in input order, as soon as it and
+          every earlier result are ready.
+    """
+    pairs   = [(tuple(s), tuple(t)) for s, t in pairs]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pairs) < 2:
+        for start, target in pairs:
+            yield solve(grid, algo, start=start, target=target, **params)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(pairs) // (workers * 4))
+    jobs = [(algo, params, pair) for pair in pairs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(grid,)) as pool:
+        yield from pool.map(_solve_pair, jobs, chunksize=chunksize)
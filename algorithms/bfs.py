@@ -1,13 +1,17 @@
-
+from array import array
 from collections import deque
 
+from grid import ADJ_STRIDE
+
+from .snapshot import DeltaSet, positions, snapshot
 
-def _reconstruct(came_from: dict, start: tuple, goal: tuple) -> list[tuple]:
-    """Trace parent pointers from goal back to start."""
+
+def _reconstruct(parent: array, start: int, goal: int) -> list[int]:
+    """Trace parent pointers (cell IDs, -1 = none) from goal back to start."""
     path, node = [], goal
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = came_from.get(node)
+        node = parent[node]
     path.reverse()
     # Verify the path actually reaches start (safety check)
     if path and path[0] == start:
@@ -15,25 +19,31 @@ def _reconstruct(came_from: dict, start: tuple, goal: tuple) -> list[tuple]:
     return []
 
 
-def bfs(grid):
+def bfs(grid, ids: bool = False):
     """
     Breadth-First Search generator.
 
     Parameters
     ----------
     grid : Grid   The shared grid object (from grid.py)
+    ids  : bool   Report cells as flat IDs instead of (row, col) tuples.
 
     Yields
     ------
-    dict  Snapshot of algorithm state (see module docstring).
+    dict  Delta snapshot of algorithm state (see algorithms/snapshot.py).
     """
-    start = grid.start_node.pos
-    goal  = grid.target_node.pos
+    cols  = grid.cols
+    out   = None if ids else cols        # snapshot() converts IDs when given cols
+    start = grid.cell_id(*grid.start_node.pos)
+    goal  = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
 
-    queue     = deque([start])
-    came_from = {start: None}     # tracks parents for path reconstruction
-    explored  = set()
-    frontier  = {start}           # everything currently in the queue
+    queue    = deque([start])
+    parent   = array("i", [-1]) * (grid.rows * cols)   # tracks parents for path reconstruction
+    seen     = bytearray(grid.rows * cols)
+    seen[start] = 1
+    explored = DeltaSet()
+    frontier = DeltaSet({start})         # everything currently in the queue
 
     while queue:
         current = queue.popleft()
@@ -41,41 +51,55 @@ def bfs(grid):
         explored.add(current)
 
         # ── Yield current state so GUI draws this frame ────────────────
-        yield {
-            "frontier" : frozenset(frontier),
-            "explored" : frozenset(explored),
-            "path"     : None,
-            "done"     : False,
-            "found"    : False,
-        }
+        yield snapshot(explored, frontier, cols=out)
 
         # ── Goal test ──────────────────────────────────────────────────
         if current == goal:
-            path = _reconstruct(came_from, start, goal)
-            yield {
-                "frontier" : frozenset(frontier),
-                "explored" : frozenset(explored),
-                "path"     : path,
-                "done"     : True,
-                "found"    : True,
-            }
+            path = _reconstruct(parent, start, goal)
+            yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                           path=path if ids else positions(path, cols))
             return
 
         # ── Expand neighbours ──────────────────────────────────────────
-        r, c = current
-        node = grid.node(r, c)
-        for nb in grid.neighbours(node):
-            nb_pos = nb.pos
-            if nb_pos not in came_from:
-                came_from[nb_pos] = current
-                queue.append(nb_pos)
-                frontier.add(nb_pos)
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if not seen[nb]:
+                seen[nb]   = 1
+                parent[nb] = current
+                queue.append(nb)
+                frontier.add(nb)
 
     # ── Queue exhausted — no path ──────────────────────────────────────
-    yield {
-        "frontier" : frozenset(),
-        "explored" : frozenset(explored),
-        "path"     : [],
-        "done"     : True,
-        "found"    : False,
-    }
\ No newline at end of file
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False)
+
+
+def bfs_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    """
+    Headless BFS: same expansion order as bfs() but no snapshots.
+    Returns (path, nodes_expanded); path is [] when the goal is unreachable.
+    """
+    cols  = grid.cols
+    start = grid.cell_id(*start)
+    goal  = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+
+    queue    = deque([start])
+    parent   = array("i", [-1]) * (grid.rows * cols)
+    seen     = bytearray(grid.rows * cols)
+    seen[start] = 1
+    expanded = 0
+
+    while queue:
+        current = queue.popleft()
+        expanded += 1
+        if current == goal:
+            return positions(_reconstruct(parent, start, goal), cols), expanded
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if not seen[nb]:
+                seen[nb]   = 1
+                parent[nb] = current
+                queue.append(nb)
+
+    return [], expanded
@@ -0,0 +1,171 @@
+"""
+algorithms/bidijkstra.py
+Bidirectional Dijkstra for weighted grids.
+
+A forward Dijkstra from the start and a backward one from the goal run
+side by side, each step expanding whichever side has the smaller queue.
+Entering a cell costs its weight, so the backward search charges an edge
+u → v with weight[v] as it walks it in reverse. Every edge relaxed between
+a cell settled on one side and a cell already reached on the other is a
+complete start → goal route; mu is the cheapest seen so far. The search
+stops once top_f + top_b >= mu (the two smallest queued costs): any route
+not yet seen would have to cost at least that much.
+"""
+
+import heapq
+from array import array
+
+from grid import ADJ_STRIDE
+
+from .snapshot import DeltaSet, positions, snapshot
+
+_INF = float("inf")
+
+
+def _build_path(fwd_from: array, bwd_from: array, start: int, meet: tuple) -> list[int]:
+    """start → u via fwd_from, then v → goal via bwd_from, for the meeting edge (u, v)."""
+    u, v = meet
+    path, node = [], u
+    while node != -1:
+        path.append(node)
+        node = fwd_from[node]
+    path.reverse()
+    if not path or path[0] != start:
+        return []
+    node = v
+    while node != -1:
+        path.append(node)
+        node = bwd_from[node]
+    return path
+
+
+class _Side:
+    """One direction's Dijkstra state."""
+
+    __slots__ = ("heap", "dist", "came", "closed", "frontier", "counter")
+
+    def __init__(self, n: int, source: int):
+        self.heap     = [(0, 0, source)]          # (cost, counter, cell id)
+        self.dist     = array("d", [_INF]) * n
+        self.came     = array("i", [-1]) * n      # parent (forward) / next hop (backward)
+        self.closed   = bytearray(n)
+        self.frontier = DeltaSet({source})
+        self.counter  = 0
+        self.dist[source] = 0
+
+    def top(self) -> float:
+        """Smallest live queued cost (stale entries are dropped), or inf."""
+        heap, closed = self.heap, self.closed
+        while heap and closed[heap[0][2]]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else _INF
+
+
+class _Search:
+    """
+    Core loop shared by the generator and the headless solver. steps()
+    yields each cell as it is settled; once it is exhausted, meet holds
+    the meeting edge (u, v) of the cheapest route, or None if there is none.
+    """
+
+    def __init__(self, grid, start: int, goal: int):
+        n = grid.rows * grid.cols
+        self.grid  = grid
+        self.start = start
+        self.fwd   = _Side(n, start)
+        self.bwd   = _Side(n, goal)
+        self.mu    = _INF
+        self.meet  = None
+
+    def steps(self):
+        targets, degree = self.grid.adjacency()
+        weights  = self.grid.flat_weights()
+        fwd, bwd = self.fwd, self.bwd
+
+        while True:
+            top_f, top_b = fwd.top(), bwd.top()
+            if top_f == _INF or top_b == _INF or top_f + top_b >= self.mu:
+                return
+
+            # Expand the side with less queued work
+            forward = len(fwd.heap) <= len(bwd.heap)
+            this, other = (fwd, bwd) if forward else (bwd, fwd)
+            cost, _, current = heapq.heappop(this.heap)
+            this.frontier.discard(current)
+            this.closed[current] = 1
+
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                # Forward pays to enter nb; backward pays to enter current from nb
+                new_cost = cost + (weights[nb] if forward else weights[current])
+                if new_cost < this.dist[nb] and not this.closed[nb]:
+                    this.dist[nb] = new_cost
+                    this.came[nb] = current
+                    this.counter += 1
+                    heapq.heappush(this.heap, (new_cost, this.counter, nb))
+                    this.frontier.add(nb)
+
+                # A full route over the edge current – nb if the other side reached nb
+                total = new_cost + other.dist[nb]
+                if total < self.mu:
+                    self.mu   = total
+                    self.meet = (current, nb) if forward else (nb, current)
+
+            yield current
+
+    def path(self) -> list[int]:
+        if self.meet is None:
+            return []
+        return _build_path(self.fwd.came, self.bwd.came, self.start, self.meet)
+
+
+def bidirectional_dijkstra(grid, ids: bool = False):
+    """
+    Bidirectional Dijkstra generator — optimal on weighted grids.
+
+    Parameters
+    ----------
+    grid : Grid   Shared grid object.
+    ids  : bool   Report cells as flat IDs instead of (row, col) tuples.
+
+    Yields
+    ------
+    dict  Delta snapshot (see algorithms/snapshot.py); the backward
+          frontier is reported under the 'frontier2_*' keys.
+    """
+    cols     = grid.cols
+    out      = None if ids else cols
+    start    = grid.cell_id(*grid.start_node.pos)
+    goal     = grid.cell_id(*grid.target_node.pos)
+    search   = _Search(grid, start, goal)
+    fwd, bwd = search.fwd, search.bwd
+    explored = DeltaSet()
+
+    def _snapshot(path=None, done=False, found=False):
+        if path and not ids:
+            path = positions(path, cols)
+        return snapshot(explored, fwd.frontier, frontier2=bwd.frontier, cols=out,
+                        path=path, done=done, found=found)
+
+    if start == goal:
+        yield _snapshot(path=[start], done=True, found=True)
+        return
+
+    for current in search.steps():
+        explored.add(current)
+        yield _snapshot()
+
+    path = search.path()
+    if not path:
+        fwd.frontier.clear()
+        bwd.frontier.clear()
+    yield _snapshot(path=path, done=True, found=bool(path))
+
+
+def bidirectional_dijkstra_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    """Headless bidirectional Dijkstra mirroring bidirectional_dijkstra(). Returns (path, nodes_expanded)."""
+    if start == goal:
+        return [start], 0
+    search   = _Search(grid, grid.cell_id(*start), grid.cell_id(*goal))
+    expanded = sum(1 for _ in search.steps())
+    return positions(search.path(), grid.cols), expanded
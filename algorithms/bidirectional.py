@@ -1,20 +1,26 @@
-
+from array import array
 from collections import deque
 
+from grid import ADJ_STRIDE
+
+from .snapshot import DeltaSet, positions, snapshot
+
+MODES = ("alternate", "balanced")
 
-def _trace(came_from: dict, start: tuple, end: tuple) -> list[tuple]:
-    """Reconstruct a one-directional path using came_from pointers."""
+
+def _trace(parent: array, start: int, end: int) -> list[int]:
+    """Reconstruct a one-directional path using parent pointers (-1 = none)."""
     path, node = [], end
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = came_from.get(node)
+        node = parent[node]
     path.reverse()
     if path and path[0] == start:
         return path
     return []
 
 
-def _build_path(fwd_from, bwd_from, start, goal, meeting) -> list[tuple]:
+def _build_path(fwd_from, bwd_from, start, goal, meeting) -> list[int]:
     """
     Stitch together the two half-paths at *meeting*.
 
@@ -25,60 +31,79 @@ def _build_path(fwd_from, bwd_from, start, goal, meeting) -> list[tuple]:
     fwd_path = _trace(fwd_from, start, meeting)
 
     # Backward: meeting → goal
-    # bwd_from[meeting] is the next node toward goal; walk until None.
+    # bwd_from[meeting] is the next node toward goal; walk until -1.
     # The chain is naturally in meeting → goal order — do NOT reverse.
     bwd_path = []
-    node = bwd_from.get(meeting)
-    while node is not None:
+    node = bwd_from[meeting]
+    while node != -1:
         bwd_path.append(node)
-        node = bwd_from.get(node)
+        node = bwd_from[node]
     # FIX: removed bwd_path.reverse() — the list is already goal-ward.
 
     return fwd_path + bwd_path
 
 
-def bidirectional(grid):
+def bidirectional(grid, mode: str = "alternate", ids: bool = False):
     """
     Bidirectional BFS generator.
 
     Parameters
     ----------
     grid : Grid   Shared grid object.
+    mode : str    "alternate" — one forward, then one backward expansion.
+                  "balanced"  — expand a whole BFS layer at a time, always
+                  on the side with the smaller frontier; the first meeting
+                  is then guaranteed to give a shortest path.
+    ids  : bool   Report cells as flat IDs instead of (row, col) tuples.
 
     Yields
     ------
-    dict  Algorithm state snapshot.
+    dict  Delta snapshot (see algorithms/snapshot.py); the backward
+          frontier is reported under the 'frontier2_*' keys. 'explored'
+          holds every visited cell, so the final snapshot also carries
+          'expanded', the number of cells popped (what solve() reports).
     """
-    start = grid.start_node.pos
-    goal  = grid.target_node.pos
+    if mode not in MODES:
+        raise ValueError(f"unknown mode {mode!r}; expected one of {MODES}")
+    if mode == "balanced":
+        return _bidirectional_balanced(grid, ids)
+    return _bidirectional_alternate(grid, ids)
+
+
+def _bidirectional_alternate(grid, ids: bool):
+    cols  = grid.cols
+    out   = None if ids else cols
+    start = grid.cell_id(*grid.start_node.pos)
+    goal  = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
+    n     = grid.rows * cols
 
     # Forward BFS state
     fwd_queue   = deque([start])
-    fwd_from    = {start: None}
-    fwd_visited = {start}
+    fwd_from    = array("i", [-1]) * n
+    fwd_visited = bytearray(n)
+    fwd_visited[start] = 1
 
     # Backward BFS state
     bwd_queue   = deque([goal])
-    bwd_from    = {goal: None}
-    bwd_visited = {goal}
-
-    fwd_frontier = {start}
-    bwd_frontier = {goal}
-
-    def _snapshot(meeting=None, path=None, done=False, found=False):
-        return {
-            "frontier"     : frozenset(fwd_frontier | bwd_frontier),
-            "frontier_fwd" : frozenset(fwd_frontier),
-            "frontier_bwd" : frozenset(bwd_frontier),
-            "explored"     : frozenset(fwd_visited | bwd_visited),
-            "path"         : path,
-            "done"         : done,
-            "found"        : found,
-        }
+    bwd_from    = array("i", [-1]) * n
+    bwd_visited = bytearray(n)
+    bwd_visited[goal] = 1
+
+    fwd_frontier = DeltaSet({start})
+    bwd_frontier = DeltaSet({goal})
+    explored     = DeltaSet({start, goal})   # union of both visited sets
+    expanded     = 0                         # cells popped, as bidirectional_solve() counts
+
+    def _snapshot(path=None, done=False, found=False, **extra):
+        if path and not ids:
+            path = positions(path, cols)
+        return snapshot(explored, fwd_frontier, frontier2=bwd_frontier, cols=out,
+                        path=path, done=done, found=found, **extra)
 
     # Early exit: start == goal
     if start == goal:
-        yield _snapshot(meeting=start, path=[start], done=True, found=True)
+        yield _snapshot(path=[start], done=True, found=True, expanded=0)
         return
 
     while fwd_queue or bwd_queue:
@@ -87,22 +112,21 @@ def bidirectional(grid):
         if fwd_queue:
             current = fwd_queue.popleft()
             fwd_frontier.discard(current)
+            expanded += 1
 
-            r, c = current
-            node = grid.node(r, c)
-            for nb in grid.neighbours(node):
-                nb_pos = nb.pos
-                if nb_pos not in fwd_visited:
-                    fwd_visited.add(nb_pos)
-                    fwd_from[nb_pos] = current
-                    fwd_queue.append(nb_pos)
-                    fwd_frontier.add(nb_pos)
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not fwd_visited[nb]:
+                    fwd_visited[nb] = 1
+                    explored.add(nb)
+                    fwd_from[nb] = current
+                    fwd_queue.append(nb)
+                    fwd_frontier.add(nb)
 
                     # ── Intersection check ─────────────────────────────
-                    if nb_pos in bwd_visited:
-                        path = _build_path(fwd_from, bwd_from, start, goal, nb_pos)
-                        yield _snapshot(meeting=nb_pos, path=path,
-                                        done=True, found=True)
+                    if bwd_visited[nb]:
+                        path = _build_path(fwd_from, bwd_from, start, goal, nb)
+                        yield _snapshot(path=path, done=True, found=True, expanded=expanded)
                         return
 
             yield _snapshot()
@@ -111,25 +135,176 @@ def bidirectional(grid):
         if bwd_queue:
             current = bwd_queue.popleft()
             bwd_frontier.discard(current)
+            expanded += 1
 
-            r, c = current
-            node = grid.node(r, c)
-            for nb in grid.neighbours(node):
-                nb_pos = nb.pos
-                if nb_pos not in bwd_visited:
-                    bwd_visited.add(nb_pos)
-                    bwd_from[nb_pos] = current
-                    bwd_queue.append(nb_pos)
-                    bwd_frontier.add(nb_pos)
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not bwd_visited[nb]:
+                    bwd_visited[nb] = 1
+                    explored.add(nb)
+                    bwd_from[nb] = current
+                    bwd_queue.append(nb)
+                    bwd_frontier.add(nb)
 
                     # ── Intersection check ─────────────────────────────
-                    if nb_pos in fwd_visited:
-                        path = _build_path(fwd_from, bwd_from, start, goal, nb_pos)
-                        yield _snapshot(meeting=nb_pos, path=path,
-                                        done=True, found=True)
+                    if fwd_visited[nb]:
+                        path = _build_path(fwd_from, bwd_from, start, goal, nb)
+                        yield _snapshot(path=path, done=True, found=True, expanded=expanded)
                         return
 
             yield _snapshot()
 
     # ── Both queues exhausted — no path ────────────────────────────────
-    yield _snapshot(path=[], done=True, found=False)
\ No newline at end of file
+    yield _snapshot(path=[], done=True, found=False, expanded=expanded)
+
+
+def _bidirectional_balanced(grid, ids: bool):
+    cols  = grid.cols
+    out   = None if ids else cols
+    start = grid.cell_id(*grid.start_node.pos)
+    goal  = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
+    n     = grid.rows * cols
+
+    fwd_layer, fwd_from, fwd_visited = [start], array("i", [-1]) * n, bytearray(n)
+    bwd_layer, bwd_from, bwd_visited = [goal],  array("i", [-1]) * n, bytearray(n)
+    fwd_visited[start] = bwd_visited[goal] = 1
+
+    fwd_frontier = DeltaSet({start})
+    bwd_frontier = DeltaSet({goal})
+    explored     = DeltaSet({start, goal})
+    expanded     = 0
+
+    def _snapshot(path=None, done=False, found=False, **extra):
+        if path and not ids:
+            path = positions(path, cols)
+        return snapshot(explored, fwd_frontier, frontier2=bwd_frontier, cols=out,
+                        path=path, done=done, found=found, **extra)
+
+    if start == goal:
+        yield _snapshot(path=[start], done=True, found=True, expanded=0)
+        return
+
+    # Either side running dry means its whole component was searched without
+    # meeting the other, so there is no path
+    while fwd_layer and bwd_layer:
+        forward = len(fwd_layer) <= len(bwd_layer)
+        if forward:
+            layer, this_from, this_seen, other_seen, frontier = \
+                fwd_layer, fwd_from, fwd_visited, bwd_visited, fwd_frontier
+        else:
+            layer, this_from, this_seen, other_seen, frontier = \
+                bwd_layer, bwd_from, bwd_visited, fwd_visited, bwd_frontier
+
+        # Whole layers keep both visited sets "complete up to depth k", so
+        # the first cell seen from both sides lies on a shortest path
+        next_layer = []
+        for current in layer:
+            frontier.discard(current)
+            expanded += 1
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not this_seen[nb]:
+                    this_seen[nb] = 1
+                    explored.add(nb)
+                    this_from[nb] = current
+                    next_layer.append(nb)
+                    frontier.add(nb)
+
+                    if other_seen[nb]:
+                        path = _build_path(fwd_from, bwd_from, start, goal, nb)
+                        yield _snapshot(path=path, done=True, found=True, expanded=expanded)
+                        return
+
+            yield _snapshot()
+
+        if forward:
+            fwd_layer = next_layer
+        else:
+            bwd_layer = next_layer
+
+    fwd_frontier.clear()
+    bwd_frontier.clear()
+    yield _snapshot(path=[], done=True, found=False, expanded=expanded)
+
+
+def bidirectional_solve(grid, start: tuple, goal: tuple,
+                        mode: str = "alternate") -> tuple[list[tuple], int]:
+    """Headless bidirectional BFS mirroring bidirectional(). Returns (path, nodes_expanded)."""
+    if mode not in MODES:
+        raise ValueError(f"unknown mode {mode!r}; expected one of {MODES}")
+    if start == goal:
+        return [start], 0
+    if mode == "balanced":
+        return _balanced_solve(grid, start, goal)
+
+    cols  = grid.cols
+    start = grid.cell_id(*start)
+    goal  = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+    n     = grid.rows * cols
+
+    fwd_queue, fwd_from, fwd_visited = deque([start]), array("i", [-1]) * n, bytearray(n)
+    bwd_queue, bwd_from, bwd_visited = deque([goal]),  array("i", [-1]) * n, bytearray(n)
+    fwd_visited[start] = bwd_visited[goal] = 1
+    expanded = 0
+
+    while fwd_queue or bwd_queue:
+        for queue, this_from, this_seen, other_seen in (
+                (fwd_queue, fwd_from, fwd_visited, bwd_visited),
+                (bwd_queue, bwd_from, bwd_visited, fwd_visited)):
+            if not queue:
+                continue
+            current = queue.popleft()
+            expanded += 1
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not this_seen[nb]:
+                    this_seen[nb] = 1
+                    this_from[nb] = current
+                    queue.append(nb)
+                    if other_seen[nb]:
+                        path = _build_path(fwd_from, bwd_from, start, goal, nb)
+                        return positions(path, cols), expanded
+
+    return [], expanded
+
+
+def _balanced_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    cols  = grid.cols
+    start = grid.cell_id(*start)
+    goal  = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+    n     = grid.rows * cols
+
+    fwd_layer, fwd_from, fwd_visited = [start], array("i", [-1]) * n, bytearray(n)
+    bwd_layer, bwd_from, bwd_visited = [goal],  array("i", [-1]) * n, bytearray(n)
+    fwd_visited[start] = bwd_visited[goal] = 1
+    expanded = 0
+
+    while fwd_layer and bwd_layer:
+        forward = len(fwd_layer) <= len(bwd_layer)
+        if forward:
+            layer, this_from, this_seen, other_seen = fwd_layer, fwd_from, fwd_visited, bwd_visited
+        else:
+            layer, this_from, this_seen, other_seen = bwd_layer, bwd_from, bwd_visited, fwd_visited
+
+        next_layer = []
+        for current in layer:
+            expanded += 1
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not this_seen[nb]:
+                    this_seen[nb] = 1
+                    this_from[nb] = current
+                    next_layer.append(nb)
+                    if other_seen[nb]:
+                        path = _build_path(fwd_from, bwd_from, start, goal, nb)
+                        return positions(path, cols), expanded
+
+        if forward:
+            fwd_layer = next_layer
+        else:
+            bwd_layer = next_layer
+
+    return [], expanded
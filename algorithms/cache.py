@@ -0,0 +1,77 @@
+"""
+algorithms/cache.py
+Bounded LRU cache of solve() results, keyed by map state.
+
+    cached_solve(grid, "ucs")         # first call searches, repeats are free
+    RESULT_CACHE.info()               → {"hits", "misses", "size", "maxsize"}
+
+The key is (solver, parameters, Grid.map_version, start, target), with the
+solver looked up in SOLVERS so every alias of an algorithm shares entries.
+map_version is unique across grids and changes on every wall / obstacle /
+weight edit, so a stale or foreign result can never be returned. Endpoints
+are part of the key on their own, which lets A → B → A endpoint moves hit
+the cache instead of being spoiled by Grid.version.
+"""
+
+from collections import OrderedDict
+
+from .solve import SOLVERS, solve
+
+DEFAULT_MAXSIZE = 256
+
+
+class ResultCache:
+    """LRU mapping of search keys to solve() result dicts, with hit / miss counters."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits    = 0
+        self.misses  = 0
+        self._items: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def key(grid, algo: str, start: tuple, target: tuple, params: dict) -> tuple:
+        # Aliases ("bidir" / "bidirectional", "a*" / "astar", …) share the
+        # solver and so the entry; unknown names fall through to solve()'s error
+        name = algo.lower()
+        return (SOLVERS.get(name, name), tuple(sorted(params.items())),
+                grid.map_version, tuple(start), tuple(target))
+
+    def solve(self, grid, algo: str, start: tuple | None = None,
+              target: tuple | None = None, **params) -> dict:
+        """
+        solve() with memoisation; same arguments and result format.
+        Each call gets its own copy, so callers may mutate the result.
+        """
+        start  = tuple(start) if start is not None else grid.start_node.pos
+        target = tuple(target) if target is not None else grid.target_node.pos
+        key    = self.key(grid, algo, start, target, params)
+
+        result = self._items.get(key)
+        if result is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+        else:
+            self.misses += 1
+            result = solve(grid, algo, start=start, target=target, **params)
+            self._items[key] = result
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return dict(result, path=list(result["path"]))
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._items), "maxsize": self.maxsize}
+
+    def clear(self):
+        """Forget every result and reset the counters."""
+        self._items.clear()
+        self.hits = self.misses = 0
+
+
+RESULT_CACHE = ResultCache()
+
+
+def cached_solve(grid, algo: str, **kwargs) -> dict:
+    """solve() through the shared RESULT_CACHE."""
+    return RESULT_CACHE.solve(grid, algo, **kwargs)
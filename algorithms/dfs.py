@@ -1,20 +1,25 @@
+from array import array
+
+from grid import ADJ_STRIDE
+
+from .snapshot import DeltaSet, positions, snapshot
 
 # Cells with weight strictly greater than this are skipped by DFS
 DFS_WEIGHT_LIMIT = 7
 
 
-def _reconstruct(came_from: dict, start: tuple, goal: tuple) -> list[tuple]:
+def _reconstruct(parent: array, start: int, goal: int) -> list[int]:
     path, node = [], goal
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = came_from.get(node)
+        node = parent[node]
     path.reverse()
     if path and path[0] == start:
         return path
     return []
 
 
-def dfs(grid, weight_limit: int = DFS_WEIGHT_LIMIT):
+def dfs(grid, weight_limit: int = DFS_WEIGHT_LIMIT, ids: bool = False):
     """
     Depth-First Search generator.
 
@@ -22,68 +27,93 @@ def dfs(grid, weight_limit: int = DFS_WEIGHT_LIMIT):
     ----------
     grid         : Grid   Shared grid object.
     weight_limit : int    Cells with weight > this value are ignored.
+    ids          : bool   Report cells as flat IDs instead of (row, col) tuples.
 
     Yields
     ------
-    dict  Algorithm state snapshot.
+    dict  Delta snapshot of algorithm state (see algorithms/snapshot.py).
     """
-    start = grid.start_node.pos
-    goal  = grid.target_node.pos
+    cols    = grid.cols
+    out     = None if ids else cols
+    start   = grid.cell_id(*grid.start_node.pos)
+    goal    = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
 
-    stack     = [start]
-    came_from = {start: None}
-    explored  = set()
-    frontier  = {start}
+    stack    = [start]
+    parent   = array("i", [-1]) * (grid.rows * cols)
+    closed   = bytearray(grid.rows * cols)     # explored membership
+    explored = DeltaSet()
+    frontier = DeltaSet({start})
 
     while stack:
         current = stack.pop()
         frontier.discard(current)
 
-        if current in explored:
+        if closed[current]:
             continue
+        closed[current] = 1
         explored.add(current)
 
         # ── Yield frame ────────────────────────────────────────────────
-        yield {
-            "frontier" : frozenset(frontier),
-            "explored" : frozenset(explored),
-            "path"     : None,
-            "done"     : False,
-            "found"    : False,
-        }
+        yield snapshot(explored, frontier, cols=out)
 
         # ── Goal test ──────────────────────────────────────────────────
         if current == goal:
-            path = _reconstruct(came_from, start, goal)
-            yield {
-                "frontier" : frozenset(frontier),
-                "explored" : frozenset(explored),
-                "path"     : path,
-                "done"     : True,
-                "found"    : True,
-            }
+            path = _reconstruct(parent, start, goal)
+            yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                           path=path if ids else positions(path, cols))
             return
 
         # ── Expand: skip high-weight ("negative") cells ────────────────
-        r, c = current
-        node = grid.node(r, c)
-        for nb in grid.neighbours(node):
-            if nb.pos not in explored:
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if not closed[nb]:
                 # FIX 2: exempt the target from the weight filter so a
                 # high-weight target node is never silently skipped.
-                if nb.weight > weight_limit and nb.pos != goal:
+                if weights[nb] > weight_limit and nb != goal:
                     continue
-                # FIX 1: always overwrite came_from so the recorded parent
+                # FIX 1: always overwrite the parent so the recorded parent
                 # matches the branch that will actually be expanded (LIFO).
-                came_from[nb.pos] = current
-                stack.append(nb.pos)
-                frontier.add(nb.pos)
+                parent[nb] = current
+                stack.append(nb)
+                frontier.add(nb)
 
     # ── No path found ──────────────────────────────────────────────────
-    yield {
-        "frontier" : frozenset(),
-        "explored" : frozenset(explored),
-        "path"     : [],
-        "done"     : True,
-        "found"    : False,
-    }
\ No newline at end of file
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False)
+
+
+def dfs_solve(grid, start: tuple, goal: tuple,
+              weight_limit: int = DFS_WEIGHT_LIMIT) -> tuple[list[tuple], int]:
+    """Headless DFS mirroring dfs(). Returns (path, nodes_expanded)."""
+    cols    = grid.cols
+    start   = grid.cell_id(*start)
+    goal    = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+
+    stack    = [start]
+    parent   = array("i", [-1]) * (grid.rows * cols)
+    closed   = bytearray(grid.rows * cols)
+    expanded = 0
+
+    while stack:
+        current = stack.pop()
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expanded += 1
+
+        if current == goal:
+            return positions(_reconstruct(parent, start, goal), cols), expanded
+
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if not closed[nb]:
+                if weights[nb] > weight_limit and nb != goal:
+                    continue
+                parent[nb] = current
+                stack.append(nb)
+
+    return [], expanded
@@ -1,19 +1,24 @@
+from array import array
+
+from grid import ADJ_STRIDE
+
+from .snapshot import DeltaSet, positions, snapshot
 
 DEFAULT_DEPTH_LIMIT = 15
 
 
-def _reconstruct(came_from: dict, start: tuple, goal: tuple) -> list[tuple]:
+def _reconstruct(parent: array, start: int, goal: int) -> list[int]:
     path, node = [], goal
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = came_from.get(node)
+        node = parent[node]
     path.reverse()
     if path and path[0] == start:
         return path
     return []
 
 
-def dls(grid, depth_limit: int = DEFAULT_DEPTH_LIMIT):
+def dls(grid, depth_limit: int = DEFAULT_DEPTH_LIMIT, ids: bool = False):
     """
     Depth-Limited Search generator.
 
@@ -24,72 +29,95 @@ def dls(grid, depth_limit: int = DEFAULT_DEPTH_LIMIT):
     ----------
     grid        : Grid  Shared grid object.
     depth_limit : int   Maximum search depth (default 15).
+    ids         : bool  Report cells as flat IDs instead of (row, col) tuples.
 
     Yields
     ------
-    dict  Algorithm state snapshot including 'depth_limit' key.
+    dict  Delta snapshot (see algorithms/snapshot.py) including 'depth_limit' key.
     """
-    start = grid.start_node.pos
-    goal  = grid.target_node.pos
+    cols  = grid.cols
+    out   = None if ids else cols
+    start = grid.cell_id(*grid.start_node.pos)
+    goal  = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
 
-    # Stack entries: (position, current_depth)
-    stack     = [(start, 0)]
-    came_from = {start: None}
-    explored  = set()
-    frontier  = {start}
+    # Stack entries: (cell id, current_depth)
+    stack    = [(start, 0)]
+    parent   = array("i", [-1]) * (grid.rows * cols)
+    closed   = bytearray(grid.rows * cols)
+    explored = DeltaSet()
+    frontier = DeltaSet({start})
 
     while stack:
         current, depth = stack.pop()
         frontier.discard(current)
 
-        if current in explored:
+        if closed[current]:
             continue
+        closed[current] = 1
         explored.add(current)
 
         # ── Yield frame ────────────────────────────────────────────────
-        yield {
-            "frontier"     : frozenset(frontier),
-            "explored"     : frozenset(explored),
-            "path"         : None,
-            "done"         : False,
-            "found"        : False,
-            "depth_limit"  : depth_limit,
-            "current_depth": depth,
-        }
+        yield snapshot(explored, frontier, cols=out,
+                       depth_limit=depth_limit, current_depth=depth)
 
         # ── Goal test ──────────────────────────────────────────────────
         if current == goal:
-            path = _reconstruct(came_from, start, goal)
-            yield {
-                "frontier"     : frozenset(frontier),
-                "explored"     : frozenset(explored),
-                "path"         : path,
-                "done"         : True,
-                "found"        : True,
-                "depth_limit"  : depth_limit,
-                "current_depth": depth,
-            }
+            path = _reconstruct(parent, start, goal)
+            yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                           path=path if ids else positions(path, cols),
+                           depth_limit=depth_limit, current_depth=depth)
             return
 
         # ── Only expand if within depth limit ──────────────────────────
         if depth < depth_limit:
-            r, c = current
-            node = grid.node(r, c)
-            for nb in grid.neighbours(node):
-                if nb.pos not in explored:
-                    # FIX: always overwrite came_from so the recorded parent
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not closed[nb]:
+                    # FIX: always overwrite the parent so the recorded parent
                     # matches the branch that will actually be expanded (LIFO).
-                    came_from[nb.pos] = current
-                    stack.append((nb.pos, depth + 1))
-                    frontier.add(nb.pos)
+                    parent[nb] = current
+                    stack.append((nb, depth + 1))
+                    frontier.add(nb)
 
     # ── No path within depth limit ─────────────────────────────────────
-    yield {
-        "frontier"     : frozenset(),
-        "explored"     : frozenset(explored),
-        "path"         : [],
-        "done"         : True,
-        "found"        : False,
-        "depth_limit"  : depth_limit,
-        "current_depth": depth_limit,
-    }
\ No newline at end of file
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False,
+                   depth_limit=depth_limit, current_depth=depth_limit)
+
+
+def _dls_ids(grid, start: int, goal: int, depth_limit: int) -> tuple[list[int], int]:
+    """DLS over cell IDs without snapshots. Returns (id_path, nodes_expanded)."""
+    targets, degree = grid.adjacency()
+    n = grid.rows * grid.cols
+
+    stack    = [(start, 0)]
+    parent   = array("i", [-1]) * n
+    closed   = bytearray(n)
+    expanded = 0
+
+    while stack:
+        current, depth = stack.pop()
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expanded += 1
+
+        if current == goal:
+            return _reconstruct(parent, start, goal), expanded
+
+        if depth < depth_limit:
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                if not closed[nb]:
+                    parent[nb] = current
+                    stack.append((nb, depth + 1))
+
+    return [], expanded
+
+
+def dls_solve(grid, start: tuple, goal: tuple,
+              depth_limit: int = DEFAULT_DEPTH_LIMIT) -> tuple[list[tuple], int]:
+    """Headless DLS mirroring dls(). Returns (path, nodes_expanded)."""
+    path, expanded = _dls_ids(grid, grid.cell_id(*start), grid.cell_id(*goal), depth_limit)
+    return positions(path, grid.cols), expanded
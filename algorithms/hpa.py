@@ -0,0 +1,379 @@
+"""
+algorithms/hpa.py
+Hierarchical pathfinding (HPA*) for very large grids.
+
+    planner = HPAStar(grid, cluster_size=16)
+    planner.query()                        # or query(start, goal)
+    grid.place_wall(40, 17)                # … edits …
+    planner.query()                        # rebuilds only the touched clusters
+
+The grid is cut into cluster_size × cluster_size clusters. Along every
+border between two clusters, the open crossings are grouped into runs
+that are connected on both sides. Each run gets one transition, or one at
+each end if the run is long. The transition cells are the abstract graph's
+nodes. Within a cluster they are linked by their shortest in-cluster
+cost; across a border, by the single move between them.
+
+A query joins the start and goal to the transitions of their clusters,
+runs A* on that small graph, and then refines only the clusters on the
+abstract path back into single cells. Like all HPA* variants, paths are
+near-optimal, not guaranteed optimal. Cluster data is built on first use
+and cached. When Grid.map_version changes, the planner diffs the map and
+drops only the clusters whose cells changed, plus the links their
+neighbours hold into them.
+"""
+
+import heapq
+
+import numpy as np
+
+from grid import ADJ_STRIDE, DIRECTIONS, move_distance
+
+from .snapshot import positions
+
+DEFAULT_CLUSTER_SIZE = 16
+LONG_RUN = 6        # runs at least this long get a transition at both ends
+
+# Moves that can leave a cluster for the one right / below / below-right of it
+_FORWARD = [(0, 1), (1, 0), (1, 1)]
+
+_INF = float("inf")
+
+
+class HPAStar:
+    """
+    Two-level planner over a Grid; edit the grid freely between queries.
+
+    Parameters
+    ----------
+    grid         : Grid  Map to plan on.
+    cluster_size : int   Side length of a cluster, in cells.
+    """
+
+    def __init__(self, grid, cluster_size: int = DEFAULT_CLUSTER_SIZE):
+        if cluster_size < 2:
+            raise ValueError(f"cluster_size must be at least 2, not {cluster_size}")
+        self.grid  = grid
+        self.size  = cluster_size
+        self.crows = -(-grid.rows // cluster_size)
+        self.ccols = -(-grid.cols // cluster_size)
+        self.built = 0              # in-cluster distance tables computed so far
+
+        self._borders = {}          # (A, B) → [(u, v), …] transitions, u in A, v in B
+        self._intra   = {}          # cluster → (entrance set, {a: {b: cost}})
+        self._edges   = {}          # cluster → {entrance: [(node, cost), …]}
+
+        # The map the caches describe; refresh() diffs the grid against it
+        self._version = grid.map_version
+        self._blocked = (grid.walls | grid.dynamic).reshape(-1).copy()
+        self._weights = grid.weights.reshape(-1).copy()
+        # Memoryviews of the copies above, for fast scalar reads (updated in place)
+        self._blocked_of = memoryview(self._blocked)
+        self._w       = memoryview(self._weights)
+        self._min_w   = int(self._weights.min())    # heuristic scale, kept by refresh()
+
+    # ── Cluster geometry
+
+    def cluster_of(self, i: int) -> int:
+        r, c = divmod(i, self.grid.cols)
+        return (r // self.size) * self.ccols + c // self.size
+
+    def _bounds(self, cl: int) -> tuple:
+        cr, cc = divmod(cl, self.ccols)
+        r0, c0 = cr * self.size, cc * self.size
+        return r0, min(r0 + self.size, self.grid.rows), c0, min(c0 + self.size, self.grid.cols)
+
+    def _border_keys(self, cl: int) -> list[tuple]:
+        """Every (A, B) border cl is part of; B lies right / below / below-right of A."""
+        cr, cc = divmod(cl, self.ccols)
+        keys = []
+        for dr, dc in _FORWARD:
+            if cr + dr < self.crows and cc + dc < self.ccols:
+                keys.append((cl, cl + dr * self.ccols + dc))
+            if cr - dr >= 0 and cc - dc >= 0:
+                keys.append((cl - dr * self.ccols - dc, cl))
+        return keys
+
+    # ── Abstract graph (built lazily, cached per cluster)
+
+    def _border(self, a: int, b: int) -> list[tuple]:
+        key = (a, b)
+        if key not in self._borders:
+            self._borders[key] = self._scan_border(a, b)
+        return self._borders[key]
+
+    def _scan_border(self, a: int, b: int) -> list[tuple]:
+        cols, blocked = self.grid.cols, self._blocked_of
+        r0, r1, c0, c1 = self._bounds(a)
+        along_rows = a // self.ccols == b // self.ccols     # b is to the right: runs go down
+
+        # A's last column and last row are the only cells with a move into b
+        cells = [(r, c1 - 1) for r in range(r0, r1)] + [(r1 - 1, c) for c in range(c0, c1 - 1)]
+        cells.sort(key=lambda rc: rc[0] if along_rows else rc[1])
+
+        crossings = []
+        for r, c in cells:
+            u = r * cols + c
+            if blocked[u]:
+                continue
+            for dr, dc in _FORWARD:
+                nr, nc = r + dr, c + dc
+                if nr < self.grid.rows and nc < cols:
+                    v = nr * cols + nc
+                    if not blocked[v] and self.cluster_of(v) == b:
+                        crossings.append((u, v))
+
+        # Split into runs whose u's and v's are each chained by single moves,
+        # so any crossing in a run can be swapped for the run's transition
+        # without leaving either cluster
+        runs = []
+        for u, v in crossings:
+            if runs and self._touch(runs[-1][-1][0], u) and self._touch(runs[-1][-1][1], v):
+                runs[-1].append((u, v))
+            else:
+                runs.append([(u, v)])
+
+        transitions = []
+        for run in runs:
+            if len(run) >= LONG_RUN:
+                transitions += [run[0], run[-1]]
+            else:
+                transitions.append(run[len(run) // 2])
+        return transitions
+
+    def _touch(self, i: int, j: int) -> bool:
+        """True if cells i and j are the same cell or one move apart."""
+        if i == j:
+            return True
+        (ir, ic), (jr, jc) = divmod(i, self.grid.cols), divmod(j, self.grid.cols)
+        return (jr - ir, jc - ic) in DIRECTIONS
+
+    def _entrances(self, cl: int) -> frozenset:
+        nodes = set()
+        for a, b in self._border_keys(cl):
+            for u, v in self._border(a, b):
+                nodes.add(u if a == cl else v)
+        return frozenset(nodes)
+
+    def _intra_costs(self, cl: int) -> dict:
+        """{a: {b: cost}} between cl's entrances, reused while they stay the same."""
+        nodes  = self._entrances(cl)
+        cached = self._intra.get(cl)
+        if cached is not None and cached[0] == nodes:
+            return cached[1]
+        costs = {}
+        for a in nodes:
+            dist, _ = self._local(cl, a)
+            costs[a] = {b: dist[b] for b in nodes if b != a and b in dist}
+        self._intra[cl] = (nodes, costs)
+        self.built += 1
+        return costs
+
+    def _cluster_edges(self, cl: int) -> dict:
+        edges = self._edges.get(cl)
+        if edges is not None:
+            return edges
+        edges   = {a: list(out.items()) for a, out in self._intra_costs(cl).items()}
+        weights = self._w
+        for a, b in self._border_keys(cl):
+            for u, v in self._border(a, b):
+                if a == cl:
+                    edges[u].append((v, weights[v]))
+                else:
+                    edges[v].append((u, weights[u]))
+        self._edges[cl] = edges
+        return edges
+
+    def _local(self, cl: int, source: int, goal: int = -1) -> tuple[dict, dict]:
+        """
+        Search from *source* that never leaves cluster cl: Dijkstra to every
+        cell, or A* when a *goal* is given (stopping once it is settled).
+        Returns (dist, parent) dicts.
+        """
+        targets, degree = self.grid.adjacency()
+        weights = self._w
+        cols    = self.grid.cols
+        r0, r1, c0, c1 = self._bounds(cl)
+
+        if goal >= 0:
+            gr, gc = divmod(goal, cols)
+            min_w  = self._min_w
+        dist, parent = {source: 0}, {source: -1}
+        heap, closed = [(0, 0, source)], set()       # (priority, cost, cell id)
+        while heap:
+            _, cost, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            if current == goal:
+                break
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                r, c = divmod(nb, cols)
+                if not (r0 <= r < r1 and c0 <= c < c1):
+                    continue
+                new_cost = cost + weights[nb]
+                if new_cost < dist.get(nb, _INF):
+                    dist[nb]   = new_cost
+                    parent[nb] = current
+                    prio = new_cost if goal < 0 else new_cost + move_distance(gr - r, gc - c) * min_w
+                    heapq.heappush(heap, (prio, new_cost, nb))
+        return dist, parent
+
+    # ── Public API
+
+    def refresh(self) -> int:
+        """
+        Drop cached data for clusters whose cells changed since the last
+        call (walls, obstacles or weights). Returns the number of clusters
+        touched. query() calls this for you.
+        """
+        if self._version == self.grid.map_version:
+            return 0
+        self._version = self.grid.map_version
+        blocked = (self.grid.walls | self.grid.dynamic).reshape(-1)
+        weights = self.grid.weights.reshape(-1)
+        changed = np.flatnonzero((blocked != self._blocked) | (weights != self._weights))
+        if not changed.size:
+            return 0
+        old = self._weights[changed]
+        new = weights[changed]
+        self._blocked[changed] = blocked[changed]
+        self._weights[changed] = new
+        # Only rescan when a cell holding the minimum was raised
+        if ((old == self._min_w) & (new > old)).any():
+            self._min_w = int(self._weights.min())
+        else:
+            self._min_w = min(self._min_w, int(new.min()))
+
+        r, c    = np.divmod(changed, self.grid.cols)
+        touched = np.unique((r // self.size) * self.ccols + c // self.size).tolist()
+        for cl in touched:
+            self._intra.pop(cl, None)
+            for key in self._border_keys(cl):
+                self._borders.pop(key, None)
+                # A neighbour keeps its in-cluster costs unless its entrances moved
+                for side in key:
+                    self._edges.pop(side, None)
+        return len(touched)
+
+    def build(self) -> int:
+        """Precompute every cluster now instead of on first use; returns the cluster count."""
+        self.refresh()
+        for cl in range(self.crows * self.ccols):
+            self._cluster_edges(cl)
+        return self.crows * self.ccols
+
+    def query(self, start: tuple | None = None, goal: tuple | None = None) -> dict:
+        """
+        Plan from *start* to *goal* (default: the grid's endpoints).
+
+        Returns
+        -------
+        dict  path (list of (row, col), [] if none), cost (None if not
+              found), expanded (abstract nodes expanded), found (bool),
+              refined (clusters the path was refined through).
+        """
+        grid  = self.grid
+        start = tuple(start) if start is not None else grid.start_node.pos
+        goal  = tuple(goal) if goal is not None else grid.target_node.pos
+        self.refresh()
+
+        s, t = grid.cell_id(*start), grid.cell_id(*goal)
+        if self._blocked[s] or self._blocked[t] or not grid.connectivity().connected(s, t):
+            return _result([], None, 0, 0, grid.cols)
+        if s == t:
+            return _result([s], 0, 0, 1, grid.cols)
+
+        abstract, expanded = self._abstract_path(s, t)
+        if not abstract:
+            return _result([], None, expanded, 0, grid.cols)
+        path, refined = self._refine(abstract)
+        cost = sum(self._w[i] for i in path[1:])
+        return _result(path, cost, expanded, refined, grid.cols)
+
+    # ── Query internals
+
+    def _abstract_path(self, s: int, t: int) -> tuple[list[int], int]:
+        """A* over the transitions plus s and t; returns (node list, expanded)."""
+        weights = self._w
+        cs, ct  = self.cluster_of(s), self.cluster_of(t)
+
+        # s → its cluster's entrances (and t, if it shares the cluster)
+        dist_s, _ = self._local(cs, s)
+        from_s    = [(e, dist_s[e]) for e in self._entrances(cs) if e != s and e in dist_s]
+        if cs == ct and t in dist_s:
+            from_s.append((t, dist_s[t]))
+        # entrances → t: reverse the costs of a search out of t
+        dist_t, _ = self._local(ct, t)
+        into_t    = {e: dist_t[e] + weights[t] - weights[e]
+                     for e in self._entrances(ct) if e != t and e in dist_t}
+
+        cols   = self.grid.cols
+        tr, tc = divmod(t, cols)
+        min_w  = self._min_w
+
+        def h(i: int) -> int:
+            r, c = divmod(i, cols)
+            return move_distance(tr - r, tc - c) * min_w
+
+        counter  = 0
+        heap     = [(h(s), counter, s)]
+        g        = {s: 0}
+        parent   = {s: -1}
+        closed   = set()
+        expanded = 0
+        while heap:
+            _, _, x = heapq.heappop(heap)
+            if x in closed:
+                continue
+            closed.add(x)
+            expanded += 1
+            if x == t:
+                path = []
+                while x != -1:
+                    path.append(x)
+                    x = parent[x]
+                path.reverse()
+                return path, expanded
+
+            out = list(self._cluster_edges(self.cluster_of(x)).get(x, ()))
+            if x == s:
+                out += from_s
+            if x in into_t:
+                out.append((t, into_t[x]))
+            for y, cost in out:
+                new_cost = g[x] + cost
+                if y not in closed and new_cost < g.get(y, _INF):
+                    g[y]      = new_cost
+                    parent[y] = x
+                    counter += 1
+                    heapq.heappush(heap, (new_cost + h(y), counter, y))
+        return [], expanded
+
+    def _refine(self, abstract: list[int]) -> tuple[list[int], int]:
+        """Turn abstract hops back into cells, searching only the clusters they cross."""
+        path, refined = [abstract[0]], set()
+        for a, b in zip(abstract, abstract[1:]):
+            cl = self.cluster_of(a)
+            if cl != self.cluster_of(b):
+                path.append(b)                   # a border crossing is a single move
+                continue
+            refined.add(cl)
+            _, parent = self._local(cl, a, goal=b)
+            segment, node = [], b
+            while node != a:
+                segment.append(node)
+                node = parent[node]
+            path.extend(reversed(segment))
+        return path, len(refined)
+
+
+def _result(path: list[int], cost, expanded: int, refined: int, cols: int) -> dict:
+    return {
+        "path"    : positions(path, cols),
+        "cost"    : cost,
+        "expanded": expanded,
+        "found"   : bool(path),
+        "refined" : refined,
+    }
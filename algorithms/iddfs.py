@@ -1,111 +1,186 @@
+"""
+algorithms/iddfs.py
+Iterative Deepening DFS with a depth table carried between passes.
 
-MAX_DEPTH = 200   # safety ceiling so we never loop forever
+Every pass is a depth-limited DFS from the start, but the passes share one
+table, dist[cell] = the depth at which the cell was first reached (-1 =
+not yet). Once a pass with limit L is over, dist is exact for every cell
+within L moves, so the next pass only follows edges that go one level
+deeper (dist[nb] == depth + 1) or onto unseen cells. That makes each pass
+visit every cell at most once — at its true depth — instead of re-expanding
+it along every longer branch, and the first pass that reaches the goal
+reaches it by a shortest path. A pass that discovers no new cell means the
+reachable area is exhausted, so there is no depth cap.
+"""
 
+from array import array
 
-def _reconstruct(came_from: dict, start: tuple, goal: tuple) -> list[tuple]:
+from grid import ADJ_STRIDE
+
+from .snapshot import DeltaSet, positions, snapshot
+
+
+def _reconstruct(parent: array, start: int, goal: int) -> list[int]:
     path, node = [], goal
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = came_from.get(node)
+        node = parent[node]
     path.reverse()
     if path and path[0] == start:
         return path
     return []
 
 
-def _dls_inner(grid, start, goal, limit):
+class _Table:
+    """State shared by every deepening pass: depth table, parents, pass marks."""
+
+    __slots__ = ("dist", "parent", "mark")
+
+    def __init__(self, n: int):
+        self.dist   = array("i", [-1]) * n   # shortest depth found so far
+        self.parent = array("i", [-1]) * n
+        self.mark   = array("i", [-1]) * n   # limit of the last pass that expanded the cell
+
+
+def _pass(grid, table: _Table, start: int, goal: int, limit: int):
     """
-    Single DLS pass used internally by IDDFS.
-    Yields (frontier, explored, came_from, found) frames.
+    One depth-limited pass over the shortest-depth layers found so far.
+    Yields (explored, frontier, found, new) frames, where new counts the
+    cells first reached in this pass; the DeltaSets live for the whole pass.
     """
-    stack     = [(start, 0)]
-    came_from = {start: None}
-    explored  = set()
-    frontier  = {start}
+    targets, degree = grid.adjacency()
+    dist, parent, mark = table.dist, table.parent, table.mark
+
+    stack    = [(start, 0)]
+    explored = DeltaSet()
+    frontier = DeltaSet({start})
+    new      = 0
 
     while stack:
         current, depth = stack.pop()
         frontier.discard(current)
 
-        if current in explored:
+        if mark[current] == limit:
             continue
+        mark[current] = limit
+        if dist[current] < 0:
+            dist[current] = depth
+            new += 1
         explored.add(current)
 
-        yield frozenset(frontier), frozenset(explored), came_from, False
+        yield explored, frontier, False, new
 
         if current == goal:
-            yield frozenset(frontier), frozenset(explored), came_from, True
+            yield explored, frontier, True, new
             return
 
         if depth < limit:
-            r, c = current
-            node = grid.node(r, c)
-            for nb in grid.neighbours(node):
-                if nb.pos not in explored:
-                    # FIX: always overwrite came_from so the recorded parent
-                    # matches the branch that will actually be expanded (LIFO).
-                    came_from[nb.pos] = current
-                    stack.append((nb.pos, depth + 1))
-                    frontier.add(nb.pos)
-
-
-def iddfs(grid):
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                # Unseen cells can only be at depth == limit here
+                d = dist[nb]
+                if mark[nb] != limit and (d < 0 or d == depth + 1):
+                    # Overwrite so the parent matches the branch expanded first (LIFO)
+                    parent[nb] = current
+                    stack.append((nb, depth + 1))
+                    frontier.add(nb)
+
+
+def _pass_ids(grid, table: _Table, start: int, goal: int, limit: int) -> tuple[bool, int, int]:
+    """_pass() without snapshots. Returns (found, nodes_expanded, new_cells)."""
+    targets, degree = grid.adjacency()
+    dist, parent, mark = table.dist, table.parent, table.mark
+
+    stack    = [(start, 0)]
+    expanded = 0
+    new      = 0
+
+    while stack:
+        current, depth = stack.pop()
+        if mark[current] == limit:
+            continue
+        mark[current] = limit
+        if dist[current] < 0:
+            dist[current] = depth
+            new += 1
+        expanded += 1
+
+        if current == goal:
+            return True, expanded, new
+
+        if depth < limit:
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                d = dist[nb]
+                if mark[nb] != limit and (d < 0 or d == depth + 1):
+                    parent[nb] = current
+                    stack.append((nb, depth + 1))
+
+    return False, expanded, new
+
+
+def iddfs(grid, ids: bool = False):
     """
     Iterative Deepening DFS generator.
 
     Parameters
     ----------
     grid : Grid   Shared grid object.
+    ids  : bool   Report cells as flat IDs instead of (row, col) tuples.
 
     Yields
     ------
-    dict  Algorithm state snapshot.
+    dict  Delta snapshot (see algorithms/snapshot.py). The first frame of
+          every deepening pass carries 'reset' so consumers start afresh.
     """
-    start = grid.start_node.pos
-    goal  = grid.target_node.pos
-
-    last_explored = frozenset()   # initialised here so the exhaustion
-                                  # yield is always safe (Bug 6 fix)
-
-    for limit in range(0, MAX_DEPTH + 1):
-        last_frontier = frozenset()
+    cols  = grid.cols
+    out   = None if ids else cols
+    start = grid.cell_id(*grid.start_node.pos)
+    goal  = grid.cell_id(*grid.target_node.pos)
+    table = _Table(grid.rows * cols)
+
+    explored, frontier = DeltaSet(), DeltaSet()
+    limit = 0
+    while True:
+        first = True
+        new   = 0
+
+        for explored, frontier, goal_hit, new in _pass(grid, table, start, goal, limit):
+            yield snapshot(explored, frontier, cols=out, reset=first,
+                           iteration=limit, depth_limit=limit)
+            first = False
 
-        for frontier, explored, came_from, goal_hit in \
-                _dls_inner(grid, start, goal, limit):
+            if goal_hit:
+                path = _reconstruct(table.parent, start, goal)
+                yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                               path=path if ids else positions(path, cols),
+                               iteration=limit, depth_limit=limit)
+                return
 
-            last_frontier = frontier
-            last_explored = explored
+        if not new:
+            break
+        limit += 1
 
-            yield {
-                "frontier"   : frontier,
-                "explored"   : explored,
-                "path"       : None,
-                "done"       : False,
-                "found"      : False,
-                "iteration"  : limit,
-                "depth_limit": limit,
-            }
+    # The last pass reached nothing new: every reachable cell has been seen
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False,
+                   iteration=limit, depth_limit=limit)
 
-            if goal_hit:
-                path = _reconstruct(came_from, start, goal)
-                yield {
-                    "frontier"   : frontier,
-                    "explored"   : explored,
-                    "path"       : path,
-                    "done"       : True,
-                    "found"      : True,
-                    "iteration"  : limit,
-                    "depth_limit": limit,
-                }
-                return
 
-    # Exhausted all depth levels — no path exists within MAX_DEPTH
-    yield {
-        "frontier"   : frozenset(),
-        "explored"   : last_explored,
-        "path"       : [],
-        "done"       : True,
-        "found"      : False,
-        "iteration"  : MAX_DEPTH,
-        "depth_limit": MAX_DEPTH,
-    }
\ No newline at end of file
+def iddfs_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    """
+    Headless IDDFS mirroring iddfs(): one snapshot-free pass per limit.
+    Returns (path, nodes_expanded) with expansions summed over all passes.
+    """
+    start, goal = grid.cell_id(*start), grid.cell_id(*goal)
+    table    = _Table(grid.rows * grid.cols)
+    expanded = 0
+    limit    = 0
+    while True:
+        found, n, new = _pass_ids(grid, table, start, goal, limit)
+        expanded += n
+        if found:
+            return positions(_reconstruct(table.parent, start, goal), grid.cols), expanded
+        if not new:
+            return [], expanded
+        limit += 1
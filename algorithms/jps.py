@@ -0,0 +1,260 @@
+"""
+algorithms/jps.py
+Jump Point Search for the six-direction movement model.
+
+grid.DIRECTIONS is a hex grid in axial coordinates. Walking round the
+ring, two neighbouring directions a, b always sum to the one between
+them. So every shortest path on an open map uses at most two adjacent
+directions, and any interleaving of them is equally short. Pruning keeps
+one canonical order per pair, as JPS does for diagonal / straight moves:
+
+    primary   (Right, Down, Top-Left)      natural successors: d, d-1, d+1
+    secondary (Bottom-Right, Left, Up)     natural successor:  e
+
+Canonical paths are "primaries first, then secondaries". A secondary
+step p → x has a forced neighbour x + (e±1) when p + (e±1) is blocked,
+because the primary-first route to that cell went through p + (e±1). A
+primary step never has a forced neighbour: every other neighbour of x
+is adjacent to p, so it is cheaper to reach from p. Only cells with a
+forced neighbour, the goal, and primary-ray cells whose secondary scans
+hit one become jump points. The search A*s over those, then fills in the
+cells between consecutive jump points.
+
+The pruning assumes every open cell costs the same. On maps with mixed
+weights, jps() and jps_solve() fall back to plain A*.
+"""
+
+import heapq
+from array import array
+
+import numpy as np
+
+from grid import DIRECTIONS, move_distance
+
+from .astar    import _astar, _astar_solve
+from .snapshot import DeltaSet, positions, snapshot
+
+_INF = float("inf")
+
+# DIRECTIONS in ring order; even entries are primary, odd ones secondary
+_RING = [(0, 1), (1, 1), (1, 0), (0, -1), (-1, -1), (-1, 0)]
+assert sorted(_RING) == sorted(DIRECTIONS)
+
+_NO_DIR = len(_RING)     # came_dir of the start: expand all six ways
+
+
+class _Map:
+    """
+    The grid with a one-cell blocked border, as one flat bytearray.
+    Padded IDs step in any direction by a fixed offset with no bounds checks.
+    """
+
+    __slots__ = ("cols", "pcols", "free", "off")
+
+    def __init__(self, grid):
+        self.cols  = grid.cols
+        self.pcols = grid.cols + 2
+        self.free  = bytearray(np.pad(~(grid.walls | grid.dynamic), 1).tobytes())
+        self.off   = [dr * self.pcols + dc for dr, dc in _RING]
+
+    def pad(self, i: int) -> int:
+        r, c = divmod(i, self.cols)
+        return (r + 1) * self.pcols + c + 1
+
+    def unpad(self, p: int) -> int:
+        r, c = divmod(p, self.pcols)
+        return (r - 1) * self.cols + c - 1
+
+    def scan(self, x: int, e: int, goal: int) -> int:
+        """Jump from x along secondary direction e; -1 if the ray hits a wall."""
+        free, off = self.free, self.off
+        step = off[e]
+        s1, s2 = off[(e + 1) % 6], off[(e - 1) % 6]
+        while True:
+            x += step
+            if not free[x]:
+                return -1
+            if x == goal:
+                return x
+            p = x - step
+            if (free[x + s1] and not free[p + s1]) or (free[x + s2] and not free[p + s2]):
+                return x
+
+    def jump(self, x: int, d: int, goal: int) -> int:
+        """Next jump point from x in direction d, or -1."""
+        if d & 1:
+            return self.scan(x, d, goal)
+        free, step = self.free, self.off[d]
+        left, right = (d - 1) % 6, (d + 1) % 6
+        while True:
+            x += step
+            if not free[x]:
+                return -1
+            if x == goal or self.scan(x, left, goal) >= 0 or self.scan(x, right, goal) >= 0:
+                return x
+
+    def successors(self, x: int, d: int) -> tuple:
+        """Directions to jump in from x, having arrived by direction d."""
+        if d == _NO_DIR:
+            return range(6)
+        if not d & 1:
+            return (d, (d - 1) % 6, (d + 1) % 6)
+        free, off = self.free, self.off
+        p    = x - off[d]
+        dirs = [d]
+        for s in ((d + 1) % 6, (d - 1) % 6):
+            if free[x + off[s]] and not free[p + off[s]]:
+                dirs.append(s)
+        return dirs
+
+
+def _uniform_weight(grid) -> int:
+    """The weight every open cell shares, or 0 if they differ."""
+    w = grid.weights[~(grid.walls | grid.dynamic)]
+    if not w.size:
+        return 1
+    lo = int(w.min())
+    return lo if lo == int(w.max()) else 0
+
+
+class _Search:
+    """
+    A* over jump points, in padded IDs. steps() yields (current, opened)
+    after each expansion, opened being the jump points it pushed; once it
+    is exhausted, found says whether the goal was settled and parent
+    holds the jump-point chain.
+    """
+
+    def __init__(self, m: _Map, start: int, goal: int, w: int):
+        n = len(m.free)
+        self.m, self.start, self.goal, self.w = m, start, goal, w
+        self.parent = array("i", [-1]) * n
+        self.found  = False
+
+    def _h(self, x: int) -> int:
+        r, c   = divmod(x, self.m.pcols)
+        gr, gc = divmod(self.goal, self.m.pcols)
+        return move_distance(gr - r, gc - c) * self.w
+
+    def steps(self):
+        m, goal, w, parent = self.m, self.goal, self.w, self.parent
+        n        = len(m.free)
+        counter  = 0
+        h0       = self._h(self.start)
+        heap     = [(h0, h0, counter, self.start)]    # (f, h, counter, padded id)
+        came_dir = bytearray(n)                       # direction each jump point was reached by
+        came_dir[self.start] = _NO_DIR
+        g        = array("d", [_INF]) * n
+        g[self.start] = 0
+        closed   = bytearray(n)
+
+        while heap:
+            _, _, _, x = heapq.heappop(heap)
+            if closed[x]:
+                continue
+            closed[x] = 1
+            if x == goal:
+                self.found = True
+                yield x, ()
+                return
+
+            opened = []
+            for d in m.successors(x, came_dir[x]):
+                jp = m.jump(x, d, goal)
+                if jp < 0 or closed[jp]:
+                    continue
+                # Every step along the ray costs the same w
+                new_cost = g[x] + (jp - x) // m.off[d] * w
+                if new_cost < g[jp]:
+                    g[jp]        = new_cost
+                    parent[jp]   = x
+                    came_dir[jp] = d
+                    counter += 1
+                    jh = self._h(jp)
+                    heapq.heappush(heap, (new_cost + jh, jh, counter, jp))
+                    opened.append(jp)
+            yield x, opened
+
+    def path(self) -> list[int]:
+        if not self.found:
+            return []
+        return _expand_path(self.m, self.parent, self.start, self.goal)
+
+
+def _expand_path(m: _Map, parent: array, start: int, goal: int) -> list[int]:
+    """Jump-point chain → every cell in between, as unpadded cell IDs."""
+    points, node = [], goal
+    while node != -1:
+        points.append(node)
+        node = parent[node]
+    points.reverse()
+    if not points or points[0] != start:
+        return []
+
+    path = [m.unpad(start)]
+    for a, b in zip(points, points[1:]):
+        # Consecutive jump points lie on one ray; find its step and walk it
+        dr, dc = divmod(b, m.pcols)
+        ar, ac = divmod(a, m.pcols)
+        dr, dc = dr - ar, dc - ac
+        k      = max(abs(dr), abs(dc))
+        step   = (dr // k) * m.pcols + dc // k
+        path.extend(m.unpad(a + step * i) for i in range(1, k + 1))
+    return path
+
+
+def jps(grid, ids: bool = False):
+    """
+    Jump Point Search generator (six-direction rules, see module docstring).
+
+    Parameters
+    ----------
+    grid : Grid   Shared grid object.
+    ids  : bool   Report cells as flat IDs instead of (row, col) tuples.
+
+    Yields
+    ------
+    dict  Delta snapshot (see algorithms/snapshot.py). explored / frontier
+          hold jump points only; the final path lists every cell.
+    """
+    w = _uniform_weight(grid)
+    if not w:
+        yield from _astar(grid, 1.0, ids)
+        return
+
+    cols     = grid.cols
+    out      = None if ids else cols
+    m        = _Map(grid)
+    start    = m.pad(grid.cell_id(*grid.start_node.pos))
+    goal     = m.pad(grid.cell_id(*grid.target_node.pos))
+    explored = DeltaSet()
+    frontier = DeltaSet({m.unpad(start)})
+
+    search = _Search(m, start, goal, w)
+    for current, opened in search.steps():
+        cell = m.unpad(current)
+        frontier.discard(cell)
+        explored.add(cell)
+        for jp in opened:
+            frontier.add(m.unpad(jp))
+        yield snapshot(explored, frontier, cols=out)
+
+    path = search.path()
+    if not path:
+        frontier.clear()
+        yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False)
+        return
+    yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                   path=path if ids else positions(path, cols))
+
+
+def jps_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    """Headless JPS mirroring jps(). Returns (path, jump points expanded)."""
+    w = _uniform_weight(grid)
+    if not w:
+        return _astar_solve(grid, start, goal, 1.0)
+
+    m        = _Map(grid)
+    search   = _Search(m, m.pad(grid.cell_id(*start)), m.pad(grid.cell_id(*goal)), w)
+    expanded = sum(1 for _ in search.steps())
+    return positions(search.path(), grid.cols), expanded
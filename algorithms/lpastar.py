@@ -0,0 +1,204 @@
+"""
+algorithms/lpastar.py
+Lifelong Planning A* — incremental replanning on a changing grid.
+
+    planner = LPAStar(grid)
+    planner.replan()                  # first call: a normal A*-like search
+    grid.node(4, 7).mark_dynamic()    # … walls / obstacles / weights change …
+    planner.replan(compare=True)      # repairs only what the edit affected
+
+The planner keeps its g / rhs values and priority queue between calls. On
+each replan it diffs the grid's blocked and weight arrays against the copy
+it planned on (one vectorised compare, so every kind of edit is caught),
+re-evaluates only the changed cells and their neighbours, and resumes the
+search from there. Start and goal are fixed for the planner's lifetime.
+"""
+
+import heapq
+from array import array
+
+import numpy as np
+
+from grid import ADJ_STRIDE, move_distance
+
+from .astar    import astar_solve
+from .snapshot import positions
+
+_INF = float("inf")
+
+
+class LPAStar:
+    """
+    Incremental shortest-path planner (Koenig & Likhachev's LPA*).
+
+    Moving into a cell costs its weight, blocked cells (walls and dynamic
+    obstacles) cannot be entered, and the heuristic is the plain
+    move_distance() — admissible for any weights >= 1, so it stays
+    consistent however the weights are edited later.
+
+    Parameters
+    ----------
+    grid  : Grid    Grid to plan on; edit it freely between replan() calls.
+    start : tuple   (row, col); defaults to grid.start_node.
+    goal  : tuple   (row, col); defaults to grid.target_node.
+    """
+
+    def __init__(self, grid, start: tuple | None = None, goal: tuple | None = None):
+        self.grid  = grid
+        self.start = tuple(start) if start is not None else grid.start_node.pos
+        self.goal  = tuple(goal) if goal is not None else grid.target_node.pos
+        self._s    = grid.cell_id(*self.start)
+        self._t    = grid.cell_id(*self.goal)
+        self.plans = 0              # replan() calls so far
+
+        n = grid.rows * grid.cols
+        self.g   = array("d", [_INF]) * n
+        self.rhs = array("d", [_INF]) * n
+        self.rhs[self._s] = 0
+        self._heap = []             # (k1, k2, cell id); stale entries skipped
+        self._key  = {}             # cell id → key it is queued under
+        self._push(self._s)
+
+        # The map as last planned on; replan() diffs the grid against it
+        self._blocked = (grid.walls | grid.dynamic).reshape(-1).copy()
+        self._weights = grid.weights.reshape(-1).copy()
+
+    # ── Priority queue
+
+    def _h(self, i: int) -> int:
+        r, c   = divmod(i, self.grid.cols)
+        gr, gc = divmod(self._t, self.grid.cols)
+        return move_distance(gr - r, gc - c)
+
+    def _calc_key(self, i: int) -> tuple:
+        m = min(self.g[i], self.rhs[i])
+        return (m + self._h(i), m)
+
+    def _push(self, i: int):
+        key = self._calc_key(i)
+        self._key[i] = key
+        heapq.heappush(self._heap, (key[0], key[1], i))
+
+    def _top(self):
+        """Smallest live (k1, k2, id) entry, or None; drops stale ones on the way."""
+        heap = self._heap
+        while heap:
+            k1, k2, i = heap[0]
+            if self._key.get(i) == (k1, k2):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    # ── LPA* core
+
+    def _update(self, i: int):
+        """Recompute rhs(i) from its neighbours and requeue i if inconsistent."""
+        if i != self._s:
+            if self._blocked[i]:
+                self.rhs[i] = _INF
+            else:
+                targets, degree = self.grid.adjacency()
+                base = i * ADJ_STRIDE
+                g    = self.g
+                best = min((g[p] for p in targets[base:base + degree[i]]), default=_INF)
+                self.rhs[i] = best + self._weights[i]
+        self._key.pop(i, None)
+        if self.g[i] != self.rhs[i]:
+            self._push(i)
+
+    def _compute(self) -> int:
+        """Expand until the goal is locally consistent; returns cells expanded."""
+        targets, degree = self.grid.adjacency()
+        g, rhs, goal = self.g, self.rhs, self._t
+        expanded = 0
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            if (top[0], top[1]) >= self._calc_key(goal) and rhs[goal] == g[goal]:
+                break
+            heapq.heappop(self._heap)
+            u = top[2]
+            del self._key[u]
+            expanded += 1
+
+            base = u * ADJ_STRIDE
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]                    # over-consistent: settle it
+            else:
+                g[u] = _INF                      # under-consistent: re-derive
+                self._update(u)
+            for s in targets[base:base + degree[u]]:
+                self._update(s)
+        return expanded
+
+    def _path(self) -> list[int]:
+        """Walk from the goal to the cheapest-g neighbour until the start."""
+        if self.g[self._t] == _INF:
+            return []
+        targets, degree = self.grid.adjacency()
+        g, node = self.g, self._t
+        path = [node]
+        while node != self._s:
+            base = node * ADJ_STRIDE
+            node = min(targets[base:base + degree[node]], key=g.__getitem__)
+            path.append(node)
+        path.reverse()
+        return path
+
+    # ── Public API
+
+    def _apply_changes(self) -> int:
+        """Fold grid edits since the last plan into rhs / the queue; returns #cells changed."""
+        blocked = (self.grid.walls | self.grid.dynamic).reshape(-1)
+        weights = self.grid.weights.reshape(-1)
+        changed = np.flatnonzero((blocked != self._blocked) | (weights != self._weights))
+        if not changed.size:
+            return 0
+        self._blocked[changed] = blocked[changed]
+        self._weights[changed] = weights[changed]
+
+        # Neighbours may have routed through a changed cell or can now route
+        # through it; a cell's index row lists its walkable neighbours
+        # whether or not the cell itself is blocked
+        targets, degree = self.grid.adjacency()
+        for i in changed.tolist():
+            self._update(i)
+            base = i * ADJ_STRIDE
+            for j in targets[base:base + degree[i]]:
+                self._update(j)
+        return int(changed.size)
+
+    def replan(self, compare: bool = False) -> dict:
+        """
+        Bring the plan up to date with the grid and return the current path.
+
+        Parameters
+        ----------
+        compare : bool  Also run a from-scratch A* on the current grid and
+                        report its expansions as full_expanded.
+
+        Returns
+        -------
+        dict  path (list of (row, col), [] if none), cost (None if not
+              found), expanded (cells this repair expanded), changed (cells
+              whose wall / obstacle / weight changed since the last plan),
+              and full_expanded when compare=True.
+        """
+        changed = self._apply_changes()
+        self.plans += 1
+        if self.grid._is_blocked(*self.start):
+            expanded, path = 0, []
+        else:
+            expanded = self._compute()
+            path     = self._path()
+
+        result = {
+            "path"    : positions(path, self.grid.cols),
+            "cost"    : int(self.g[self._t]) if path else None,
+            "expanded": expanded,
+            "changed" : changed,
+        }
+        if compare:
+            result["full_expanded"] = astar_solve(self.grid, self.start, self.goal)[1]
+        return result
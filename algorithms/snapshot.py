@@ -0,0 +1,190 @@
+"""
+algorithms/snapshot.py
+Delta snapshot protocol shared by every search generator.
+
+Each yielded snapshot only carries what changed since the previous yield,
+so one step costs O(change) instead of O(explored + frontier):
+
+    explored_add  / explored_remove     cells that entered / left 'explored'
+    frontier_add  / frontier_remove     forward (or only) frontier
+    frontier2_add / frontier2_remove    backward frontier (bidirectional only)
+    reset                               True → clear accumulated state first
+    path, done, found                   as before; extra keys pass through
+
+Consumers rebuild the full picture with SearchState.apply(); callers that
+still expect full frozensets on every step can wrap a generator in
+full_snapshots(), and merge_snapshots() collapses a run of steps into one.
+
+Internally the algorithms track flat cell IDs (r * cols + c). Cells and
+paths are (row, col) tuples by default; every generator also takes
+ids=True to receive the raw IDs and skip the conversion.
+"""
+
+_TRACKED = ("explored", "frontier", "frontier2")
+_DELTA_KEYS = frozenset(
+    [f"{name}_add" for name in _TRACKED]
+    + [f"{name}_remove" for name in _TRACKED]
+    + ["reset"]
+)
+
+
+class DeltaSet:
+    """Set that remembers its net additions / removals since the last flush()."""
+
+    __slots__ = ("items", "_added", "_removed")
+
+    def __init__(self, items=()):
+        self.items    = set()
+        self._added   = set()
+        self._removed = set()
+        for x in items:
+            self.add(x)
+
+    def __contains__(self, x) -> bool:
+        return x in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def add(self, x):
+        if x in self.items:
+            return
+        self.items.add(x)
+        # Re-adding something removed this step cancels out
+        if x in self._removed:
+            self._removed.discard(x)
+        else:
+            self._added.add(x)
+
+    def discard(self, x):
+        if x not in self.items:
+            return
+        self.items.discard(x)
+        if x in self._added:
+            self._added.discard(x)
+        else:
+            self._removed.add(x)
+
+    def clear(self):
+        for x in list(self.items):
+            self.discard(x)
+
+    def flush(self) -> tuple[set, set]:
+        """Return (added, removed) since the last flush and start a new step."""
+        added, removed = self._added, self._removed
+        self._added, self._removed = set(), set()
+        return added, removed
+
+
+def positions(ids, cols: int) -> list[tuple]:
+    """Convert flat cell IDs to (row, col) tuples."""
+    return [divmod(i, cols) for i in ids]
+
+
+def snapshot(explored: DeltaSet, frontier: DeltaSet, frontier2: DeltaSet | None = None,
+             path=None, done=False, found=False, reset=False, cols: int | None = None,
+             **extra) -> dict:
+    """
+    Flush the tracked sets into one delta snapshot dict.
+    When *cols* is given the tracked cell IDs are converted to (row, col)
+    tuples; pass None to hand the IDs through unchanged.
+    """
+    tracked = [("explored", explored), ("frontier", frontier)]
+    if frontier2 is not None:
+        tracked.append(("frontier2", frontier2))
+
+    snap = {}
+    for name, delta in tracked:
+        added, removed = delta.flush()
+        if cols is not None:
+            added   = {divmod(i, cols) for i in added}
+            removed = {divmod(i, cols) for i in removed}
+        snap[f"{name}_add"], snap[f"{name}_remove"] = added, removed
+    if reset:
+        snap["reset"] = True
+    snap["path"]  = path
+    snap["done"]  = done
+    snap["found"] = found
+    snap.update(extra)
+    return snap
+
+
+class SearchState:
+    """Full explored / frontier / path state rebuilt incrementally from deltas."""
+
+    __slots__ = ("explored", "frontier", "frontier2", "path", "done", "found")
+
+    def __init__(self):
+        self.explored:  set = set()
+        self.frontier:  set = set()
+        self.frontier2: set = set()
+        self.path  = None
+        self.done  = False
+        self.found = False
+
+    def apply(self, snap: dict):
+        """Fold one delta snapshot into the accumulated state."""
+        if snap.get("reset"):
+            self.explored.clear()
+            self.frontier.clear()
+            self.frontier2.clear()
+        for name in _TRACKED:
+            target  = getattr(self, name)
+            removed = snap.get(f"{name}_remove")
+            if removed:
+                target.difference_update(removed)
+            added = snap.get(f"{name}_add")
+            if added:
+                target.update(added)
+        self.path  = snap.get("path")
+        self.done  = snap.get("done", False)
+        self.found = snap.get("found", False)
+
+
+def merge_snapshots(snaps) -> dict:
+    """
+    Collapse consecutive delta snapshots into one with the same net effect,
+    so a consumer that fell behind can apply many steps at once. Non-delta
+    keys (path, done, found, extras) come from the last snapshot.
+    """
+    merged = {}
+    for snap in snaps:
+        if snap.get("reset"):
+            # Everything before a reset is wiped anyway
+            merged = {"reset": True}
+        for name in _TRACKED:
+            added, removed = snap.get(f"{name}_add"), snap.get(f"{name}_remove")
+            if added is None and removed is None:
+                continue
+            acc_add = merged.setdefault(f"{name}_add", set())
+            acc_rem = merged.setdefault(f"{name}_remove", set())
+            if removed:
+                acc_add.difference_update(removed)
+                acc_rem.update(removed)
+            if added:
+                acc_add.update(added)
+        merged.update((k, v) for k, v in snap.items() if k not in _DELTA_KEYS)
+    return merged
+
+
+def full_snapshots(gen):
+    """
+    Adapt a delta generator to the original full-state snapshot format
+    ('frontier' / 'explored' frozensets, plus 'frontier_fwd' / 'frontier_bwd'
+    for bidirectional search). Costs O(state) per step — old callers only.
+    """
+    state = SearchState()
+    for snap in gen:
+        state.apply(snap)
+        full = {k: v for k, v in snap.items() if k not in _DELTA_KEYS}
+        full["explored"] = frozenset(state.explored)
+        if "frontier2_add" in snap:
+            full["frontier"]     = frozenset(state.frontier | state.frontier2)
+            full["frontier_fwd"] = frozenset(state.frontier)
+            full["frontier_bwd"] = frozenset(state.frontier2)
+        else:
+            full["frontier"] = frozenset(state.frontier)
+        yield full
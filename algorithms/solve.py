@@ -0,0 +1,105 @@
+"""
+algorithms/solve.py
+Headless, snapshot-free entry point for batch jobs.
+
+    solve(grid, "ucs")                  → {"path", "cost", "expanded", "found"}
+    solve(grid, "dls", depth_limit=10)
+    solve(grid, "bfs", start=(0, 0), target=(5, 9))
+    solve(grid, "ucs", tree=True)       # answer from a cached one-to-all tree
+
+Each algorithm has a *_solve twin next to its generator that follows the
+exact same expansion order, so both return the same path.
+"""
+
+from .bfs           import bfs_solve
+from .dfs           import dfs_solve
+from .ucs           import ucs_solve
+from .dls           import dls_solve
+from .iddfs         import iddfs_solve
+from .bidirectional import bidirectional_solve
+from .bidijkstra    import bidirectional_dijkstra_solve
+from .wavefront     import wavefront_solve
+from .astar         import astar_solve, weighted_astar_solve
+from .jps           import jps_solve
+from .sssp          import TREE_ALGOS, _cached_tree
+
+# Keys are lower-case; the sidebar's short labels ("BIDIR", …) resolve too
+SOLVERS = {
+    "bfs"           : bfs_solve,
+    "dfs"           : dfs_solve,
+    "ucs"           : ucs_solve,
+    "dls"           : dls_solve,
+    "iddfs"         : iddfs_solve,
+    "bidirectional" : bidirectional_solve,
+    "bidir"         : bidirectional_solve,
+    "bidijkstra"    : bidirectional_dijkstra_solve,
+    "bi-dij"        : bidirectional_dijkstra_solve,
+    "wavefront"     : wavefront_solve,
+    "wave"          : wavefront_solve,
+    "astar"         : astar_solve,
+    "a*"            : astar_solve,
+    "weighted_astar": weighted_astar_solve,
+    "wa*"           : weighted_astar_solve,
+    "jps"           : jps_solve,
+}
+
+
+def path_cost(grid, path: list[tuple]) -> int:
+    """Sum of the weights of every cell entered after the start (UCS cost model)."""
+    return sum(grid.node(r, c).weight for r, c in path[1:])
+
+
+def solve(grid, algo: str, start: tuple | None = None, target: tuple | None = None,
+          tree: bool = False, **params) -> dict:
+    """
+    Run *algo* on *grid* straight through, with no per-step snapshots.
+
+    Parameters
+    ----------
+    grid   : Grid   Shared grid object.
+    algo   : str    Algorithm name, e.g. "bfs" or "BIDIR" (case-insensitive).
+    start  : tuple  (row, col) to search from; defaults to grid.start_node.
+    target : tuple  (row, col) to search for; defaults to grid.target_node.
+                    Passing endpoints never touches the grid's own ones.
+    tree   : bool   "bfs" / "ucs" only: answer from a one-to-all tree rooted
+                    at start (see algorithms/sssp.py), built once and cached
+                    until the map changes. expanded is 0 on a cache hit.
+    params : Extra keyword arguments for the algorithm
+             (weight_limit for DFS, depth_limit for DLS, weight for
+             weighted A*, queue for UCS, mode for bidirectional).
+
+    Returns
+    -------
+    dict  path (list of (row, col), [] if none), cost (None if not found),
+          expanded (nodes expanded), found (bool).
+    """
+    try:
+        solver = SOLVERS[algo.lower()]
+    except KeyError:
+        raise ValueError(f"unknown algorithm {algo!r}; "
+                         f"expected one of {sorted(SOLVERS)}") from None
+    if tree and algo.lower() not in TREE_ALGOS:
+        raise ValueError(f"tree=True needs one of {TREE_ALGOS}, not {algo!r}")
+
+    start = tuple(start) if start is not None else grid.start_node.pos
+    goal  = tuple(target) if target is not None else grid.target_node.pos
+    for r, c in (start, goal):
+        if not grid._in_bounds(r, c):
+            raise ValueError(f"endpoint {(r, c)} is outside the {grid.rows}×{grid.cols} grid")
+
+    # A walled-in endpoint can't be reached; don't let the search leave it
+    # either. Endpoints in different components are rejected without searching.
+    if grid._is_blocked(*start) or grid._is_blocked(*goal) or not grid.connected(start, goal):
+        path, expanded = [], 0
+    elif tree:
+        spt, built = _cached_tree(grid, start, algo.lower())
+        path, expanded = spt.path_to(goal), spt.expanded if built else 0
+    else:
+        path, expanded = solver(grid, start, goal, **params)
+    found = bool(path)
+    return {
+        "path"    : path,
+        "cost"    : path_cost(grid, path) if found else None,
+        "expanded": expanded,
+        "found"   : found,
+    }
@@ -0,0 +1,161 @@
+"""
+algorithms/sssp.py
+One-to-all shortest-path trees, cached per grid and source.
+
+    tree = shortest_path_tree(grid, (10, 3), "ucs")
+    tree.path_to((5, 20)), tree.cost_to((5, 20))
+
+A tree holds the full distance and parent field from one source, so when
+only the target moves each query is a parent-pointer walk instead of a new
+search. Trees are cached against Grid.map_version — any wall, obstacle or
+weight edit makes them stale and the next request rebuilds.
+"""
+
+import weakref
+from array import array
+from collections import deque
+
+from grid import ADJ_STRIDE
+
+from .snapshot import positions
+from .ucs      import _BucketQueue
+
+TREE_ALGOS = ("bfs", "ucs")
+MAX_TREES  = 8       # cached sources per grid; the oldest is dropped first
+
+_CACHE = weakref.WeakKeyDictionary()     # grid → {(source, algo): ShortestPathTree}
+
+
+class ShortestPathTree:
+    """
+    Distance / parent field from one source to every reachable cell.
+
+    dist is in BFS steps for "bfs" and in summed weights for "ucs" (-1 =
+    unreachable). Parents follow the same expansion order as bfs() / ucs(),
+    so path_to() returns exactly the path those searches would find.
+    """
+
+    __slots__ = ("source", "algo", "cols", "map_version", "dist", "parent", "expanded")
+
+    def __init__(self, grid, source: tuple, algo: str):
+        if algo not in TREE_ALGOS:
+            raise ValueError(f"unknown tree algorithm {algo!r}; expected one of {TREE_ALGOS}")
+        self.source      = source
+        self.algo        = algo
+        self.cols        = grid.cols
+        self.map_version = grid.map_version
+        build = _bfs_tree if algo == "bfs" else _ucs_tree
+        if grid._is_blocked(*source):
+            # A walled-in source reaches nothing, not even its open neighbours
+            build = _isolated
+        self.dist, self.parent, self.expanded = build(grid, grid.cell_id(*source))
+
+    def reaches(self, target: tuple) -> bool:
+        return self.dist[target[0] * self.cols + target[1]] >= 0
+
+    def cost_to(self, target: tuple) -> int | None:
+        """Distance from the source, or None if *target* is unreachable."""
+        d = self.dist[target[0] * self.cols + target[1]]
+        return d if d >= 0 else None
+
+    def path_to(self, target: tuple) -> list[tuple]:
+        """Source → target path as (row, col) tuples; [] if unreachable."""
+        node = target[0] * self.cols + target[1]
+        if self.dist[node] < 0:
+            return []
+        path = []
+        while node != -1:
+            path.append(node)
+            node = self.parent[node]
+        path.reverse()
+        return positions(path, self.cols)
+
+
+def _isolated(grid, source: int):
+    n    = grid.rows * grid.cols
+    dist = array("q", [-1]) * n
+    dist[source] = 0
+    return dist, array("i", [-1]) * n, 0
+
+
+def _bfs_tree(grid, source: int):
+    targets, degree = grid.adjacency()
+    n        = grid.rows * grid.cols
+    dist     = array("q", [-1]) * n
+    parent   = array("i", [-1]) * n
+    dist[source] = 0
+    queue    = deque([source])
+    expanded = 0
+
+    while queue:
+        current = queue.popleft()
+        expanded += 1
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            if dist[nb] < 0:
+                dist[nb]   = dist[current] + 1
+                parent[nb] = current
+                queue.append(nb)
+    return dist, parent, expanded
+
+
+def _ucs_tree(grid, source: int):
+    """Dijkstra to exhaustion on the bucket queue (same order as ucs())."""
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    n       = grid.rows * grid.cols
+    dist    = array("q", [-1]) * n
+    parent  = array("i", [-1]) * n
+    dist[source] = 0
+    buckets  = _BucketQueue(int(grid.weights.max()))
+    buckets.push(source, 0)
+    expanded = 0
+
+    while buckets.size:
+        cost, nodes = buckets.take_next()
+        for current in nodes:
+            expanded += 1
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                new_cost = cost + weights[nb]
+                old      = dist[nb]
+                if old < 0 or new_cost < old:
+                    dist[nb]   = new_cost
+                    parent[nb] = current
+                    buckets.push(nb, new_cost, old)
+    return dist, parent, expanded
+
+
+def _cached_tree(grid, source: tuple, algo: str) -> tuple[ShortestPathTree, bool]:
+    """Return (tree, built) — built is False when a fresh cached tree was reused."""
+    trees = _CACHE.setdefault(grid, {})
+    key   = (tuple(source), algo)
+    tree  = trees.get(key)
+    if tree is not None and tree.map_version == grid.map_version:
+        return tree, False
+    if tree is None and len(trees) >= MAX_TREES:
+        del trees[next(iter(trees))]
+    tree = trees[key] = ShortestPathTree(grid, key[0], algo)
+    return tree, True
+
+
+def shortest_path_tree(grid, source: tuple | None = None, algo: str = "ucs") -> ShortestPathTree:
+    """
+    Cached one-to-all tree from *source* (default: grid.start_node).
+
+    Parameters
+    ----------
+    grid   : Grid   Map to search; edits to it invalidate the cache.
+    source : tuple  (row, col) root of the tree.
+    algo   : str    "bfs" (fewest moves) or "ucs" (lowest weight sum).
+    """
+    source = tuple(source) if source is not None else grid.start_node.pos
+    return _cached_tree(grid, source, algo.lower())[0]
+
+
+def clear_tree_cache(grid=None):
+    """Drop cached trees for *grid*, or for every grid when None."""
+    if grid is None:
+        _CACHE.clear()
+    else:
+        _CACHE.pop(grid, None)
@@ -0,0 +1,363 @@
+"""
+algorithms/trace.py
+Compressed search traces: record any generator's delta snapshots, replay them later.
+
+    gen = record(astar(grid), "run.ogtr", grid, label="A*")
+    for snap in gen: ...                      # snapshots pass through unchanged
+
+    trace = TraceReader("run.ogtr")
+    trace.grid()                              # the map the search ran on
+    for snap in trace.frames(): ...           # the same deltas, no algorithm needed
+    trace.seek(5000)                          # reset snapshot: the state after step 5000
+
+File layout (little-endian):
+
+    header   magic b"OGTR", uint16 version, uint16 flags, uint32 rows,
+             uint32 cols, uint32 keyframe interval, uint32 label bytes, uint32 map bytes,
+             then the UTF-8 label and the zlib-compressed map file
+             (mapfile.map_bytes) of the grid at recording time
+    chunks   uint32 first step, uint32 payload bytes, zlib payload
+    index    (uint64 offset, uint32 first step) per chunk
+    footer   uint64 index offset, uint32 step count, magic b"OGTE"
+
+A chunk's payload opens with a keyframe, the full state as of its first
+step, written as one reset record, followed by plain deltas. A chunk is
+closed after at least keyframe-interval steps, and only once its deltas
+hold as many cells as its keyframe. Keyframes of a large state are then
+rare enough that writing them costs no more than the deltas themselves.
+Each chunk is compressed on its own, so seeking to step n means
+decompressing one chunk and applying at most about a keyframe's worth
+of deltas. Records hold flat cell IDs; the unordered sets are
+stored sorted and gap-encoded, which zlib shrinks well. Chunks are
+written while the search runs. A trace whose footer is missing, e.g.
+because the process died mid-run, is read by walking the chunks instead.
+
+Only the tracked sets, path, done, found and reset are recorded; extra
+snapshot keys are dropped.
+"""
+
+import struct
+import zlib
+from bisect import bisect_right
+from itertools import accumulate
+
+from mapfile import map_bytes, map_from_bytes
+
+from .snapshot import SearchState, merge_snapshots, positions
+
+MAGIC          = b"OGTR"
+END_MAGIC      = b"OGTE"
+FORMAT_VERSION = 1
+KEYFRAME_EVERY = 256         # minimum steps between keyframes
+DEFAULT_PATH   = "trace.ogtr"
+
+_HEADER = struct.Struct("<4sHHIIIII")
+_CHUNK  = struct.Struct("<II")
+_INDEX  = struct.Struct("<QI")
+_FOOTER = struct.Struct("<QI4s")
+_COUNT  = struct.Struct("<I")
+
+# Record flag bits
+_RESET, _DONE, _FOUND, _PATH, _TWO = 1, 2, 4, 8, 16
+
+_SETS = ("explored_add", "explored_remove", "frontier_add", "frontier_remove")
+_SETS2 = ("frontier2_add", "frontier2_remove")
+
+
+# ── Record encoding
+
+def _cell_ids(cells, cols: int) -> list[int]:
+    """A snapshot collection, (row, col) tuples or IDs, as a list of IDs."""
+    if not cells:
+        return []
+    if isinstance(next(iter(cells)), tuple):
+        return [r * cols + c for r, c in cells]
+    return list(cells)
+
+
+def _pack(values: list[int]) -> bytes:
+    return struct.pack(f"<I{len(values)}I", len(values), *values)
+
+
+def _encode(snap: dict) -> bytes:
+    """One record from a snapshot whose cells are already IDs."""
+    two   = "frontier2_add" in snap or "frontier2_remove" in snap
+    path  = snap.get("path")
+    flags = ((_RESET if snap.get("reset") else 0) | (_DONE if snap.get("done") else 0)
+             | (_FOUND if snap.get("found") else 0) | (_PATH if path is not None else 0)
+             | (_TWO if two else 0))
+    parts = [bytes([flags])]
+    for key in _SETS + _SETS2 if two else _SETS:
+        ids = sorted(snap.get(key) or ())
+        parts.append(_pack([b - a for a, b in zip([0] + ids, ids)]))
+    if path is not None:
+        parts.append(_pack(path))
+    return b"".join(parts)
+
+
+def _read_ids(payload: bytes, pos: int) -> tuple[tuple, int]:
+    (n,) = _COUNT.unpack_from(payload, pos)
+    return struct.unpack_from(f"<{n}I", payload, pos + 4), pos + 4 + 4 * n
+
+
+def _decode_all(payload: bytes) -> list[dict]:
+    """Every record in a chunk payload, as snapshots of cell IDs."""
+    records, pos = [], 0
+    while pos < len(payload):
+        flags = payload[pos]
+        pos  += 1
+        snap  = {}
+        for key in _SETS + _SETS2 if flags & _TWO else _SETS:
+            gaps, pos = _read_ids(payload, pos)
+            snap[key] = set(accumulate(gaps))
+        if flags & _RESET:
+            snap["reset"] = True
+        path = None
+        if flags & _PATH:
+            path, pos = _read_ids(payload, pos)
+            path = list(path)
+        snap["path"]  = path
+        snap["done"]  = bool(flags & _DONE)
+        snap["found"] = bool(flags & _FOUND)
+        records.append(snap)
+    return records
+
+
+def _cells(snap: dict) -> int:
+    n = sum(len(snap[key]) for key in _SETS + _SETS2 if snap.get(key))
+    return n + len(snap["path"] or ())
+
+
+def _as_positions(snap: dict, cols: int) -> dict:
+    out = dict(snap)
+    for key in _SETS + _SETS2:
+        if key in out:
+            out[key] = {divmod(i, cols) for i in out[key]}
+    if out.get("path") is not None:
+        out["path"] = positions(out["path"], cols)
+    return out
+
+
+# ── Writing
+
+class TraceWriter:
+    """
+    Streams snapshots to a trace file, one compressed chunk per keyframe
+    (see the module docstring for when a new one starts). Call close()
+    (or use record()) to write the index.
+    """
+
+    def __init__(self, path: str, grid, label: str = "", keyframe_every: int = KEYFRAME_EVERY):
+        if keyframe_every < 1:
+            raise ValueError("keyframe_every must be at least 1")
+        self.cols  = grid.cols
+        self.steps = 0
+        self.keyframe_every = keyframe_every
+        self._state   = SearchState()       # in cell IDs, for keyframes
+        self._two     = False               # seen a frontier2 key yet
+        self._index   = []                  # (offset, first step) per chunk
+        self._pending = 0                   # deltas in the open chunk
+        self._budget  = 0                   # cells those deltas must reach first
+
+        name = label.encode()
+        blob = zlib.compress(map_bytes(grid))
+        self._f = open(path, "wb")
+        self._f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, grid.rows, grid.cols,
+                                   keyframe_every, len(name), len(blob)))
+        self._f.write(name)
+        self._f.write(blob)
+        self._open_chunk()
+
+    def _keyframe(self) -> dict:
+        state = self._state
+        snap  = {"reset": True, "explored_add": state.explored, "frontier_add": state.frontier,
+                 "path": state.path, "done": state.done, "found": state.found}
+        if self._two:
+            snap["frontier2_add"] = state.frontier2
+        return snap
+
+    def _open_chunk(self):
+        self._first   = self.steps
+        keyframe      = self._keyframe()
+        self._buf     = [_encode(keyframe)]
+        self._pending = 0
+        self._budget  = _cells(keyframe)
+
+    def _flush(self):
+        payload = zlib.compress(b"".join(self._buf))
+        self._index.append((self._f.tell(), self._first))
+        self._f.write(_CHUNK.pack(self._first, len(payload)))
+        self._f.write(payload)
+        self._f.flush()
+
+    def write(self, snap: dict):
+        """Append one delta snapshot (cells as (row, col) tuples or IDs)."""
+        cols = self.cols
+        ids  = {key: set(_cell_ids(snap[key], cols)) for key in _SETS + _SETS2 if key in snap}
+        self._two = self._two or "frontier2_add" in ids
+        path = snap.get("path")
+        ids.update(reset=snap.get("reset", False), done=snap.get("done", False),
+                   found=snap.get("found", False),
+                   path=None if path is None else _cell_ids(path, cols))
+        self._state.apply(ids)
+        self._buf.append(_encode(ids))
+        self.steps    += 1
+        self._pending += 1
+        self._budget  -= _cells(ids)
+        if self._pending >= self.keyframe_every and self._budget <= 0:
+            self._flush()
+            self._open_chunk()
+
+    def close(self):
+        """Write the last chunk, the index and the footer."""
+        if self._f.closed:
+            return
+        if self._pending or not self._index:
+            self._flush()
+        offset = self._f.tell()
+        for entry in self._index:
+            self._f.write(_INDEX.pack(*entry))
+        self._f.write(_FOOTER.pack(offset, self.steps, END_MAGIC))
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record(gen, path: str, grid, label: str = "", keyframe_every: int = KEYFRAME_EVERY):
+    """
+    Pass a search generator's snapshots through unchanged while writing them to a trace.
+
+    Parameters
+    ----------
+    gen            : generator  Any delta-snapshot generator from algorithms/.
+    path           : str        Trace file to write.
+    grid           : Grid       The grid gen searches; its map is stored in the trace.
+    label          : str        Free-form name, e.g. the algorithm.
+    keyframe_every : int        Minimum steps between keyframes.
+
+    Yields
+    ------
+    dict  gen's snapshots. The trace is finalised when gen is exhausted or
+          the wrapper is closed, so a cancelled run still leaves a readable file.
+    """
+    with TraceWriter(path, grid, label, keyframe_every) as writer:
+        try:
+            for snap in gen:
+                writer.write(snap)
+                yield snap
+        finally:
+            gen.close()
+
+
+# ── Reading
+
+class TraceReader:
+    """
+    Random access to a trace file. len() is the number of recorded steps;
+    step n means "after the n-th snapshot", so seek(0) is the empty start.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path}: too short for a trace header")
+        magic, version, _flags, rows, cols, every, n_label, n_map = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a trace file (magic {magic!r})")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported trace format version {version}")
+
+        pos = _HEADER.size
+        self.rows, self.cols = rows, cols
+        self.keyframe_every  = every
+        self.label = data[pos:pos + n_label].decode()
+        pos += n_label
+        self._map = zlib.decompress(data[pos:pos + n_map])
+        pos += n_map
+        self._data   = data
+        self._cached = (-1, None)           # (chunk number, decoded records)
+
+        index, self.steps = self._read_index(pos)
+        self._offsets = [off for off, _ in index]
+        self._firsts  = [first for _, first in index]
+
+    def _read_index(self, chunks_at: int) -> tuple[list, int]:
+        data = self._data
+        if len(data) >= chunks_at + _FOOTER.size:
+            offset, steps, magic = _FOOTER.unpack_from(data, len(data) - _FOOTER.size)
+            if magic == END_MAGIC:
+                n = (len(data) - _FOOTER.size - offset) // _INDEX.size
+                return [_INDEX.unpack_from(data, offset + k * _INDEX.size)
+                        for k in range(n)], steps
+
+        # No footer: walk the complete chunks and count the last one's records
+        index, pos, steps = [], chunks_at, 0
+        while pos + _CHUNK.size <= len(data):
+            first, size = _CHUNK.unpack_from(data, pos)
+            if pos + _CHUNK.size + size > len(data):
+                break
+            index.append((pos, first))
+            pos += _CHUNK.size + size
+        if not index:
+            raise ValueError(f"{self.path}: no complete chunks")
+        self._offsets = [off for off, _ in index]
+        steps = index[-1][1] + len(self._records(len(index) - 1)) - 1
+        return index, steps
+
+    def __len__(self) -> int:
+        return self.steps
+
+    def grid(self, into=None):
+        """The recorded map as a new Grid, or loaded into a Grid of the same size."""
+        return map_from_bytes(self._map, into)
+
+    def _records(self, k: int) -> list[dict]:
+        """Decoded records of chunk k: its keyframe, then its deltas."""
+        if self._cached[0] != k:
+            _, size = _CHUNK.unpack_from(self._data, self._offsets[k])
+            start   = self._offsets[k] + _CHUNK.size
+            self._cached = (k, _decode_all(zlib.decompress(self._data[start:start + size])))
+        return self._cached[1]
+
+    def _chunk_of(self, n: int) -> int:
+        return bisect_right(self._firsts, n) - 1
+
+    def seek(self, n: int, ids: bool = False) -> dict:
+        """
+        One reset snapshot holding the full state after step n (0 ≤ n ≤ len).
+        Apply it in place of everything before, then continue with frames(n).
+        """
+        if not 0 <= n <= self.steps:
+            raise IndexError(f"step {n} outside 0..{self.steps}")
+        k    = self._chunk_of(n)
+        snap = merge_snapshots(self._records(k)[:n - self._firsts[k] + 1])
+        return snap if ids else _as_positions(snap, self.cols)
+
+    def state_at(self, n: int) -> SearchState:
+        """The SearchState after step n, in (row, col) tuples."""
+        state = SearchState()
+        state.apply(self.seek(n))
+        return state
+
+    def frames(self, start: int = 0, ids: bool = False):
+        """
+        Replay the recorded deltas from step start + 1 to the end, in the
+        same format a search generator yields.
+        """
+        n = start + 1
+        while n <= self.steps:
+            k       = self._chunk_of(n - 1)
+            records = self._records(k)
+            first   = self._firsts[k]
+            end     = min(self.steps, first + len(records) - 1)
+            for step in range(n, end + 1):
+                snap = records[step - first]
+                yield snap if ids else _as_positions(snap, self.cols)
+            n = end + 1
+
@@ -1,79 +1,256 @@
 import heapq
+from array import array
 
+from grid import ADJ_STRIDE
 
-def _reconstruct(came_from: dict, start: tuple, goal: tuple) -> list[tuple]:
+from .snapshot import DeltaSet, positions, snapshot
+
+_INF = float("inf")
+
+QUEUES = ("heap", "bucket")
+
+
+class _BucketQueue:
+    """
+    Dial's circular bucket queue for integer costs.
+
+    Every step adds between 1 and max_step to a cost, so live entries always
+    span fewer than max_step + 1 consecutive costs and one slot per residue
+    is enough. Each slot is an insertion-ordered dict, so decrease-key is an
+    O(1) delete + insert, no stale entries pile up, and ties pop in the same
+    order as the heap's push counter.
+    """
+
+    __slots__ = ("slots", "size", "cost")
+
+    def __init__(self, max_step: int):
+        self.slots = [{} for _ in range(max_step + 1)]
+        self.size  = 0
+        self.cost  = 0     # lowest cost that may still hold entries
+
+    def push(self, node: int, cost: int, old: int = -1):
+        """Insert *node* at *cost*, first removing its entry at *old* (if >= 0)."""
+        slots = self.slots
+        if old >= 0:
+            del slots[old % len(slots)][node]
+            self.size -= 1
+        slots[cost % len(slots)][node] = None
+        self.size += 1
+
+    def take_next(self) -> tuple[int, dict]:
+        """
+        Detach the cheapest non-empty bucket and return (cost, nodes).
+        Safe to iterate while pushing: new costs are always higher.
+        """
+        slots = self.slots
+        while not slots[self.cost % len(slots)]:
+            self.cost += 1
+        i = self.cost % len(slots)
+        nodes, slots[i] = slots[i], {}
+        self.size -= len(nodes)
+        self.cost += 1
+        return self.cost - 1, nodes
+
+
+def _reconstruct(parent: array, start: int, goal: int) -> list[int]:
     path, node = [], goal
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = came_from.get(node)
+        node = parent[node]
     path.reverse()
     if path and path[0] == start:
         return path
     return []
 
 
-def ucs(grid):
+def ucs(grid, queue: str = "heap", ids: bool = False):
     """
     Uniform-Cost Search — expands the lowest cumulative cost node first.
     Finds the optimal path when cells have different weights.
-    Yields state snapshots: frontier, explored, path, done, found.
+    Yields delta snapshots (see algorithms/snapshot.py); ids=True reports
+    cells as flat IDs instead of (row, col) tuples.
+
+    queue selects the priority queue: "heap" (heapq + tie-break counter)
+    or "bucket" (Dial's algorithm — O(1) push / pop for the integer
+    weights 1–10). Both expand cells in exactly the same order.
     """
-    start = grid.start_node.pos
-    goal  = grid.target_node.pos
+    if queue not in QUEUES:
+        raise ValueError(f"unknown queue {queue!r}; expected one of {QUEUES}")
+    if queue == "bucket":
+        return _ucs_bucket(grid, ids)
+    return _ucs_heap(grid, ids)
 
-    counter     = 0                      # tie-breaker so heapq never compares Node objects
-    heap        = [(0, counter, start)]  # (cost, counter, pos)
-    came_from   = {start: None}
-    cost_so_far = {start: 0}
-    explored    = set()
-    frontier    = {start}
+
+def _ucs_heap(grid, ids: bool):
+    cols    = grid.cols
+    out     = None if ids else cols
+    start   = grid.cell_id(*grid.start_node.pos)
+    goal    = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    n       = grid.rows * cols
+
+    counter     = 0                      # tie-breaker so equal costs pop in push order
+    heap        = [(0, counter, start)]  # (cost, counter, cell id)
+    parent      = array("i", [-1]) * n
+    cost_so_far = array("d", [_INF]) * n
+    cost_so_far[start] = 0
+    closed      = bytearray(n)
+    explored    = DeltaSet()
+    frontier    = DeltaSet({start})
 
     while heap:
         cost, _, current = heapq.heappop(heap)
         frontier.discard(current)
 
         # Skip stale heap entries — node was already expanded at a lower cost
-        if current in explored:
+        if closed[current]:
             continue
+        closed[current] = 1
         explored.add(current)
 
-        yield {
-            "frontier" : frozenset(frontier),
-            "explored" : frozenset(explored),
-            "path"     : None,
-            "done"     : False,
-            "found"    : False,
-        }
+        yield snapshot(explored, frontier, cols=out)
 
         if current == goal:
-            path = _reconstruct(came_from, start, goal)
-            yield {
-                "frontier" : frozenset(frontier),
-                "explored" : frozenset(explored),
-                "path"     : path,
-                "done"     : True,
-                "found"    : True,
-            }
+            path = _reconstruct(parent, start, goal)
+            yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                           path=path if ids else positions(path, cols))
             return
 
-        r, c = current
-        node = grid.node(r, c)
-        for nb in grid.neighbours(node):
-            nb_pos   = nb.pos
-            new_cost = cost_so_far[current] + nb.weight
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            new_cost = cost_so_far[current] + weights[nb]
 
             # Relaxation: only push if we found a cheaper route to this neighbour
-            if nb_pos not in cost_so_far or new_cost < cost_so_far[nb_pos]:
-                cost_so_far[nb_pos] = new_cost
-                came_from[nb_pos]   = current
+            if new_cost < cost_so_far[nb]:
+                cost_so_far[nb] = new_cost
+                parent[nb]      = current
                 counter += 1
-                heapq.heappush(heap, (new_cost, counter, nb_pos))
-                frontier.add(nb_pos)
-
-    yield {
-        "frontier" : frozenset(),
-        "explored" : frozenset(explored),
-        "path"     : [],
-        "done"     : True,
-        "found"    : False,
-    }
\ No newline at end of file
+                heapq.heappush(heap, (new_cost, counter, nb))
+                frontier.add(nb)
+
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False)
+
+
+def _ucs_bucket(grid, ids: bool):
+    cols    = grid.cols
+    out     = None if ids else cols
+    start   = grid.cell_id(*grid.start_node.pos)
+    goal    = grid.cell_id(*grid.target_node.pos)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    n       = grid.rows * cols
+
+    buckets     = _BucketQueue(int(grid.weights.max()))
+    buckets.push(start, 0)
+    parent      = array("i", [-1]) * n
+    cost_so_far = array("q", [-1]) * n      # -1 = not reached yet
+    cost_so_far[start] = 0
+    explored    = DeltaSet()
+    frontier    = DeltaSet({start})
+
+    # Every entry in a bucket is final (no stale copies), so no closed set
+    while buckets.size:
+        cost, nodes = buckets.take_next()
+        for current in nodes:
+            frontier.discard(current)
+            explored.add(current)
+
+            yield snapshot(explored, frontier, cols=out)
+
+            if current == goal:
+                path = _reconstruct(parent, start, goal)
+                yield snapshot(explored, frontier, cols=out, done=True, found=True,
+                               path=path if ids else positions(path, cols))
+                return
+
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                new_cost = cost + weights[nb]
+                old      = cost_so_far[nb]
+                if old < 0 or new_cost < old:
+                    cost_so_far[nb] = new_cost
+                    parent[nb]      = current
+                    buckets.push(nb, new_cost, old)
+                    frontier.add(nb)
+
+    frontier.clear()
+    yield snapshot(explored, frontier, cols=out, path=[], done=True, found=False)
+
+
+def ucs_solve(grid, start: tuple, goal: tuple, queue: str = "heap") -> tuple[list[tuple], int]:
+    """Headless UCS mirroring ucs(). Returns (path, nodes_expanded)."""
+    if queue not in QUEUES:
+        raise ValueError(f"unknown queue {queue!r}; expected one of {QUEUES}")
+    if queue == "bucket":
+        return _ucs_bucket_solve(grid, start, goal)
+    cols    = grid.cols
+    start   = grid.cell_id(*start)
+    goal    = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    n       = grid.rows * cols
+
+    counter     = 0
+    heap        = [(0, counter, start)]
+    parent      = array("i", [-1]) * n
+    cost_so_far = array("d", [_INF]) * n
+    cost_so_far[start] = 0
+    closed      = bytearray(n)
+    expanded    = 0
+
+    while heap:
+        cost, _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expanded += 1
+
+        if current == goal:
+            return positions(_reconstruct(parent, start, goal), cols), expanded
+
+        base = current * ADJ_STRIDE
+        for nb in targets[base:base + degree[current]]:
+            new_cost = cost_so_far[current] + weights[nb]
+            if new_cost < cost_so_far[nb]:
+                cost_so_far[nb] = new_cost
+                parent[nb]      = current
+                counter += 1
+                heapq.heappush(heap, (new_cost, counter, nb))
+
+    return [], expanded
+
+
+def _ucs_bucket_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    cols    = grid.cols
+    start   = grid.cell_id(*start)
+    goal    = grid.cell_id(*goal)
+    targets, degree = grid.adjacency()
+    weights = grid.flat_weights()
+    n       = grid.rows * cols
+
+    buckets     = _BucketQueue(int(grid.weights.max()))
+    buckets.push(start, 0)
+    parent      = array("i", [-1]) * n
+    cost_so_far = array("q", [-1]) * n
+    cost_so_far[start] = 0
+    expanded    = 0
+
+    while buckets.size:
+        cost, nodes = buckets.take_next()
+        for current in nodes:
+            expanded += 1
+            if current == goal:
+                return positions(_reconstruct(parent, start, goal), cols), expanded
+
+            base = current * ADJ_STRIDE
+            for nb in targets[base:base + degree[current]]:
+                new_cost = cost + weights[nb]
+                old      = cost_so_far[nb]
+                if old < 0 or new_cost < old:
+                    cost_so_far[nb] = new_cost
+                    parent[nb]      = current
+                    buckets.push(nb, new_cost, old)
+
+    return [], expanded
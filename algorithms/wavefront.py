@@ -0,0 +1,147 @@
+import numpy as np
+
+from grid import DIRECTIONS
+
+from .snapshot import positions
+
+
+def _shift_tables(grid):
+    """
+    Per-direction (flat offset, row guard, col guard) for the six moves.
+    A guard is the row / col value a cell must NOT have for the move to
+    stay inside the grid (None = no guard on that axis).
+    """
+    rows, cols = grid.rows, grid.cols
+    tables = []
+    for dr, dc in DIRECTIONS:
+        row_guard = 0 if dr < 0 else rows - 1 if dr > 0 else None
+        col_guard = 0 if dc < 0 else cols - 1 if dc > 0 else None
+        tables.append((dr * cols + dc, row_guard, col_guard))
+    return tables
+
+
+def _next_layer(layer: np.ndarray, dist: np.ndarray, walkable: np.ndarray,
+                cols: int, shifts) -> np.ndarray:
+    """Expand a whole BFS layer (sorted cell IDs) in one go; returns the next layer."""
+    row, col = np.divmod(layer, cols)
+    found = []
+    for offset, row_guard, col_guard in shifts:
+        keep = np.ones(layer.shape, dtype=bool)
+        if row_guard is not None:
+            keep &= row != row_guard
+        if col_guard is not None:
+            keep &= col != col_guard
+        cand = layer[keep] + offset
+        found.append(cand[walkable[cand] & (dist[cand] < 0)])
+    return np.unique(np.concatenate(found))
+
+
+def _trace_back(dist: np.ndarray, start: int, goal: int, grid) -> list[int]:
+    """Walk from goal down the distance field, one layer per step."""
+    rows, cols = grid.rows, grid.cols
+    path, node = [goal], goal
+    while node != start:
+        r, c = divmod(node, cols)
+        want = dist[node] - 1
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and dist[nr * cols + nc] == want:
+                node = nr * cols + nc
+                break
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def _setup(grid):
+    n        = grid.rows * grid.cols
+    walkable = ~(grid.walls | grid.dynamic).reshape(-1)
+    dist     = np.full(n, -1, dtype=np.int32)
+    return walkable, dist
+
+
+def wavefront_bfs(grid, ids: bool = False):
+    """
+    Level-synchronous BFS generator for large unweighted grids.
+
+    Every step expands the entire current layer with NumPy (six flat-offset
+    shifts filtered by the wall mask) instead of one cell at a time, then
+    recovers a shortest path by walking down the distance field. Yields one
+    delta snapshot per BFS layer (see algorithms/snapshot.py); the path has
+    the same length as bfs() but may pick a different tie.
+
+    Parameters
+    ----------
+    grid : Grid   Shared grid object.
+    ids  : bool   Report cells as flat IDs instead of (row, col) tuples.
+    """
+    cols  = grid.cols
+    start = grid.cell_id(*grid.start_node.pos)
+    goal  = grid.cell_id(*grid.target_node.pos)
+    walkable, dist = _setup(grid)
+    shifts = _shift_tables(grid)
+
+    def cells(id_array) -> set:
+        flat = id_array.tolist()
+        return set(flat) if ids else set(positions(flat, cols))
+
+    # Snapshots are built directly here: whole layers change at once, so
+    # routing them through DeltaSet one cell at a time would defeat the point.
+    def frame(expanded, removed, added, **final):
+        snap = {
+            "explored_add"   : cells(expanded),
+            "explored_remove": set(),
+            "frontier_add"   : cells(added),
+            "frontier_remove": cells(removed),
+            "path"           : None,
+            "done"           : False,
+            "found"          : False,
+        }
+        snap.update(final)
+        return snap
+
+    empty = np.empty(0, dtype=np.int64)
+    layer = np.array([start], dtype=np.int64)
+    dist[start] = 0
+    level = 0
+    # The start cell never shows up as frontier, matching bfs()
+    reported = empty
+
+    while layer.size:
+        if dist[goal] == level:
+            path = _trace_back(dist, start, goal, grid)
+            yield frame(layer, reported, empty, layer=level)
+            yield frame(empty, empty, empty, done=True, found=True,
+                        path=path if ids else positions(path, cols), layer=level)
+            return
+
+        nxt = _next_layer(layer, dist, walkable, cols, shifts)
+        dist[nxt] = level + 1
+        yield frame(layer, reported, nxt, layer=level)
+        layer, reported = nxt, nxt
+        level += 1
+
+    yield frame(empty, empty, empty, done=True, found=False, path=[], layer=level)
+
+
+def wavefront_solve(grid, start: tuple, goal: tuple) -> tuple[list[tuple], int]:
+    """Headless wavefront BFS. Returns (path, nodes_expanded)."""
+    cols  = grid.cols
+    start = grid.cell_id(*start)
+    goal  = grid.cell_id(*goal)
+    walkable, dist = _setup(grid)
+    shifts = _shift_tables(grid)
+
+    layer = np.array([start], dtype=np.int64)
+    dist[start] = 0
+    level, expanded = 0, 0
+
+    while layer.size:
+        expanded += int(layer.size)
+        if dist[goal] == level:
+            return positions(_trace_back(dist, start, goal, grid), cols), expanded
+        layer = _next_layer(layer, dist, walkable, cols, shifts)
+        dist[layer] = level + 1
+        level += 1
+
+    return [], expanded
@@ -0,0 +1,89 @@
+"""
+benchmarks/hpa.py
+HPA* vs plain A* on large workloads, plus the cost of a wall edit.
+
+Run from the project root:
+
+    python -m benchmarks.hpa
+    python -m benchmarks.hpa --sizes large --kinds terrain maze
+
+For each map the script times the eager HPA* build, a batch of random
+queries through both planners, and one wall toggle followed by a query
+(which should rebuild a single cluster). HPA* paths are near-optimal, so
+the worst cost ratio against A* is reported rather than asserted.
+"""
+
+import argparse
+import random
+import time
+
+from algorithms import solve
+from algorithms.hpa import DEFAULT_CLUSTER_SIZE, HPAStar
+
+from .workloads import DEFAULT_SEED, KINDS, SIZES, build
+
+QUERIES = 20
+
+
+def _random_open(grid, rnd) -> tuple:
+    while True:
+        r, c = rnd.randrange(grid.rows), rnd.randrange(grid.cols)
+        if not grid._is_blocked(r, c):
+            return r, c
+
+
+def run(kind: str, size: str, cluster_size: int, seed: int = DEFAULT_SEED):
+    rows, cols = SIZES[size]
+    grid  = build(kind, rows, cols, seed)
+    rnd   = random.Random(seed)
+    pairs = [(_random_open(grid, rnd), _random_open(grid, rnd)) for _ in range(QUERIES)]
+    grid.adjacency()    # build the index outside the timed region
+
+    planner = HPAStar(grid, cluster_size)
+    t0 = time.perf_counter()
+    planner.build()
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    exact = [solve(grid, "astar", start=s, target=t) for s, t in pairs]
+    t_astar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    approx = [planner.query(s, t) for s, t in pairs]
+    t_hpa = time.perf_counter() - t0
+
+    assert all(a["found"] == h["found"] for a, h in zip(exact, approx)), "reachability differs"
+    ratio = max((h["cost"] / a["cost"] for a, h in zip(exact, approx) if a["cost"]), default=1.0)
+
+    # One wall toggle in the middle of the map, then a query
+    built = planner.built
+    r, c  = rows // 2, cols // 2
+    if grid.walls[r, c]:
+        grid.erase_wall(r, c)
+    else:
+        grid.place_wall(r, c)
+    t0 = time.perf_counter()
+    planner.query(*pairs[0])
+    t_edit = time.perf_counter() - t0
+
+    print(f"{size:>6} {kind:>8} {t_build:8.2f}s {t_astar:8.3f}s {t_hpa:8.3f}s "
+          f"{t_astar / t_hpa:7.1f}x {ratio:6.3f} {t_edit:8.3f}s {planner.built - built:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--sizes",        nargs="+", default=["medium"], choices=list(SIZES))
+    parser.add_argument("--kinds",        nargs="+", default=["open", "walls25", "maze", "terrain"],
+                        choices=list(KINDS))
+    parser.add_argument("--cluster-size", type=int,  default=DEFAULT_CLUSTER_SIZE)
+    args = parser.parse_args(argv)
+
+    print(f"{'size':>6} {'kind':>8} {'build':>9} {'A*':>9} {'HPA*':>9} "
+          f"{'speedup':>8} {'ratio':>6} {'edit':>9} {'rebuilt':>8}")
+    for size in args.sizes:
+        for kind in args.kinds:
+            run(kind, size, args.cluster_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+benchmarks/run.py
+Headless benchmark suite: every algorithm on every workload.
+
+    python -m benchmarks.run                            # tiny/small/medium, all kinds
+    python -m benchmarks.run --sizes large huge --algos bfs wave ucs
+    python -m benchmarks.run --out results.json --repeats 5
+
+Each algorithm is measured twice per workload — as the step-by-step
+generator the GUI drives (drained with ids=True, no rendering) and through
+the headless solve() — and every row records wall time, nodes expanded,
+peak traced memory and path length. Results go to a JSON file.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from algorithms import (bfs, dfs, ucs, dls, iddfs, bidirectional, wavefront_bfs,
+                        bidirectional_dijkstra, astar, weighted_astar, jps, solve)
+from algorithms.solve import path_cost
+
+from .workloads import DEFAULT_SEED, KINDS, SIZES, build
+
+# name → (generator, solve() key, params, max cells or None)
+# IDDFS runs one pass over the reachable cells per depth up to the path
+# length, so it costs O(path length × cells). It is capped to the small
+# size and kept off mazes (see SKIP), whose paths are long.
+ALGORITHMS = {
+    "bfs"           : (bfs,            "bfs",            {},                   None),
+    "dfs"           : (dfs,            "dfs",            {},                   None),
+    "ucs"           : (ucs,            "ucs",            {},                   None),
+    "ucs_bucket"    : (ucs,            "ucs",            {"queue": "bucket"},  None),
+    "dls"           : (dls,            "dls",            {},                   None),
+    "iddfs"         : (iddfs,          "iddfs",          {},                   20_000),
+    "bidirectional" : (bidirectional,  "bidirectional",  {},                   None),
+    "bidir_balanced": (bidirectional,  "bidirectional",  {"mode": "balanced"}, None),
+    "bidijkstra"    : (bidirectional_dijkstra, "bidijkstra", {},             None),
+    "wavefront"     : (wavefront_bfs,  "wavefront",      {},                   None),
+    "astar"         : (astar,          "astar",          {},                   None),
+    "weighted_astar": (weighted_astar, "weighted_astar", {},                   None),
+    "jps"           : (jps,            "jps",            {},                   None),
+}
+
+# algorithm → workload kinds it is not run on. A small maze's shortest path
+# is ~2,100 steps, which takes IDDFS about a minute per run; medium is hours.
+SKIP = {"iddfs": {"maze"}}
+
+DEFAULT_SIZES = ("tiny", "small", "medium")
+DEFAULT_OUT   = "bench_results.json"
+
+
+def _drain(gen) -> tuple[int, list | None, bool]:
+    """
+    Run a generator to completion; returns (expanded, path, found).
+    Expansions are cells added to explored, unless the final snapshot
+    reports its own 'expanded' count (bidirectional search, whose
+    explored set also holds cells that were only discovered). Either way
+    the figure matches what solve() reports for the same search.
+    """
+    expanded, last = 0, None
+    for snap in gen:
+        expanded += len(snap["explored_add"])
+        last = snap
+    return last.get("expanded", expanded), last["path"], last["found"]
+
+
+def _run_generator(grid, fn, params):
+    expanded, path, found = _drain(fn(grid, ids=True, **params))
+    # Paths come back as IDs here; convert once for the cost / length columns
+    path = [grid.cell_pos(i) for i in path] if path else []
+    return path, expanded, found
+
+
+def _run_solve(grid, key, params):
+    result = solve(grid, key, **params)
+    return result["path"], result["expanded"], result["found"]
+
+
+def measure(grid, run, repeats: int) -> dict:
+    """Best-of-*repeats* wall time, then one extra traced run for peak memory."""
+    grid.adjacency()    # shared one-off cost, kept out of every timing
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        path, expanded, found = run()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_time"  : min(times),
+        "times"      : times,
+        "expanded"   : expanded,
+        "peak_memory": peak,
+        "found"      : found,
+        "path_length": len(path),
+        "path_cost"  : path_cost(grid, path) if found else None,
+    }
+
+
+def run_suite(sizes, kinds, algos, repeats: int = 3, seed: int = DEFAULT_SEED,
+              log=print) -> list[dict]:
+    """
+    Benchmark every (size, kind, algorithm) combination.
+
+    Parameters
+    ----------
+    sizes   : iterable of SIZES keys.
+    kinds   : iterable of workload KINDS keys.
+    algos   : iterable of ALGORITHMS keys.
+    repeats : int   Timed runs per measurement (best is reported).
+    seed    : int   Workload seed.
+    log     : callable | None   Progress output, one line per row.
+
+    Returns
+    -------
+    list[dict]  One row per (workload, algorithm, mode).
+    """
+    rows = []
+    for size in sizes:
+        n_rows, n_cols = SIZES[size]
+        for kind in kinds:
+            grid = build(kind, n_rows, n_cols, seed)
+            for name in algos:
+                fn, key, params, max_cells = ALGORITHMS[name]
+                if max_cells is not None and n_rows * n_cols > max_cells:
+                    continue
+                if kind in SKIP.get(name, ()):
+                    continue
+                for mode, run in (("generator", lambda: _run_generator(grid, fn, params)),
+                                  ("solve",     lambda: _run_solve(grid, key, params))):
+                    row = {
+                        "size"     : size,
+                        "workload" : kind,
+                        "rows"     : n_rows,
+                        "cols"     : n_cols,
+                        "cells"    : n_rows * n_cols,
+                        "seed"     : seed,
+                        "algorithm": name,
+                        "mode"     : mode,
+                    }
+                    row.update(measure(grid, run, repeats))
+                    rows.append(row)
+                    if log:
+                        log(f"{size:>6} {kind:>8} {name:>14} {mode:>9} "
+                            f"{row['wall_time']:9.4f}s {row['expanded']:>9} "
+                            f"{row['peak_memory'] / 1e6:8.2f}MB len={row['path_length']}")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--sizes",   nargs="+", default=list(DEFAULT_SIZES), choices=list(SIZES))
+    parser.add_argument("--kinds",   nargs="+", default=list(KINDS),         choices=list(KINDS))
+    parser.add_argument("--algos",   nargs="+", default=list(ALGORITHMS),    choices=list(ALGORITHMS))
+    parser.add_argument("--repeats", type=int,  default=3)
+    parser.add_argument("--seed",    type=int,  default=DEFAULT_SEED)
+    parser.add_argument("--out",     default=DEFAULT_OUT)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.kinds, args.algos, args.repeats, args.seed)
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python"   : sys.version.split()[0],
+            "numpy"    : np.__version__,
+            "platform" : platform.platform(),
+            "repeats"  : args.repeats,
+            "seed"     : args.seed,
+        },
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {len(results)} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+benchmarks/ucs_queues.py
+Heap vs bucket-queue (Dial's algorithm) UCS on weighted grids.
+
+Run from the project root:
+
+    python -m benchmarks.ucs_queues
+
+Both backends must agree on path cost; the script stops with an
+AssertionError if they ever differ.
+"""
+
+import random
+import time
+
+from grid import Grid
+from algorithms.ucs import ucs_solve
+from algorithms.solve import path_cost
+
+SIZES   = [(30, 40), (100, 150), (300, 400), (600, 800)]
+REPEATS = 3
+SEED    = 7
+
+
+def weighted_grid(rows: int, cols: int, seed: int = SEED,
+                  wall_density: float = 0.15) -> Grid:
+    """Random walls plus random 1–10 weights, start / target in opposite corners."""
+    rnd  = random.Random(seed)
+    grid = Grid(rows, cols)
+    grid.set_start(0, 0)
+    grid.set_target(rows - 1, cols - 1)
+    for r in range(rows):
+        for c in range(cols):
+            if rnd.random() < wall_density:
+                grid.place_wall(r, c)
+            else:
+                grid.set_weight(r, c, rnd.randint(1, 10))
+    return grid
+
+
+def best_time(fn, *args, **kwargs) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    print(f"{'grid':>10} {'heap s':>9} {'bucket s':>9} {'speedup':>8} {'cost':>8} {'expanded':>9}")
+    for rows, cols in SIZES:
+        grid  = weighted_grid(rows, cols)
+        start = grid.start_node.pos
+        goal  = grid.target_node.pos
+        grid.adjacency()    # build the index outside the timed region
+
+        t_heap,   (p_heap,   n_heap)   = best_time(ucs_solve, grid, start, goal, queue="heap")
+        t_bucket, (p_bucket, n_bucket) = best_time(ucs_solve, grid, start, goal, queue="bucket")
+
+        cost = path_cost(grid, p_heap) if p_heap else None
+        assert cost == (path_cost(grid, p_bucket) if p_bucket else None), "costs differ"
+        assert n_heap == n_bucket, "expansion counts differ"
+
+        label = f"{rows}x{cols}"
+        print(f"{label:>10} {t_heap:9.3f} {t_bucket:9.3f} {t_heap / t_bucket:7.2f}x "
+              f"{cost if cost is not None else '-':>8} {n_heap:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+benchmarks/workloads.py
+Seeded, reproducible grid workloads for the benchmark suite.
+
+    build("maze", 300, 400, seed=1)   → Grid
+
+Every kind fills a Grid through Grid.load_layout(), so even multi-million
+cell grids are generated in a few seconds at most. Start sits in the top-left
+corner and the target in the bottom-right; both are always open.
+"""
+
+import numpy as np
+
+from grid import Grid
+
+# Named sizes, smallest first; "huge" is 4 M cells
+SIZES = {
+    "tiny"  : (20, 30),
+    "small" : (100, 150),
+    "medium": (300, 400),
+    "large" : (1000, 1500),
+    "huge"  : (2000, 2000),
+}
+
+DEFAULT_SEED = 1
+
+
+def _open(rng, rows, cols):
+    return np.zeros((rows, cols), dtype=bool), None
+
+
+def _random_walls(density: float):
+    def make(rng, rows, cols):
+        return rng.random((rows, cols)) < density, None
+    return make
+
+
+def _maze(rng, rows, cols):
+    """
+    Recursive-backtracker maze on the even (row, col) cells, carving through
+    the odd cells between them. The diagonal moves only ever link passages
+    around one shared cell, so the maze stays perfect on the hex topology.
+    """
+    h, w  = (rows + 1) // 2, (cols + 1) // 2
+    open_ = bytearray(rows * cols)      # flat carve mask, cheaper than NumPy scalars
+    seen  = bytearray(h * w)
+    picks = rng.random(h * w).tolist()    # pre-drawn, one per carve
+
+    stack = [0]
+    seen[0] = open_[0] = 1
+    k = 0
+    while stack:
+        cell = stack[-1]
+        r, c = divmod(cell, w)
+        options = []
+        if r > 0 and not seen[cell - w]:
+            options.append(cell - w)
+        if c + 1 < w and not seen[cell + 1]:
+            options.append(cell + 1)
+        if r + 1 < h and not seen[cell + w]:
+            options.append(cell + w)
+        if c > 0 and not seen[cell - 1]:
+            options.append(cell - 1)
+        if not options:
+            stack.pop()
+            continue
+        nxt = options[int(picks[k] * len(options))]
+        k += 1
+        nr, nc = divmod(nxt, w)
+        seen[nxt] = 1
+        open_[2 * nr * cols + 2 * nc] = 1
+        open_[(r + nr) * cols + (c + nc)] = 1    # the cell between the two
+        stack.append(nxt)
+    walls = np.frombuffer(open_, dtype=np.uint8).reshape(rows, cols) == 0
+    return walls, None
+
+
+def _terrain(rng, rows, cols):
+    """Smooth weight 1–10 hills (upsampled coarse noise) with a few walls."""
+    coarse  = rng.random(((rows + 7) // 8 + 1, (cols + 7) // 8 + 1))
+    smooth  = np.kron(coarse, np.ones((8, 8)))[:rows, :cols]
+    weights = 1 + np.floor(9.999 * (0.7 * smooth + 0.3 * rng.random((rows, cols))))
+    return rng.random((rows, cols)) < 0.05, weights.astype(np.uint8)
+
+
+KINDS = {
+    "open"   : _open,
+    "walls10": _random_walls(0.10),
+    "walls25": _random_walls(0.25),
+    "walls40": _random_walls(0.40),
+    "maze"   : _maze,
+    "terrain": _terrain,
+}
+
+
+def build(kind: str, rows: int, cols: int, seed: int = DEFAULT_SEED) -> Grid:
+    """
+    Build one workload grid.
+
+    Parameters
+    ----------
+    kind : str   Key of KINDS ("open", "walls25", "maze", "terrain", …).
+    rows : int   Grid height.
+    cols : int   Grid width.
+    seed : int   Same (kind, rows, cols, seed) → same grid, on every machine.
+    """
+    try:
+        make = KINDS[kind]
+    except KeyError:
+        raise ValueError(f"unknown workload {kind!r}; expected one of {sorted(KINDS)}") from None
+
+    walls, weights = make(np.random.default_rng(seed), rows, cols)
+    grid = Grid(rows, cols)
+    # Maze cells live on even coordinates, so aim for the last even corner
+    grid.set_start(0, 0)
+    grid.set_target((rows - 1) & ~1 if kind == "maze" else rows - 1,
+                    (cols - 1) & ~1 if kind == "maze" else cols - 1)
+    grid.load_layout(walls, weights)
+    return grid
@@ -0,0 +1,188 @@
+"""
+connectivity.py
+Connected components of a Grid's open cells, kept in sync with its edits.
+
+    grid.connected((3, 4), (120, 77))     # O(α) union-find lookups
+
+Every open cell carries a label, and a small union-find over labels says
+which labels belong to the same component. Opening a cell gives it a
+fresh label and unions it with each open neighbour. Blocking a cell can
+only split its component when its open neighbours form several separate
+arcs around the six-cell ring. Neighbours next to each other on the ring
+are themselves adjacent, so one arc stays connected on its own. When
+there are several arcs, one BFS per arc runs in lockstep. BFSs that meet
+are merged. As soon as at most one group is still growing, every finished
+group is a complete component of its own and gets a fresh label. The
+cost is the size of the pieces that broke off, not of the whole map.
+"""
+
+from array import array
+from collections import deque
+
+import numpy as np
+
+# The six moves in ring order: each one is adjacent to the next
+_RING = [(0, 1), (1, 1), (1, 0), (0, -1), (-1, -1), (-1, 0)]
+
+
+class ConnectivityIndex:
+    """
+    Component labels for one Grid; get it from Grid.connectivity(), which
+    also keeps it current.
+    """
+
+    def __init__(self, grid):
+        self.grid  = grid
+        self.label = array("i", self._initial_labels(grid))    # -1 = blocked
+        self._parent = list(range(max(self.label, default=-1) + 1))
+        self.count = len(self._parent)                          # components right now
+
+    # ── Build
+
+    @staticmethod
+    def _initial_labels(grid) -> np.ndarray:
+        """
+        Vectorised labelling: hook every edge's two roots onto the smaller
+        one, then pointer-jump to the roots, until nothing changes.
+        """
+        rows, cols = grid.rows, grid.cols
+        ids  = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+        open_ = ~(grid.walls | grid.dynamic)
+
+        # Each undirected edge once, via the three "forward" moves
+        src, dst = [], []
+        for dr, dc in ((0, 1), (1, 0), (1, 1)):
+            ok = open_[:rows - dr, :cols - dc] & open_[dr:, dc:]
+            src.append(ids[:rows - dr, :cols - dc][ok])
+            dst.append(ids[dr:, dc:][ok])
+        src, dst = np.concatenate(src), np.concatenate(dst)
+
+        lab = ids.reshape(-1).copy()
+        while True:
+            a, b = lab[src], lab[dst]
+            differ = a != b
+            if not differ.any():
+                break
+            a, b = a[differ], b[differ]
+            lo, hi = np.minimum(a, b), np.maximum(a, b)
+            np.minimum.at(lab, hi, lo)
+            while True:                       # pointer jumping: lab[i] → its root
+                jumped = lab[lab]
+                if np.array_equal(jumped, lab):
+                    break
+                lab = jumped
+
+        lab = lab.reshape(rows, cols)
+        labels = np.full((rows, cols), -1, dtype=np.int64)
+        # Compact the root IDs to 0..k-1
+        labels[open_] = np.unique(lab[open_], return_inverse=True)[1].reshape(-1)
+        return labels.reshape(-1).tolist()
+
+    # ── Union-find over labels
+
+    def _find(self, x: int) -> int:
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]       # path halving
+            x = parent[x]
+        return x
+
+    def _union(self, a: int, b: int):
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            self._parent[max(ra, rb)] = min(ra, rb)
+            self.count -= 1
+
+    def _new_label(self) -> int:
+        self._parent.append(len(self._parent))
+        return len(self._parent) - 1
+
+    # ── Queries
+
+    def component(self, i: int) -> int:
+        """Component ID of cell ID i (stable until the next edit), or -1 if blocked."""
+        lab = self.label[i]
+        return self._find(lab) if lab >= 0 else -1
+
+    def connected(self, i: int, j: int) -> bool:
+        """True if open cells i and j are in the same component."""
+        a, b = self.label[i], self.label[j]
+        return a >= 0 and b >= 0 and self._find(a) == self._find(b)
+
+    # ── Updates (called by Grid after the adjacency index is patched)
+
+    def cell_opened(self, i: int):
+        lab = self.label[i] = self._new_label()
+        self.count += 1
+        for nb in self.grid.neighbour_ids(i):
+            self._union(lab, self.label[nb])
+
+    def cell_blocked(self, i: int):
+        self.label[i] = -1
+        r, c  = divmod(i, self.grid.cols)
+        ring  = [self._open_cell(r + dr, c + dc) for dr, dc in _RING]
+
+        # One seed per run of consecutive open ring cells (the ring wraps)
+        seeds = [cell for k, cell in enumerate(ring) if cell >= 0 and ring[k - 1] < 0]
+        if not seeds and any(cell >= 0 for cell in ring):
+            return                              # every neighbour open: one arc
+        if not seeds:
+            self.count -= 1                     # an isolated cell's component is gone
+            return
+        if len(seeds) > 1:
+            self._split(seeds)
+
+    def _open_cell(self, r: int, c: int) -> int:
+        grid = self.grid
+        if 0 <= r < grid.rows and 0 <= c < grid.cols and not grid._is_blocked(r, c):
+            return r * grid.cols + c
+        return -1
+
+    def _split(self, seeds: list[int]):
+        """Lockstep BFS from each seed; relabel every piece that closes off."""
+        targets, degree = self.grid.adjacency()
+        stride  = len(targets) // len(self.label)
+        k       = len(seeds)
+        group   = list(range(k))                # tiny union-find over the searches
+        queues  = [deque([s]) for s in seeds]
+        owner   = {s: n for n, s in enumerate(seeds)}
+
+        def root(n: int) -> int:
+            while group[n] != n:
+                n = group[n]
+            return n
+
+        while True:
+            for n in range(k):
+                queue = queues[n]
+                if not queue:
+                    continue
+                current = queue.popleft()
+                base = current * stride
+                for nb in targets[base:base + degree[current]]:
+                    other = owner.get(nb)
+                    if other is None:
+                        owner[nb] = n
+                        queue.append(nb)
+                    else:
+                        a, b = root(n), root(other)
+                        if a != b:
+                            group[max(a, b)] = min(a, b)
+
+            roots   = {root(n) for n in range(k)}
+            growing = {root(n) for n in range(k) if queues[n]}
+            if len(roots) == 1:
+                return                          # everything met again: no split
+            if len(growing) <= 1:
+                break
+
+        # Finished groups are whole components; the growing one (or, if all
+        # finished, the first) keeps the old label
+        keep  = growing.pop() if growing else min(roots)
+        fresh = {g: self._new_label() for g in roots if g != keep}
+        label = self.label
+        for cell, n in owner.items():
+            lab = fresh.get(root(n))
+            if lab is not None:
+                label[cell] = lab
+        self.count += len(fresh)
@@ -1,4 +1,10 @@
-from node import Node
+from itertools import count
+
+import numpy as np
+
+from connectivity import ConnectivityIndex
+from node import Node, STATE_CODE
+
 # 6-directional clockwise movement: Up, Right, Down, Bottom-Right, Left, Top-Left.
 # Top-Right (-1,+1) and Bottom-Left (+1,-1) are excluded per spec.
 DIRECTIONS = [
@@ -11,40 +17,217 @@ DIRECTIONS = [
 ]
 
 
+def move_distance(dr: int, dc: int) -> int:
+    """
+    Fewest DIRECTIONS moves covering a (dr, dc) offset on an open grid.
+
+    Bottom-Right / Top-Left advance both axes at once, so when dr and dc
+    share a sign the diagonal covers the overlap (max); with opposite signs
+    no single move helps both axes and the offsets simply add up.
+    """
+    if (dr >= 0) == (dc >= 0):
+        return max(abs(dr), abs(dc))
+    return abs(dr) + abs(dc)
+
+
+# Slots reserved per cell in the adjacency index: cell i's walkable
+# neighbours are targets[i*ADJ_STRIDE : i*ADJ_STRIDE + degree[i]]
+ADJ_STRIDE = len(DIRECTIONS)
+
+_EMPTY = STATE_CODE["empty"]
+
+# Shared by every Grid, so a version number names one grid state for good:
+# no two grids ever hand out the same value (pickled copies keep theirs).
+_VERSIONS = count(1)
+
+
 class Grid:
-    """2-D grid of Node objects used by all search algorithms."""
+    """
+    2-D grid used by all search algorithms.
+
+    Cell data lives in (rows, cols) NumPy arrays — one byte per cell per
+    field — and Node objects are views created on demand. Treat the arrays
+    as read-only outside this class and edit through the methods below.
+    """
 
     def __init__(self, rows: int, cols: int):
+        self._init_fields(rows, cols,
+                          np.zeros((rows, cols), dtype=bool),
+                          np.ones((rows, cols),  dtype=np.uint8))
+        self._set_default_endpoints()
+
+    @classmethod
+    def from_arrays(cls, walls: np.ndarray, weights: np.ndarray,
+                    start: tuple | None = None, target: tuple | None = None) -> "Grid":
+        """
+        Wrap existing (rows, cols) arrays without copying or scanning them —
+        a bool wall array and a uint8 weight array with values 1–10, which
+        may be a copy-on-write np.memmap. With neither endpoint given the
+        defaults are used. Visual states are derived from walls on first
+        use. Used by mapfile.load_map().
+        """
+        if walls.shape != weights.shape:
+            raise ValueError(f"walls are {walls.shape}, weights are {weights.shape}")
+        grid = cls.__new__(cls)
+        grid._init_fields(*walls.shape, walls, weights)
+        grid._states = None
+        if start is None and target is None:
+            start, target = grid._default_endpoints()
+        # Endpoints are always open; set them directly so states stay unbuilt
+        for pos, attr in ((start, "start_node"), (target, "target_node")):
+            if pos is not None:
+                walls[pos] = False
+                setattr(grid, attr, Node(grid, *pos))
+        return grid
+
+    def _init_fields(self, rows: int, cols: int, walls: np.ndarray, weights: np.ndarray):
         self.rows = rows
         self.cols = cols
-        self._cells: list[list[Node]] = [
-            [Node(r, c) for c in range(cols)] for r in range(rows)
-        ]
+        self.walls   = walls
+        self.dynamic = np.zeros((rows, cols), dtype=bool)
+        self.weights = weights
+        self._states = np.zeros((rows, cols), dtype=np.uint8)   # codes into node.STATES
         self.start_node:  Node | None = None
         self.target_node: Node | None = None
 
-        self._set_default_endpoints()
+        # version changes on every edit; map_version only when walls, dynamic
+        # obstacles or weights change (endpoint moves leave it alone), so
+        # caches keyed on it can tell when they are stale
+        self.version     = next(_VERSIONS)
+        self.map_version = self.version
+
+        # Neighbour index — built lazily by adjacency(), then kept in sync
+        # cell by cell; None means "rebuild on next use"
+        self._adj_targets: np.ndarray | None = None
+        self._adj_degree:  np.ndarray | None = None
+        self._adj = None    # (targets, degree) memoryviews for fast scalar reads
+        # Component index — also lazy (connectivity()) and patched per edit
+        self._conn: ConnectivityIndex | None = None
+
+    @property
+    def states(self) -> np.ndarray:
+        """Visual state codes (indices into node.STATES), one per cell."""
+        if self._states is None:
+            # from_arrays() grid: paint walls and endpoints on first use
+            states = np.zeros((self.rows, self.cols), dtype=np.uint8)
+            states[self.walls] = STATE_CODE["wall"]
+            for nd, name in ((self.start_node, "start"), (self.target_node, "target")):
+                if nd:
+                    states[nd.pos] = STATE_CODE[name]
+            self._states = states
+        return self._states
 
     # ── Internal helpers 
 
-    def _set_default_endpoints(self):
+    def _default_endpoints(self) -> tuple:
         # Start on the left side, target on the right, both on the middle row
         mid_r = self.rows // 2
-        self.set_start(mid_r, 3)
-        self.set_target(mid_r, self.cols - 4)
+        return (mid_r, 3), (mid_r, self.cols - 4)
+
+    def _set_default_endpoints(self):
+        start, target = self._default_endpoints()
+        self.set_start(*start)
+        self.set_target(*target)
 
     def _in_bounds(self, r: int, c: int) -> bool:
         return 0 <= r < self.rows and 0 <= c < self.cols
 
+    def _endpoint_positions(self) -> tuple:
+        return tuple(nd.pos for nd in (self.start_node, self.target_node) if nd)
+
+    def _is_blocked(self, r: int, c: int) -> bool:
+        return bool(self.walls[r, c] or self.dynamic[r, c])
+
+    def _set_blocking(self, layer: np.ndarray, r: int, c: int, flag: bool):
+        """Write a wall / dynamic flag and keep the adjacency index in sync."""
+        was = self._is_blocked(r, c)
+        if layer[r, c] != flag:
+            self._changed()
+        layer[r, c] = flag
+        now = self._is_blocked(r, c)
+        if self._adj is not None and was != now:
+            # Only the cells that list (r, c) as a neighbour are affected;
+            # DIRECTIONS is symmetric, so those are exactly its neighbours.
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if self._in_bounds(nr, nc):
+                    self._refresh_adjacency(nr, nc)
+        if self._conn is not None and was != now:
+            if now:
+                self._conn.cell_blocked(r * self.cols + c)
+            else:
+                self._conn.cell_opened(r * self.cols + c)
+
+    def _changed(self, content: bool = True):
+        """Record an edit; content=False for endpoint moves, which keep map_version."""
+        self.version = next(_VERSIONS)
+        if content:
+            self.map_version = self.version
+
+    def _refresh_adjacency(self, r: int, c: int):
+        """Rewrite one cell's slot row in the adjacency index."""
+        targets, degree = self._adj
+        i    = r * self.cols + c
+        base = i * ADJ_STRIDE
+        k    = 0
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if self._in_bounds(nr, nc) and not self._is_blocked(nr, nc):
+                targets[base + k] = nr * self.cols + nc
+                k += 1
+        for j in range(k, ADJ_STRIDE):
+            targets[base + j] = -1
+        degree[i] = k
+
+    def _build_adjacency(self):
+        """Vectorized build of the whole index, one pass per direction."""
+        rows, cols = self.rows, self.cols
+        n       = rows * cols
+        ids     = np.arange(n, dtype=np.int32).reshape(rows, cols)
+        walk    = ~(self.walls | self.dynamic)
+        targets = np.full((n, ADJ_STRIDE), -1, dtype=np.int32)
+        degree  = np.zeros(n, dtype=np.int32)
+
+        for dr, dc in DIRECTIONS:
+            # Source window whose (dr, dc) neighbour is still inside the grid
+            r0, r1 = max(0, -dr), rows - max(0, dr)
+            c0, c1 = max(0, -dc), cols - max(0, dc)
+            ok  = walk[r0 + dr:r1 + dr, c0 + dc:c1 + dc]
+            src = ids[r0:r1, c0:c1][ok]
+            # Append in DIRECTIONS order so expansion order is unchanged
+            targets[src, degree[src]] = ids[r0 + dr:r1 + dr, c0 + dc:c1 + dc][ok]
+            degree[src] += 1
+
+        self._adj_targets = targets.ravel()
+        self._adj_degree  = degree
+        self._adj = (memoryview(self._adj_targets), memoryview(self._adj_degree))
+
+    def _invalidate_adjacency(self):
+        # Bulk edits: drop the neighbour and component indexes alike
+        self._adj_targets = self._adj_degree = self._adj = None
+        self._conn = None
+
     # ── Public accessors 
 
     def node(self, r: int, c: int) -> Node:
-        return self._cells[r][c]
+        return Node(self, r, c)
+
+    def cell_id(self, r: int, c: int) -> int:
+        """Flat integer ID of (r, c), as used by the adjacency index."""
+        return r * self.cols + c
+
+    def cell_pos(self, i: int) -> tuple:
+        return divmod(i, self.cols)
+
+    def flat_weights(self):
+        """Cell weights indexed by cell ID (memoryview of uint8 → plain ints)."""
+        return memoryview(self.weights.reshape(-1))
 
     def all_nodes(self):
         """Iterate every node left-to-right, top-to-bottom."""
-        for row in self._cells:
-            yield from row
+        for r in range(self.rows):
+            for c in range(self.cols):
+                yield Node(self, r, c)
 
     # ── Endpoint setters 
 
@@ -52,7 +235,8 @@ class Grid:
         # Clear the old start cell before moving it
         if self.start_node:
             self.start_node.state = "empty"
-        self.start_node = self._cells[r][c]
+        self.start_node = Node(self, r, c)
+        self._changed(content=False)
         self.start_node.state = "start"
         self.start_node.is_wall = False
         self.start_node.is_dynamic = False
@@ -60,7 +244,8 @@ class Grid:
     def set_target(self, r: int, c: int):
         if self.target_node:
             self.target_node.state = "empty"
-        self.target_node = self._cells[r][c]
+        self.target_node = Node(self, r, c)
+        self._changed(content=False)
         self.target_node.state = "target"
         self.target_node.is_wall = False
         self.target_node.is_dynamic = False
@@ -68,63 +253,110 @@ class Grid:
     # ── Wall management 
 
     def toggle_wall(self, r: int, c: int):
-        nd = self._cells[r][c]
-        if nd is self.start_node or nd is self.target_node:
+        nd = Node(self, r, c)
+        if nd == self.start_node or nd == self.target_node:
             return  # never wall over an endpoint
         nd.mark_wall(not nd.is_wall)
 
     def place_wall(self, r: int, c: int):
-        nd = self._cells[r][c]
-        if nd is self.start_node or nd is self.target_node:
+        nd = Node(self, r, c)
+        if nd == self.start_node or nd == self.target_node:
             return
         nd.mark_wall(True)
 
     def erase_wall(self, r: int, c: int):
-        self._cells[r][c].mark_wall(False)
+        Node(self, r, c).mark_wall(False)
 
     # ── Weight management 
 
     def set_weight(self, r: int, c: int, w: int):
         """Set traversal cost (1–10). Walls and endpoints are unaffected."""
-        nd = self._cells[r][c]
-        if nd.is_wall or nd is self.start_node or nd is self.target_node:
+        if self.walls[r, c] or (r, c) in self._endpoint_positions():
             return
-        nd.weight = max(1, min(10, w))
+        Node(self, r, c).weight = max(1, min(10, w))
+
+    # ── Bulk editing
+
+    def load_layout(self, walls, weights=None):
+        """
+        Replace every wall (and optionally every weight) from (rows, cols)
+        arrays in one go, e.g. for generated or loaded maps. Endpoint cells
+        are kept open, weights are clamped to 1–10 and search state is cleared.
+        """
+        walls = np.asarray(walls, dtype=bool)
+        if walls.shape != self.walls.shape:
+            raise ValueError(f"layout is {walls.shape[0]}×{walls.shape[1]}, "
+                             f"grid is {self.rows}×{self.cols}")
+        self.walls[:]   = walls
+        self.dynamic[:] = False
+        if weights is not None:
+            self.weights[:] = np.clip(weights, 1, 10)
+        for r, c in self._endpoint_positions():
+            self.walls[r, c] = False
+        self._changed()
+        self.states[:] = _EMPTY
+        self.states[self.walls] = STATE_CODE["wall"]
+        if self.start_node:
+            self.start_node.state = "start"
+        if self.target_node:
+            self.target_node.state = "target"
+        self._invalidate_adjacency()
 
     # ── Neighbour expansion 
 
+    def adjacency(self):
+        """
+        Return the (targets, degree) neighbour index as memoryviews of int32.
+
+        Walkable neighbours of cell ID i, in DIRECTIONS order, are
+        targets[i*ADJ_STRIDE : i*ADJ_STRIDE + degree[i]]. The index is built
+        once and then patched by every edit, so callers may hold on to it
+        while the grid is being searched.
+        """
+        if self._adj is None:
+            self._build_adjacency()
+        return self._adj
+
+    def connectivity(self) -> ConnectivityIndex:
+        """
+        Component index over open cells (see connectivity.py). Built on
+        first use, then updated by every wall / obstacle edit.
+        """
+        if self._conn is None:
+            self._conn = ConnectivityIndex(self)
+        return self._conn
+
+    def connected(self, a: tuple, b: tuple) -> bool:
+        """True if a path of open cells joins (row, col) *a* and *b*."""
+        return self.connectivity().connected(self.cell_id(*a), self.cell_id(*b))
+
+    def neighbour_ids(self, i: int):
+        """Walkable neighbour IDs of cell ID i, read from the adjacency index."""
+        targets, degree = self.adjacency()
+        base = i * ADJ_STRIDE
+        return targets[base:base + degree[i]]
+
     def neighbours(self, node: Node) -> list[Node]:
         """Return walkable neighbours in the clockwise order defined by DIRECTIONS."""
-        result = []
-        for dr, dc in DIRECTIONS:
-            nr, nc = node.row + dr, node.col + dc
-            if not self._in_bounds(nr, nc):
-                continue
-            nb = self._cells[nr][nc]
-            if not nb.blocked:
-                result.append(nb)
-        return result
+        cols = self.cols
+        return [Node(self, j // cols, j % cols)
+                for j in self.neighbour_ids(node.row * cols + node.col)]
 
     def neighbours_pos(self, pos: tuple) -> list[tuple]:
         """Same as neighbours() but returns (row, col) tuples instead of Node objects."""
-        r, c = pos
-        result = []
-        for dr, dc in DIRECTIONS:
-            nr, nc = r + dr, c + dc
-            if not self._in_bounds(nr, nc):
-                continue
-            nb = self._cells[nr][nc]
-            if not nb.blocked:
-                result.append((nr, nc))
-        return result
+        cols = self.cols
+        return [divmod(j, cols) for j in self.neighbour_ids(pos[0] * cols + pos[1])]
 
     # ── Reset 
 
     def reset_search(self):
         """Clear frontier / explored / path state. Walls and weights are preserved."""
-        for nd in self.all_nodes():
-            nd.reset_search_state()
-        # reset_search_state wipes the state string, so re-apply endpoint colours
+        if self.dynamic.any():
+            self.dynamic[:] = False
+            self._changed()
+            self._invalidate_adjacency()
+        self.states[~self.walls] = _EMPTY
+        # The line above wipes the endpoint cells too, so re-apply their colours
         if self.start_node:
             self.start_node.state = "start"
         if self.target_node:
@@ -132,14 +364,24 @@ class Grid:
 
     def full_reset(self):
         """Wipe everything — walls, weights, endpoints — back to a blank grid."""
-        for nd in self.all_nodes():
-            nd.is_wall    = False
-            nd.is_dynamic = False
-            nd.weight     = 1
-            nd.state      = "empty"
+        self.walls[:]   = False
+        self.dynamic[:] = False
+        self.weights[:] = 1
+        self.states[:]  = _EMPTY
+        self._changed()
+        self._invalidate_adjacency()
         self.start_node  = None
         self.target_node = None
         self._set_default_endpoints()
 
+    # ── Pickling
+
+    def __getstate__(self) -> dict:
+        # Memoryviews can't be pickled; the index is rebuilt lazily on the other side
+        state = self.__dict__.copy()
+        state["_adj_targets"] = state["_adj_degree"] = state["_adj"] = None
+        state["_conn"] = None
+        return state
+
     def __repr__(self) -> str:
         return f"Grid({self.rows}×{self.cols})"
\ No newline at end of file
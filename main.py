@@ -1,9 +1,18 @@
+import queue
+import random
 import sys
+import threading
 import time
+import numpy as np
 import pygame
 
 from grid import Grid
-from algorithms import bfs, dfs, ucs, dls, iddfs, bidirectional
+from mapfile import DEFAULT_PATH as MAP_PATH, load_map, save_map
+from node import STATE_CODE
+from algorithms import (bfs, dfs, ucs, dls, iddfs, bidirectional, wavefront_bfs,
+                        bidirectional_dijkstra, astar, weighted_astar, jps,
+                        SearchState, merge_snapshots, LPAStar, TraceReader, record)
+from algorithms.trace import DEFAULT_PATH as TRACE_PATH
 
 #  WINDOW & GRID  —  SCREEN_* derives automatically; do not set manually
 TITLE        = "OG Path hunter"
@@ -21,6 +30,10 @@ SCREEN_H = TOP_BAR_H + GRID_ROWS * CELL_SIZE + GRID_MARGIN * 2
 
 SCROLL_STEP  = 30          # pixels scrolled per wheel tick / arrow key
 
+TURBO_BUDGET = 0.008       # seconds of snapshot merging per frame in turbo mode (F)
+WORKER_QUEUE = 1024        # snapshots the search thread may run ahead of the UI
+SEEK_STEPS   = 100         # replay steps skipped per ← / → press
+
 #  SIDEBAR LAYOUT  —  each SEC_*_Y is the top edge of that section.
 #  Changing a Y shifts the whole section; nothing else needs updating.
 
@@ -100,21 +113,43 @@ C_WALL_GLOW  = ( 42,  62, 105)   # thin border drawn on top of wall cells
 C_START      = ( 30, 220,  80)
 C_TARGET     = (255,  60, 100)
 C_FRONTIER   = ( 30,  90, 220)   # forward frontier (all algos except bidir)
-C_FRONTIER2  = ( 60, 140, 255)   # backward frontier (bidirectional only)
+C_FRONTIER2  = ( 60, 140, 255)   # backward frontier (bidirectional searches only)
 C_EXPLORED   = ( 18,  48, 110)
 C_PATH       = (255, 195,  35)
+C_DYNAMIC    = (255, 130,  40)   # runtime obstacle dropped with D
 
 #  ALGORITHM REGISTRY  —  (button label, full name, generator function)
 #  Add a new entry here to expose a new algorithm in the sidebar.
 ALGO_LIST = [
-    ("BFS",   "Breadth-First Search",    bfs),
-    ("DFS",   "Depth-First Search",      dfs),
-    ("UCS",   "Uniform-Cost Search",     ucs),
-    ("DLS",   "Depth-Limited Search",    dls),
-    ("IDDFS", "Iterative Deepening DFS", iddfs),
-    ("BIDIR", "Bidirectional Search",    bidirectional),
+    ("BFS",    "Breadth-First Search",    bfs),
+    ("DFS",    "Depth-First Search",      dfs),
+    ("UCS",    "Uniform-Cost Search",     ucs),
+    ("DLS",    "Depth-Limited Search",    dls),
+    ("IDDFS",  "Iterative Deepening DFS", iddfs),
+    ("BIDIR",  "Bidirectional Search",    bidirectional),
+    ("BI-DIJ", "Bidirectional Dijkstra",  bidirectional_dijkstra),
+    ("WAVE",   "Wavefront BFS (NumPy)",   wavefront_bfs),
+    ("A*",     "A* Search",               astar),
+    ("WA*",    "Weighted A* (w = 2)",     weighted_astar),
+    ("JPS",    "Jump Point Search",       jps),
 ]
 
+# Sections below the algorithm list were laid out for six buttons; every
+# extra algorithm pushes them down by one button row.
+ALGO_SHIFT = max(0, len(ALGO_LIST) - 6) * (SEC_ALGO_BTN_H + SEC_ALGO_BTN_GAP)
+
+# State codes written to / looked up in Grid.states
+S_EMPTY      = STATE_CODE["empty"]
+S_WALL       = STATE_CODE["wall"]
+S_FRONTIER   = STATE_CODE["frontier"]
+S_FRONTIER2  = STATE_CODE["frontier2"]
+S_EXPLORED   = STATE_CODE["explored"]
+S_PATH       = STATE_CODE["path"]
+S_UNPAINTED  = 255          # never a real state code — forces a repaint
+
+PULSE_PHASES = 32           # precomputed colour steps per frontier pulse cycle
+PULSE_RATE   = 2.5          # pulse cycles per second
+
 #  DRAWING HELPERS
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -232,6 +267,73 @@ class Slider:
         if event.type == pygame.MOUSEMOTION and self._drag:
             self.norm = (event.pos[0] - tr.x) / tr.width
 
+#  SEARCH WORKER
+class SearchWorker:
+    """
+    Runs a search generator on a daemon thread and hands its snapshots to
+    the UI through a bounded queue. When the queue is full the search waits,
+    so it never runs more than WORKER_QUEUE steps ahead of the screen.
+    """
+
+    _END = object()     # queued after the last snapshot
+
+    def __init__(self, gen, maxsize=WORKER_QUEUE):
+        self.queue    = queue.Queue(maxsize)
+        self.finished = False       # True once the end marker has been taken
+        self.error    = None        # exception raised inside the generator
+        self._stop    = threading.Event()
+        self._thread  = threading.Thread(target=self._run, args=(gen,), daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        """Blocking put that gives up as soon as cancel() is called."""
+        while not self._stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self, gen):
+        try:
+            for snap in gen:
+                if not self._put(snap):
+                    return
+        except Exception as exc:
+            self.error = exc
+        finally:
+            gen.close()
+            self._put(self._END)
+
+    def take(self, budget=0.0):
+        """
+        Non-blocking: return (snapshots, finished). Takes one snapshot, or
+        with budget > 0 everything queued until that many seconds are spent.
+        """
+        deadline = time.perf_counter() + budget
+        taken = []
+        while not self.finished:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._END:
+                self.finished = True
+                break
+            taken.append(item)
+            if time.perf_counter() >= deadline:
+                break
+        if self.finished and self.error:
+            raise self.error
+        return taken, self.finished
+
+    def cancel(self):
+        """Stop the search and wait until the thread no longer touches the grid."""
+        self._stop.set()
+        self._thread.join()
+
+
 #  MAIN APPLICATION
 class App:
 
@@ -252,16 +354,39 @@ class App:
 
         self.grid         = Grid(GRID_ROWS, GRID_COLS)
         self.algo_idx     = 0           # index into ALGO_LIST
-        self.generator    = None        # active algorithm generator; None when idle
+        self.worker       = None        # SearchWorker running the search; None when idle
         self.running      = False       # True while stepping through the algorithm
         self.done         = False       # True after the algorithm finishes
         self.steps        = 0           # frames stepped since last start
         self.path_len     = 0           # nodes in the final path (0 if not found)
         self.edit_mode    = None        # active tool: 'start' 'target' 'wall' 'erase'
         self.current_path = []          # last found path positions
+        self.search       = SearchState()   # state rebuilt from delta snapshots
+        self._path_set    = set()       # cells currently styled as path
+        self._planner     = None        # LPAStar repairing the found path after D
         self.scroll_y     = 0           # sidebar scroll offset (≤ 0)
+        self.turbo        = False       # True → apply every queued step each frame
+        self.recording    = False       # True → each search is also written to TRACE_PATH
+        self._replay      = None        # TraceReader being played back, if any
         self.status = "Select algorithm  →  draw map  →  press  ▶ START"
 
+        # Persistent grid surface: cells are painted once and only repainted
+        # when their state code differs from the one last painted
+        self._grid_surf = pygame.Surface((GRID_COLS*CELL_SIZE + 4, GRID_ROWS*CELL_SIZE + 4))
+        self._grid_surf.fill(C_BG)
+        # Dark background rect gives the grid a subtle inset border
+        rrect(self._grid_surf, C_EMPTY_DARK, self._grid_surf.get_rect(), 5)
+        self._painted = np.full((GRID_ROWS, GRID_COLS), S_UNPAINTED, dtype=np.uint8)
+
+        # Frontier pulse palette: (forward, backward) colour and ready-made cell
+        # tile for every phase, so a frontier cell costs a lookup, not lerp maths
+        self._pulse = [(lerp_color(C_FRONTIER, C_FRONTIER2, i / PULSE_PHASES),
+                        lerp_color(C_FRONTIER2, C_FRONTIER, i / PULSE_PHASES))
+                       for i in range(PULSE_PHASES)]
+        self._pulse_tiles = [(self._cell_tile(fwd), self._cell_tile(bwd))
+                             for fwd, bwd in self._pulse]
+        self._phase = 0             # current pulse phase, set once per frame
+
         self._build_sidebar()
 
     #  BUILD SIDEBAR
@@ -285,7 +410,7 @@ class App:
             ("Erase Walls",      "erase",  C_ACCENT2),
         ]
         self.edit_btns = {}
-        y = SEC_EDIT_Y + 20
+        y = SEC_EDIT_Y + ALGO_SHIFT + 20
         for label, mode, col in edit_items:
             btn = Button(SX, y, SW, SEC_EDIT_BTN_H,
                          label, font=self.f_btn, accent=col)
@@ -294,24 +419,24 @@ class App:
 
         # Depth limit only affects DLS; ignored by all other algorithms
         self.dls_slider = Slider(
-            SX, SEC_DLS_Y + SEC_DLS_SLIDER_OFFSET, SW,
+            SX, SEC_DLS_Y + ALGO_SHIFT + SEC_DLS_SLIDER_OFFSET, SW,
             "DLS Depth Limit", 1, 50, 15, "{:.0f}", self.f_slider
         )
 
         # Seconds between algorithm steps — lower = faster animation
         self.speed_slider = Slider(
-            SX, SEC_SPEED_Y + SEC_SPEED_SLIDER_OFFSET, SW,
+            SX, SEC_SPEED_Y + ALGO_SHIFT + SEC_SPEED_SLIDER_OFFSET, SW,
             "Step Delay (s)", 0.001, 0.25, 0.04, "{:.3f}", self.f_slider
         )
 
         self.btn_start = Button(
-            SX, SEC_START_Y, SW, SEC_START_H,
+            SX, SEC_START_Y + ALGO_SHIFT, SW, SEC_START_H,
             "▶   START",
             bg=(10, 30, 16), accent=C_ACCENT3, font=self.f_btn
         )
 
         self.btn_reset = Button(
-            SX, SEC_RESET_Y, SW, SEC_RESET_H,
+            SX, SEC_RESET_Y + ALGO_SHIFT, SW, SEC_RESET_H,
             "⟳   RESET ALL",
             bg=(30, 10, 16), accent=C_ACCENT2, font=self.f_btn
         )
@@ -324,10 +449,11 @@ class App:
             (C_FRONTIER2, "Frontier  (backward)"),
             (C_EXPLORED,  "Explored"),
             (C_PATH,      "Final path"),
+            (C_DYNAMIC,   "Dynamic obstacle  (D)"),
         ]
 
         # Total virtual height of sidebar content — used to cap scroll range
-        self._SIDEBAR_H = (SEC_LEGEND_Y + 20
+        self._SIDEBAR_H = (SEC_LEGEND_Y + ALGO_SHIFT + 20
                            + len(self._legend) * SEC_LEGEND_ROW_H + 16)
 
     #  SCROLL
@@ -357,63 +483,173 @@ class App:
 
     #  SEARCH CONTROL
     def _start_search(self):
-        """Reset visual state and create a fresh generator for the selected algorithm."""
+        """Reset visual state and start the selected algorithm on a worker thread."""
+        self._cancel_search()
+        self._planner = None
+        self._replay  = None
         self.grid.reset_search()
         self.current_path = []
+        self.search = SearchState()
+        self._path_set = set()
         self.done = False; self.running = True
         short, full, fn = ALGO_LIST[self.algo_idx]
+        # Start and target in different components: skip the doomed search
+        if not self.grid.connected(self.grid.start_node.pos, self.grid.target_node.pos):
+            self._finish(False)
+            self.status = f"✗  {short}  —  No path: start and target are walled apart"
+            return
         lim = int(self.dls_slider.val)
         # DLS requires an explicit depth limit; all other algorithms ignore it
-        self.generator = fn(self.grid, lim) if short == "DLS" else fn(self.grid)
-        self.status = f"Running  {full} …"
+        gen = fn(self.grid, lim) if short == "DLS" else fn(self.grid)
+        if self.recording:
+            gen = record(gen, TRACE_PATH, self.grid, label=short)
+        self.worker = SearchWorker(gen)
+        self.status = f"Running  {full} …" + ("  (recording)" if self.recording else "")
+
+    def _cancel_search(self):
+        """Stop the worker (if any) before the grid is touched again."""
+        if self.worker:
+            self.worker.cancel()
+            self.worker = None
 
     def _reset(self):
         """Stop any running search and wipe the grid back to blank."""
-        self.generator = None
+        self._cancel_search()
+        self._planner = None
+        self._replay  = None
         self.running = self.done = False
         self.current_path = []
         self.steps = self.path_len = 0
         self.grid.full_reset()
         self.status = "Grid reset — draw a map and press  ▶ START"
 
-    def _step(self):
-        """Pull one frame from the generator and refresh cell visual states."""
-        if not self.generator: return
+    def _save_map(self, path=MAP_PATH):
+        """Write the current walls, weights and endpoints to a map file."""
         try:
-            snap = next(self.generator)
-        except StopIteration:
-            self._finish(False); return
-
-        self.steps += 1
-        self._apply_snapshot(snap)
-
-        if snap.get("done"):
-            if snap.get("found"):
-                self.current_path = snap.get("path", [])
-                self._finish(True, self.current_path)
-            else:
-                self._finish(False)
+            save_map(self.grid, path)
+        except OSError as e:
+            self.status = f"✗  Save failed: {e}"
             return
+        self.status = f"Map saved to {path}"
+
+    def _load_map(self, path=MAP_PATH):
+        """Replace the grid's map with a saved one of the same size."""
+        self._cancel_search()
+        self._planner = None
+        self._replay  = None
+        self.running = self.done = False
+        self.current_path = []
+        self.steps = self.path_len = 0
+        try:
+            load_map(path, self.grid)
+        except (OSError, ValueError) as e:
+            self.status = f"✗  Load failed: {e}"
+            return
+        self.status = f"Map loaded from {path} — press  ▶ START"
+
+    def _toggle_recording(self):
+        self.recording = not self.recording
+        self.status = (f"Recording on — every search is saved to {TRACE_PATH}"
+                       if self.recording else "Recording off")
+
+    def _start_replay(self, path=TRACE_PATH):
+        """Load a recorded trace (map included) and play it back like a live search."""
+        self._cancel_search()
+        self._planner = None
+        try:
+            trace = TraceReader(path)
+            trace.grid(self.grid)
+        except (OSError, ValueError) as e:
+            self._replay = None
+            self.running = self.done = False
+            self.status = f"✗  Replay failed: {e}"
+            return
+        self._replay = trace
+        for i, (short, _, _) in enumerate(ALGO_LIST):
+            if short == trace.label:
+                self.algo_idx = i
+            self.algo_btns[i].active = short == trace.label
+        self.search = SearchState()
+        self._path_set = set()
+        self._seek_replay(0)
+
+    def _seek_replay(self, n):
+        """Jump the replay to the state after step n and keep playing from there."""
+        trace = self._replay
+        if trace is None: return
+        n = max(0, min(n, len(trace)))
+        self._cancel_search()
+        self._apply_snapshot(trace.seek(n))
+        self.steps = n
+        self.current_path = []; self.path_len = 0
+        if n == len(trace):
+            self._finish(self.search.found, self.search.path)
+            return
+        self.done = False; self.running = True
+        self.worker = SearchWorker(trace.frames(n))
+        self.status = f"Replaying  {trace.label or 'trace'}  from step {n} / {len(trace)}"
+
+    def _step(self, budget=0.0):
+        """
+        Take frames from the search worker and refresh cell visual states.
+        With budget > 0 take everything queued (up to that many seconds'
+        worth) and apply it as one merged delta, so a UI that fell behind
+        catches up in a single frame.
+        """
+        if not self.worker: return
+        pulled, exhausted = self.worker.take(budget)
+
+        self.steps += len(pulled)
+        if pulled:
+            snap = pulled[0] if len(pulled) == 1 else merge_snapshots(pulled)
+            self._apply_snapshot(snap)
+            if snap.get("done"):
+                if snap.get("found"):
+                    self.current_path = snap.get("path", [])
+                    self._finish(True, self.current_path)
+                else:
+                    self._finish(False)
+                return
+        if exhausted:
+            self._finish(False)
 
     def _apply_snapshot(self, snap):
-        """Map the algorithm snapshot to per-cell visual states for rendering."""
-        fwd  = snap.get("frontier_fwd") or snap.get("frontier", frozenset())
-        bwd  = snap.get("frontier_bwd", frozenset())    # non-empty for bidirectional only
-        expl = snap.get("explored", frozenset())
-        path = snap.get("path")
-        for nd in self.grid.all_nodes():
-            p = nd.pos
-            if nd is self.grid.start_node or nd is self.grid.target_node: continue
-            if   nd.is_wall:          nd.state = "wall"
-            elif path and p in path:  nd.state = "path"
-            elif p in expl:           nd.state = "explored"
-            elif p in bwd:            nd.state = "frontier2"
-            elif p in fwd:            nd.state = "frontier"
-            else:                     nd.state = "empty"
+        """
+        Fold a delta snapshot into the search state and restyle only the cells
+        it touched — cost is proportional to the change, not the grid size.
+        """
+        search = self.search
+        # A reset wipes the old state, so everything it covered needs restyling
+        touched = (search.explored | search.frontier | search.frontier2
+                   if snap.get("reset") else set())
+        for key in ("explored_add", "explored_remove", "frontier_add",
+                    "frontier_remove", "frontier2_add", "frontier2_remove"):
+            cells = snap.get(key)
+            if cells:
+                touched.update(cells)
+        search.apply(snap)
+
+        path_set = set(search.path) if search.path else set()
+        if path_set or self._path_set:
+            touched |= path_set ^ self._path_set
+        self._path_set = path_set
+
+        fwd, bwd, expl = search.frontier, search.frontier2, search.explored
+        walls, states  = self.grid.walls, self.grid.states
+        endpoints = (self.grid.start_node.pos, self.grid.target_node.pos)
+        for p in touched:
+            if p in endpoints: continue
+            if   walls[p]:         states[p] = S_WALL
+            elif p in path_set:    states[p] = S_PATH
+            elif p in expl:        states[p] = S_EXPLORED
+            elif p in bwd:         states[p] = S_FRONTIER2
+            elif p in fwd:         states[p] = S_FRONTIER
+            else:                  states[p] = S_EMPTY
 
     def _finish(self, found, path=None):
         """Mark search complete and write the result summary to the status bar."""
-        self.running = False; self.done = True; self.generator = None
+        self.running = False; self.done = True
+        self._cancel_search()
         short = ALGO_LIST[self.algo_idx][0]
         if found and path:
             self.path_len = len(path); self.current_path = path
@@ -421,6 +657,33 @@ class App:
         else:
             self.status = f"✗  {short}  —  No path found!   Steps: {self.steps}"
 
+    def _drop_obstacle(self):
+        """Block a random cell of the found path and repair the route with LPA*."""
+        inner = self.current_path[1:-1]
+        if not inner: return
+        self._replay = None     # the map no longer matches the trace: stop seeking
+        if self._planner is None:
+            # Plan once on the unchanged map so later repairs are incremental
+            self._planner = LPAStar(self.grid)
+            self._planner.replan()
+        r, c = random.choice(inner)
+        self.grid.node(r, c).mark_dynamic()
+        result = self._planner.replan(compare=True)
+
+        # The old route fades to explored; the repaired one is drawn as path
+        states = self.grid.states
+        for p in inner:
+            if states[p] == S_PATH: states[p] = S_EXPLORED
+        self.current_path = result["path"]
+        for p in self.current_path[1:-1]:
+            states[p] = S_PATH
+        self.path_len = len(self.current_path)
+        cmp = f"repair: {result['expanded']}  vs  full A*: {result['full_expanded']} nodes"
+        if self.current_path:
+            self.status = f"✓  LPA* replan  |  {cmp}  |  Path: {self.path_len}"
+        else:
+            self.status = f"✗  LPA* replan  —  No path left!   {cmp}"
+
     #  DRAWING
     def _draw_top_bar(self):
         pygame.draw.rect(self.screen, C_PANEL, pygame.Rect(0, 0, SCREEN_W, TOP_BAR_H))
@@ -436,7 +699,8 @@ class App:
         put_text(self.screen, self.status, self.f_status, col,
                  TOPBAR_STATUS_X, TOPBAR_STATUS_Y)
 
-        put_text(self.screen, f"Steps: {self.steps}    Path: {self.path_len}",
+        turbo = "    TURBO" if self.turbo else ""
+        put_text(self.screen, f"Steps: {self.steps}    Path: {self.path_len}{turbo}",
                  self.f_small, C_TEXT_DIM,
                  TOPBAR_STATS_X, TOPBAR_STATS_Y, anchor="right")
 
@@ -456,7 +720,7 @@ class App:
             btn.active = (i == self.algo_idx)
             btn.draw(self.screen, B(SEC_ALGO_Y))
 
-        section_header(self.screen, self.f_section, "EDIT MODE", SX, B(SEC_EDIT_Y))
+        section_header(self.screen, self.f_section, "EDIT MODE", SX, B(SEC_EDIT_Y + ALGO_SHIFT))
         for mode, btn in self.edit_btns.items():
             btn.active = (self.edit_mode == mode)
             btn.draw(self.screen, B(SEC_EDIT_Y - 290))
@@ -467,8 +731,8 @@ class App:
         self.btn_start.draw(self.screen, B(SEC_START_Y - 1080))
         self.btn_reset.draw(self.screen, B(SEC_RESET_Y - 1140))
 
-        section_header(self.screen, self.f_section, "COLOUR LEGEND", SX, B(SEC_LEGEND_Y))
-        ly = B(SEC_LEGEND_Y + 20)
+        section_header(self.screen, self.f_section, "COLOUR LEGEND", SX, B(SEC_LEGEND_Y + ALGO_SHIFT))
+        ly = B(SEC_LEGEND_Y + ALGO_SHIFT + 20)
         for color, lbl in self._legend:
             pygame.draw.rect(self.screen, color,
                              pygame.Rect(SX, ly + 3, 18, 16), border_radius=3)
@@ -488,38 +752,62 @@ class App:
                              pygame.Rect(SIDEBAR_W - 5, bar_y, 4, bar_h), border_radius=2)
 
     def _draw_grid(self):
+        """
+        Repaint only the cells whose state changed since the last frame onto
+        the persistent grid surface, blit it, then draw the pulsing frontier
+        cells on top — they are the only ones that change every frame.
+        """
+        self._phase = int((time.time() * PULSE_RATE) % 1.0 * PULSE_PHASES)
+        states = self.grid.states
+        rows, cols = np.nonzero(states != self._painted)
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            rect = pygame.Rect(2 + c*CELL_SIZE, 2 + r*CELL_SIZE, CELL_SIZE - 1, CELL_SIZE - 1)
+            self._grid_surf.fill(C_EMPTY_DARK, rect)     # clear the rounded corners
+            self._draw_cell(self.grid.node(r, c), rect, self._grid_surf)
+        self._painted[:] = states
+
         ox, oy = self._grid_origin()
-        # Dark background rect gives the grid a subtle inset border
-        pygame.draw.rect(self.screen, C_EMPTY_DARK,
-                         pygame.Rect(ox-2, oy-2,
-                                     GRID_COLS*CELL_SIZE+4,
-                                     GRID_ROWS*CELL_SIZE+4), border_radius=5)
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                self._draw_cell(self.grid.node(r, c), self._cell_rect(r, c))
-
-    def _draw_cell(self, nd, rect):
+        self.screen.blit(self._grid_surf, (ox - 2, oy - 2))
+
+        # One batched blit per frontier colour; the tiles carry the dark
+        # rounded corners, so they cover the cell exactly like draw.rect did
+        for code, tile in zip((S_FRONTIER, S_FRONTIER2), self._pulse_tiles[self._phase]):
+            rows, cols = np.nonzero(states == code)
+            if rows.size:
+                self.screen.blits([(tile, (ox + c*CELL_SIZE, oy + r*CELL_SIZE))
+                                   for r, c in zip(rows.tolist(), cols.tolist())],
+                                  doreturn=False)
+
+    def _cell_tile(self, color):
+        """Opaque cell-sized tile: rounded cell in *color* on the grid background."""
+        tile = pygame.Surface((CELL_SIZE - 1, CELL_SIZE - 1))
+        tile.fill(C_EMPTY_DARK)
+        pygame.draw.rect(tile, color, tile.get_rect(), border_radius=3)
+        return tile
+
+    def _draw_cell(self, nd, rect, surf=None):
         """Colour each cell by its current state; frontier cells pulse over time."""
+        surf  = self.screen if surf is None else surf
         state = nd.state
-        t = (time.time() * 2.5) % 1.0   # 0→1 cycle used for frontier pulse animation
         if   state == "wall":      color = C_WALL
         elif state == "start":     color = C_START
         elif state == "target":    color = C_TARGET
-        elif state == "frontier":  color = lerp_color(C_FRONTIER, C_FRONTIER2, t)
-        elif state == "frontier2": color = lerp_color(C_FRONTIER2, C_FRONTIER, t)
+        elif state == "frontier":  color = self._pulse[self._phase][0]
+        elif state == "frontier2": color = self._pulse[self._phase][1]
         elif state == "explored":  color = C_EXPLORED
         elif state == "path":      color = C_PATH
+        elif state == "dynamic":   color = C_DYNAMIC
         else:                      color = C_EMPTY
 
-        pygame.draw.rect(self.screen, color, rect, border_radius=3)
+        pygame.draw.rect(surf, color, rect, border_radius=3)
         if state == "wall":
             # Subtle glow border distinguishes walls from the dark background
-            pygame.draw.rect(self.screen, C_WALL_GLOW, rect, 1, border_radius=3)
+            pygame.draw.rect(surf, C_WALL_GLOW, rect, 1, border_radius=3)
 
         if state in ("start", "target"):
             img = self.f_cell.render("S" if state == "start" else "T", True, C_BG)
-            self.screen.blit(img, (rect.centerx - img.get_width()//2,
-                                   rect.centery - img.get_height()//2))
+            surf.blit(img, (rect.centerx - img.get_width()//2,
+                            rect.centery - img.get_height()//2))
 
     #  EVENTS
     def _handle_events(self):
@@ -535,6 +823,18 @@ class App:
                 if k == pygame.K_ESCAPE: self.edit_mode = None
                 if k == pygame.K_SPACE and not self.running: self._start_search()
                 if k == pygame.K_r:      self._reset()
+                if k == pygame.K_f:      self.turbo = not self.turbo
+                if k == pygame.K_d and self.done: self._drop_obstacle()
+                if event.mod & pygame.KMOD_CTRL and not self.running:
+                    if k == pygame.K_s: self._save_map()
+                    if k == pygame.K_o: self._load_map()
+                    if k == pygame.K_t: self._toggle_recording()
+                if event.mod & pygame.KMOD_CTRL and k == pygame.K_p: self._start_replay()
+                if self._replay:
+                    if k == pygame.K_LEFT:  self._seek_replay(self.steps - SEEK_STEPS)
+                    if k == pygame.K_RIGHT: self._seek_replay(self.steps + SEEK_STEPS)
+                    if k == pygame.K_HOME:  self._seek_replay(0)
+                    if k == pygame.K_END:   self._seek_replay(len(self._replay))
                 if k == pygame.K_UP:
                     self.scroll_y = min(0, self.scroll_y + SCROLL_STEP)
                 if k == pygame.K_DOWN:
@@ -575,6 +875,9 @@ class App:
         cell = self._pixel_to_cell(*event.pos)
         if cell is None: return
         r, c = cell
+        if self.edit_mode and (event.type == pygame.MOUSEMOTION or
+                               event.type == pygame.MOUSEBUTTONDOWN and event.button == 1):
+            self._replay = None     # the map no longer matches the trace: stop seeking
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if   self.edit_mode == "start":  self.grid.set_start(r,c);  self.edit_mode = None
             elif self.edit_mode == "target": self.grid.set_target(r,c); self.edit_mode = None
@@ -591,8 +894,11 @@ class App:
         while True:
             self._handle_events()
             now = time.time()
-            # Advance one algorithm step when the chosen delay has elapsed
-            if self.running and (now - last_step) >= self.speed_slider.val:
+            # Turbo: spend a fixed slice of every frame on the search.
+            # Otherwise advance one step when the chosen delay has elapsed.
+            if self.running and self.turbo:
+                self._step(TURBO_BUDGET)
+            elif self.running and (now - last_step) >= self.speed_slider.val:
                 self._step(); last_step = now
             self.screen.fill(C_BG)
             self._draw_grid()
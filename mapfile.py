@@ -0,0 +1,189 @@
+"""
+mapfile.py
+Versioned binary map files: dimensions, walls, weights and endpoints.
+
+    save_map(grid, "maps/cave.ogph")
+    grid = load_map("maps/cave.ogph")         # new Grid, weights memory-mapped
+    load_map("maps/cave.ogph", grid)          # into an existing Grid of the same size
+
+Layout (little-endian):
+
+    header   32 bytes   magic b"OGPH", uint16 version,
+                        uint8 lowest / highest weight,
+                        uint32 rows, uint32 cols,
+                        int32 start row/col, int32 target row/col  (-1 = none)
+    walls    ⌈rows·cols / 8⌉ bytes, row-major, np.packbits order
+    weights  rows·cols bytes, uint8 1–10, row-major
+
+The weight block sits at a fixed offset, so load_map() maps it straight
+from the file with copy-on-write (np.memmap mode "c"). The OS pages it in
+as the grid touches it, and edits never reach the file. The header
+records the weight range, so loading checks that instead of reading the
+block; pass validate=True to scan the weights as well. Walls are one bit
+per cell and are the only block unpacked up front. Dynamic obstacles and
+search state are not saved.
+"""
+
+import struct
+
+import numpy as np
+
+from grid import Grid
+
+MAGIC          = b"OGPH"
+FORMAT_VERSION = 2
+DEFAULT_PATH   = "map.ogph"
+
+_HEADER = struct.Struct("<4sHBBIIiiii")
+assert _HEADER.size == 32
+
+
+def _packed_size(rows: int, cols: int) -> int:
+    return (rows * cols + 7) // 8
+
+
+def map_bytes(grid: Grid) -> bytes:
+    """The map file contents for grid, as save_map() would write them."""
+    start  = grid.start_node.pos  if grid.start_node  else (-1, -1)
+    target = grid.target_node.pos if grid.target_node else (-1, -1)
+    lo, hi = int(grid.weights.min()), int(grid.weights.max())
+    return b"".join([
+        _HEADER.pack(MAGIC, FORMAT_VERSION, lo, hi, grid.rows, grid.cols, *start, *target),
+        np.packbits(grid.walls, axis=None).tobytes(),
+        np.ascontiguousarray(grid.weights, dtype=np.uint8).tobytes(),
+    ])
+
+
+def save_map(grid: Grid, path: str):
+    """
+    Write grid's walls, weights and endpoints to path.
+
+    Parameters
+    ----------
+    grid : Grid   Grid to save. Dynamic obstacles are left out.
+    path : str    Destination file; overwritten if it exists.
+    """
+    with open(path, "wb") as f:
+        f.write(map_bytes(grid))
+
+
+def _parse_header(raw: bytes, size: int, name: str) -> dict:
+    if len(raw) < _HEADER.size:
+        raise ValueError(f"{name}: too short for a map header")
+
+    magic, version, lo, hi, rows, cols, sr, sc, tr, tc = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{name}: not a map file (magic {magic!r})")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{name}: unsupported map format version {version}")
+    if not rows or not cols:
+        raise ValueError(f"{name}: empty {rows}×{cols} map")
+    expected = _HEADER.size + _packed_size(rows, cols) + rows * cols
+    if size != expected:
+        raise ValueError(f"{name}: {size} bytes, expected {expected} for {rows}×{cols}")
+    if not 1 <= lo <= hi <= 10:
+        raise ValueError(f"{name}: weight range {lo}–{hi} outside 1–10")
+
+    def endpoint(r, c):
+        if r < 0 or c < 0:
+            return None
+        if r >= rows or c >= cols:
+            raise ValueError(f"{name}: endpoint {(r, c)} outside {rows}×{cols}")
+        return r, c
+
+    return {"version": version, "rows": rows, "cols": cols, "weights": (lo, hi),
+            "start": endpoint(sr, sc), "target": endpoint(tr, tc)}
+
+
+def read_header(path: str) -> dict:
+    """
+    Parse and check the header of a map file without loading the arrays.
+
+    Returns
+    -------
+    dict  {"version", "rows", "cols", "weights", "start", "target"};
+          weights is the (lowest, highest) weight, endpoints are
+          (row, col) tuples or None.
+
+    Raises
+    ------
+    ValueError  Not a map file, an unknown version, a truncated file or a
+                weight range outside 1–10.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(_HEADER.size)
+        f.seek(0, 2)
+        size = f.tell()
+    return _parse_header(raw, size, path)
+
+
+def _build(info: dict, walls: np.ndarray, weights: np.ndarray, grid: Grid | None,
+           name: str, validate: bool) -> Grid:
+    """Turn the decoded arrays into (or load them into) a Grid."""
+    rows, cols = info["rows"], info["cols"]
+    if grid is not None and (grid.rows, grid.cols) != (rows, cols):
+        raise ValueError(f"{name}: map is {rows}×{cols}, grid is {grid.rows}×{grid.cols}")
+    # The header's range was checked already; this reads the whole block
+    if validate and (int(weights.min()), int(weights.max())) != info["weights"]:
+        raise ValueError(f"{name}: weights do not match the header's range "
+                         f"{info['weights'][0]}–{info['weights'][1]}")
+
+    if grid is None:
+        return Grid.from_arrays(walls, weights, info["start"], info["target"])
+
+    # Endpoints first, so load_layout() keeps their cells open
+    if info["start"]:
+        grid.set_start(*info["start"])
+    if info["target"]:
+        grid.set_target(*info["target"])
+    grid.load_layout(walls, weights)
+    return grid
+
+
+def _unpack_walls(packed: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    return np.unpackbits(packed, count=rows * cols).view(bool).reshape(rows, cols)
+
+
+def load_map(path: str, grid: Grid | None = None, validate: bool = False) -> Grid:
+    """
+    Load a map file.
+
+    Parameters
+    ----------
+    path     : str          File written by save_map().
+    grid     : Grid | None  Load into this grid (same dimensions required) via
+                            Grid.load_layout(); by default a new Grid is built
+                            around the memory-mapped weights instead.
+    validate : bool         Also scan the weight block against the header's
+                            range. This pages in the whole block.
+
+    Returns
+    -------
+    Grid  The loaded grid (grid itself when one was passed).
+
+    Raises
+    ------
+    ValueError  Bad header, size mismatch with grid, or (validate) weights
+                that disagree with the header.
+    """
+    info       = read_header(path)
+    rows, cols = info["rows"], info["cols"]
+    if grid is not None and (grid.rows, grid.cols) != (rows, cols):
+        raise ValueError(f"{path}: map is {rows}×{cols}, grid is {grid.rows}×{grid.cols}")
+
+    packed  = np.fromfile(path, dtype=np.uint8, count=_packed_size(rows, cols),
+                          offset=_HEADER.size)
+    weights = np.memmap(path, dtype=np.uint8, mode="c",
+                        offset=_HEADER.size + len(packed), shape=(rows, cols))
+    return _build(info, _unpack_walls(packed, rows, cols), weights, grid, path, validate)
+
+
+def map_from_bytes(data: bytes, grid: Grid | None = None, validate: bool = False) -> Grid:
+    """load_map() for map contents already in memory, e.g. embedded in a trace."""
+    info       = _parse_header(data, len(data), "map data")
+    rows, cols = info["rows"], info["cols"]
+    n_packed   = _packed_size(rows, cols)
+    packed     = np.frombuffer(data, dtype=np.uint8, count=n_packed, offset=_HEADER.size)
+    weights    = np.frombuffer(data, dtype=np.uint8, offset=_HEADER.size + n_packed)
+    return _build(info, _unpack_walls(packed, rows, cols),
+                  weights.reshape(rows, cols).copy(), grid, "map data", validate)
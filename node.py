@@ -1,17 +1,26 @@
+# Visual states in code order; Grid.states stores the index into this tuple
+STATES = ("empty", "wall", "start", "target",
+          "frontier", "frontier2", "explored", "path", "dynamic")
+STATE_CODE = {name: code for code, name in enumerate(STATES)}
+
+
 class Node:
-    """Single cell in the pathfinding grid."""
+    """
+    Single cell in the pathfinding grid.
+
+    A Node is a lightweight view: it only stores its coordinates and reads /
+    writes the owning Grid's NumPy arrays, so creating one is cheap and two
+    views of the same cell always agree.
+    """
 
     # state can be: 'empty', 'wall', 'start', 'target',
     #               'frontier', 'frontier2', 'explored', 'path', 'dynamic'
-    __slots__ = ("row", "col", "weight", "is_wall", "is_dynamic", "state")
+    __slots__ = ("_grid", "row", "col")
 
-    def __init__(self, row: int, col: int, weight: int = 1):
-        self.row        = row
-        self.col        = col
-        self.weight     = weight    # 1 = free, 2–10 = increasing traversal cost
-        self.is_wall    = False
-        self.is_dynamic = False
-        self.state      = "empty"
+    def __init__(self, grid, row: int, col: int):
+        self._grid = grid
+        self.row   = row
+        self.col   = col
 
     # These let Node sit inside a heapq without Python trying to compare objects directly
     def __lt__(self, other: "Node") -> bool:
@@ -28,6 +37,44 @@ class Node:
     def __repr__(self) -> str:
         return f"Node({self.row},{self.col}, w={self.weight}, {self.state})"
 
+    # ── Array-backed attributes
+
+    @property
+    def weight(self) -> int:
+        # 1 = free, 2–10 = increasing traversal cost
+        return int(self._grid.weights[self.row, self.col])
+
+    @weight.setter
+    def weight(self, w: int):
+        if self._grid.weights[self.row, self.col] != w:
+            self._grid._changed()
+            self._grid.weights[self.row, self.col] = w
+
+    @property
+    def is_wall(self) -> bool:
+        return bool(self._grid.walls[self.row, self.col])
+
+    @is_wall.setter
+    def is_wall(self, flag: bool):
+        # Routed through the grid so its adjacency index stays in sync
+        self._grid._set_blocking(self._grid.walls, self.row, self.col, flag)
+
+    @property
+    def is_dynamic(self) -> bool:
+        return bool(self._grid.dynamic[self.row, self.col])
+
+    @is_dynamic.setter
+    def is_dynamic(self, flag: bool):
+        self._grid._set_blocking(self._grid.dynamic, self.row, self.col, flag)
+
+    @property
+    def state(self) -> str:
+        return STATES[self._grid.states[self.row, self.col]]
+
+    @state.setter
+    def state(self, name: str):
+        self._grid.states[self.row, self.col] = STATE_CODE[name]
+
     @property
     def pos(self) -> tuple:
         # (row, col) used as dict/set keys throughout the algorithms
@@ -63,4 +110,4 @@ class Node:
 
     def mark_path(self):
         if self.state not in ("start", "target", "wall", "dynamic"):
-            self.state = "path"
\ No newline at end of file
+            self.state = "path"